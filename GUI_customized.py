@@ -1,21 +1,22 @@
+from startup import StartupTimer, cached_logo
+startup = StartupTimer("GUI_customized")
+
 import sys
-import pandas as pd
-import pyqtgraph as pg
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
     QGroupBox, QHBoxLayout, QLabel, QPushButton, QComboBox, QLineEdit, 
     QGridLayout)
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
 import os
 from datetime import datetime
+startup.mark("imports")
 
 class CanSatGroundControl(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Initialize data
-        self.load_data()
-        
+        # Data and plots are loaded after the window is first painted
+        self.df = None
         self.initUI()
         
         # Update timer
@@ -26,6 +27,7 @@ class CanSatGroundControl(QMainWindow):
 
     def load_data(self):
         """Loads data from the CSV file or initializes an empty DataFrame."""
+        import pandas as pd
         if os.path.exists('sensor_data.csv') and os.path.getsize('sensor_data.csv') > 0:
             self.df = pd.read_csv('sensor_data.csv')
         else:
@@ -48,9 +50,9 @@ class CanSatGroundControl(QMainWindow):
         # Logo
         logo_label = QLabel()
         logo_path = "logo.png"  # Replace with your logo path
-        if os.path.exists(logo_path):
-            logo_pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(logo_pixmap.scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_pixmap = cached_logo(logo_path, 50)
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         logo_label.setFixedSize(50, 50)
         logo_label.setStyleSheet("border: 1px solid #ccc;")
         
@@ -121,31 +123,9 @@ class CanSatGroundControl(QMainWindow):
         # Right panel - Graphs
         graphs_layout = QGridLayout()
         
-        # Create graphs with titles
-        graphs = [
-            ("Pressure", "Pa"),
-            ("Altitude", "m"),
-            ("Tilt X", "deg"),
-            ("Temperature", "°C"),
-            ("Air speed", "m/s"),
-            ("Tilt Y", "deg")
-        ]
+        # Graphs are built by build_graphs() once the window is on screen
+        self.graphs_layout = graphs_layout
         
-        for i, (title, unit) in enumerate(graphs):
-            plot = pg.PlotWidget(title=f"{title} ({unit}) vs Time")
-            plot.setBackground('w')
-            plot.showGrid(x=True, y=True)
-            plot.setLabel('left', f'{title} ({unit})')
-            plot.setLabel('bottom', 'Time (s)')
-            plot.setTitle(f"{title} ({unit})", size="12pt")
-            
-            # Store plot reference
-            setattr(self, f'{title.lower().replace(" ", "_")}_plot', plot)
-            setattr(self, f'{title.lower().replace(" ", "_")}_curve', 
-                   plot.plot(pen=pg.mkPen(color='b', width=2)))
-            
-            graphs_layout.addWidget(plot, i//3, i%3)
-            
         content_layout.addLayout(graphs_layout)
         
         # Set content layout stretch
@@ -175,6 +155,42 @@ class CanSatGroundControl(QMainWindow):
         # Connect the refresh button
         refresh_btn.clicked.connect(self.refresh_application)
 
+    def finish_startup(self):
+        """Heavy setup deferred until after the first paint."""
+        self.build_graphs()
+        self.load_data()
+        startup.mark("plots ready")
+        startup.report()
+
+    def build_graphs(self):
+        import pyqtgraph as pg
+        graphs_layout = self.graphs_layout
+        
+        # Create graphs with titles
+        graphs = [
+            ("Pressure", "Pa"),
+            ("Altitude", "m"),
+            ("Tilt X", "deg"),
+            ("Temperature", "°C"),
+            ("Air speed", "m/s"),
+            ("Tilt Y", "deg")
+        ]
+        
+        for i, (title, unit) in enumerate(graphs):
+            plot = pg.PlotWidget(title=f"{title} ({unit}) vs Time")
+            plot.setBackground('w')
+            plot.showGrid(x=True, y=True)
+            plot.setLabel('left', f'{title} ({unit})')
+            plot.setLabel('bottom', 'Time (s)')
+            plot.setTitle(f"{title} ({unit})", size="12pt")
+            
+            # Store plot reference
+            setattr(self, f'{title.lower().replace(" ", "_")}_plot', plot)
+            setattr(self, f'{title.lower().replace(" ", "_")}_curve', 
+                   plot.plot(pen=pg.mkPen(color='b', width=2)))
+            
+            graphs_layout.addWidget(plot, i//3, i%3)
+
     def refresh_application(self):
         """Resets the application state and starts graph plotting from the beginning."""
         self.load_data()
@@ -203,6 +219,8 @@ class CanSatGroundControl(QMainWindow):
         current_time = datetime.now().strftime("%H:%M:%S")
         self.mission_time_label.setText(current_time)
         
+        if self.df is None:
+            return
         if self.index < len(self.df):
             # Update graphs
             for title, _ in [
@@ -234,5 +252,7 @@ if __name__ == '__main__':
     app.setStyle('Fusion')
     
     main_window = CanSatGroundControl()
+    startup.mark("window built")
+    startup.watch_first_paint(main_window, main_window.finish_startup)
     main_window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -1,23 +1,21 @@
+from startup import StartupTimer, cached_logo
+startup = StartupTimer("gui")
+
 import sys
-import pandas as pd
-import pyqtgraph as pg
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
     QGroupBox, QHBoxLayout, QLabel, QPushButton, QComboBox, QLineEdit, 
     QGridLayout, QFrame)
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
 import os
+startup.mark("imports")
 
 class CanSatGroundControl(QMainWindow):
     def __init__(self):
         super().__init__()
         
-        # Initialize data
-        if os.path.exists('sensor_data.csv') and os.path.getsize('sensor_data.csv') > 0:
-            self.df = pd.read_csv('sensor_data.csv')
-        else:
-            self.df = pd.DataFrame()
-            
+        # Data and plots are loaded after the window is first painted
+        self.df = None
         self.initUI()
         
         # Update timer
@@ -43,9 +41,9 @@ class CanSatGroundControl(QMainWindow):
         # Logo with empty image path
         logo_label = QLabel()
         logo_path = "logo.png"  # Just replace this path with your logo path
-        if os.path.exists(logo_path):
-            logo_pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(logo_pixmap.scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_pixmap = cached_logo(logo_path, 50)
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         logo_label.setFixedSize(50, 50)
         logo_label.setStyleSheet("border: 1px solid #ccc;")  # Light border to show logo area when empty
         
@@ -123,30 +121,9 @@ class CanSatGroundControl(QMainWindow):
         # Right panel - Graphs
         graphs_layout = QGridLayout()
         
-        # Create graphs
-        graphs = [
-            ("Pressure", "Pa"),
-            ("Altitude", "m"),
-            ("Tilt X", "deg"),
-            ("Temperature", "°C"),
-            ("Air speed", "m/s"),
-            ("Tilt Y", "deg")
-        ]
+        # Graphs are built by build_graphs() once the window is on screen
+        self.graphs_layout = graphs_layout
         
-        for i, (title, unit) in enumerate(graphs):
-            plot = pg.PlotWidget()
-            plot.setBackground('w')
-            plot.showGrid(x=True, y=True)
-            plot.setLabel('left', f'{title} ({unit})')
-            plot.setLabel('bottom', 'Packet')
-            
-            # Store plot reference
-            setattr(self, f'{title.lower().replace(" ", "_")}_plot', plot)
-            setattr(self, f'{title.lower().replace(" ", "_")}_curve', 
-                   plot.plot(pen=pg.mkPen(color='b', width=2)))
-            
-            graphs_layout.addWidget(plot, i//3, i%3)
-            
         content_layout.addLayout(graphs_layout)
         
         # Set content layout stretch
@@ -173,7 +150,51 @@ class CanSatGroundControl(QMainWindow):
         
         self.setCentralWidget(central_widget)
 
+    def finish_startup(self):
+        """Heavy setup deferred until after the first paint."""
+        self.build_graphs()
+        self.load_data()
+        startup.mark("plots ready")
+        startup.report()
+
+    def load_data(self):
+        import pandas as pd
+        if os.path.exists('sensor_data.csv') and os.path.getsize('sensor_data.csv') > 0:
+            self.df = pd.read_csv('sensor_data.csv')
+        else:
+            self.df = pd.DataFrame()
+
+    def build_graphs(self):
+        import pyqtgraph as pg
+        graphs_layout = self.graphs_layout
+        
+        # Create graphs
+        graphs = [
+            ("Pressure", "Pa"),
+            ("Altitude", "m"),
+            ("Tilt X", "deg"),
+            ("Temperature", "°C"),
+            ("Air speed", "m/s"),
+            ("Tilt Y", "deg")
+        ]
+        
+        for i, (title, unit) in enumerate(graphs):
+            plot = pg.PlotWidget()
+            plot.setBackground('w')
+            plot.showGrid(x=True, y=True)
+            plot.setLabel('left', f'{title} ({unit})')
+            plot.setLabel('bottom', 'Packet')
+            
+            # Store plot reference
+            setattr(self, f'{title.lower().replace(" ", "_")}_plot', plot)
+            setattr(self, f'{title.lower().replace(" ", "_")}_curve', 
+                   plot.plot(pen=pg.mkPen(color='b', width=2)))
+            
+            graphs_layout.addWidget(plot, i//3, i%3)
+
     def update_data(self):
+        if self.df is None:
+            return
         if self.index < len(self.df):
             # Update graphs
             for title, _ in [
@@ -205,5 +226,7 @@ if __name__ == '__main__':
     app.setStyle('Fusion')
     
     main_window = CanSatGroundControl()
+    startup.mark("window built")
+    startup.watch_first_paint(main_window, main_window.finish_startup)
     main_window.show()
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""Startup helpers shared by the GUIs: timing report, cached logo, deferred setup.
+
+Keep this module light; it is imported before anything heavy so that the
+import phase itself can be timed.
+"""
+import json
+import os
+import sys
+import time
+
+STARTUP_REPORT_ENV = "CANSAT_STARTUP_REPORT"  # file to append JSON timing lines to
+
+
+class StartupTimer:
+    """Records named phases since process start and reports time-to-first-window."""
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.perf_counter()
+        self.marks = []
+        self.reported = False
+
+    def mark(self, phase):
+        self.marks.append((phase, time.perf_counter() - self.start))
+
+    def elapsed(self, phase):
+        for name, seconds in self.marks:
+            if name == phase:
+                return seconds
+        return None
+
+    def watch_first_paint(self, window, then=None):
+        """Mark 'first paint' when `window` is first painted, then run `then`."""
+        from PyQt5.QtCore import QObject, QEvent, QTimer
+
+        timer = self
+
+        class FirstPaint(QObject):
+            def eventFilter(self, obj, event):
+                if event.type() == QEvent.Paint:
+                    obj.removeEventFilter(self)
+                    timer.mark("first paint")
+                    if then is not None:
+                        # Give the event loop a chance to put the frame on screen first
+                        QTimer.singleShot(0, then)
+                return False
+
+        self._first_paint = FirstPaint(window)
+        window.installEventFilter(self._first_paint)
+
+    def report(self):
+        if self.reported:
+            return
+        self.reported = True
+        phases = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in self.marks)
+        print(f"[{self.name}] startup: {phases}")
+        path = os.environ.get(STARTUP_REPORT_ENV)
+        if path:
+            with open(path, "a") as f:
+                f.write(json.dumps({"app": self.name, "time": time.time(),
+                                    "python": sys.version.split()[0],
+                                    "phases": dict(self.marks)}) + "\n")
+
+
+def cached_logo(path, size=50):
+    """QPixmap of `path` scaled to fit size x size, cached on disk as a thumbnail.
+
+    Decoding the full-size logo on every launch is slow; the thumbnail is
+    rebuilt only when the source image is newer than the cache.
+    """
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QPixmap
+
+    if not os.path.exists(path):
+        return None
+    directory, name = os.path.split(os.path.abspath(path))
+    cache_path = os.path.join(directory, ".cache", f"{os.path.splitext(name)[0]}_{size}.png")
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        pixmap = QPixmap(cache_path)
+        if not pixmap.isNull():
+            return pixmap
+    pixmap = QPixmap(path).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        pixmap.save(cache_path, "PNG")
+    except OSError as e:
+        print(f"Could not cache logo thumbnail: {e}")
+    return pixmap
@@ -0,0 +1,207 @@
+"""Telemetry line validation shared by the ground station versions.
+
+Only NumPy is needed to validate lines; each GUI passes in its own packet
+layout, so this module imports nothing from any of them.
+"""
+import collections
+import os
+import re
+import time
+
+import numpy as np
+
+QUARANTINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "quarantine.log")
+
+# Plausible range of each numeric field; a value outside it means a corrupted line
+RANGES = {
+    "TEAM_ID": (0, 9999),
+    "PACKET_COUNT": (0, 1e9),
+    "ALTITUDE": (-1000, 100000),
+    "AIR_SPEED": (-1000, 1000),
+    "TEMPERATURE": (-100, 150),
+    "VOLTAGE": (0, 30),
+    "PRESSURE": (0, 200),
+    "GPS_ALTITUDE": (-1000, 100000),
+    "GPS_LATITUDE": (-90, 90),
+    "GPS_LONGITUDE": (-180, 180),
+    "GPS_SATS": (0, 100),
+    "TILT_X": (-360, 360),
+    "TILT_Y": (-360, 360),
+    "ROT_Z": (-10000, 10000),
+    "GYRO_P": (-10000, 10000),
+    "GYRO_Y": (-10000, 10000),
+    "ACCEL_R": (-1000, 1000),
+    "ACCEL_P": (-1000, 1000),
+    "ACCEL_Y": (-1000, 1000),
+    "POINTING_ERROR": (-360, 360),
+}
+
+# Text fields with a fixed set of values
+CHOICES = {
+    "MODE": ("F", "S"),
+    "HS_DEPLOYED": ("N", "P", "Y"),
+    "PC_DEPLOYED": ("N", "C", "Y"),
+}
+
+
+def checksum(text):
+    """NMEA-style checksum: XOR of every byte, as two hex digits."""
+    return "%02X" % np.bitwise_xor.reduce(np.frombuffer(text.encode(), dtype=np.uint8), initial=0)
+
+
+CLOCK = re.compile(r"\s*\d+:\d+:\d+(\.\d*)?\s*")  # MISSION_TIME, "HH:MM:SS" or "HH:MM:SS.ss"
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def bad_clocks(values):
+    """Mask of the non-empty values that are not a mission clock, each distinct value checked once."""
+    unique, inverse = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    bad = np.array([value != "" and CLOCK.fullmatch(value) is None for value in unique], dtype=bool)
+    return bad[inverse].reshape(-1)
+
+
+def parse_numbers(values):
+    """Float array of a column of strings and the mask of fields that are not numbers.
+
+    Empty fields are NaN but not bad. float() over the tuple is several
+    times faster than numpy's string-to-float cast; a column with junk in
+    it is redone value by value.
+    """
+    try:
+        return np.fromiter(map(float, values), dtype=np.float64, count=len(values)), np.zeros(len(values), dtype=bool)
+    except ValueError:
+        numbers = np.fromiter(map(to_float, values), dtype=np.float64, count=len(values))
+        return numbers, np.isnan(numbers) & (np.asarray(values, dtype=str) != "")
+
+
+class PacketValidator:
+    """Validates telemetry lines in batches and quarantines the bad ones.
+
+    A batch is checked in one vectorized pass: optional "*HH" checksum,
+    field count, numeric fields parsed and range-checked, MISSION_TIME and
+    enumerated fields. Empty fields are accepted as missing values. Lines
+    that fail are appended with their reason to `quarantine_path` and kept
+    in `recent`; `accepted` and `rejected` (by reason) count every line.
+
+    `fields` is the packet layout in column order; fields in `text_fields`
+    are returned as object arrays, every other one as float64.
+    """
+
+    def __init__(self, fields, text_fields=(), quarantine_path=QUARANTINE_PATH, recent=1000):
+        self.fields = list(fields)
+        self.numeric_fields = {field for field in self.fields if field not in text_fields}
+        self.quarantine_path = quarantine_path
+        self.accepted = 0
+        self.rejected = collections.Counter()
+        self.recent = collections.deque(maxlen=recent)  # (time, reason, line)
+
+    def validate(self, lines):
+        """Dict of columns (numeric fields as float arrays) of the valid lines, in order."""
+        bodies, rejects = [], []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            star = line.rfind("*")
+            if star >= 0 and len(line) - star == 3:
+                if checksum(line[:star]) != line[star + 1:].upper():
+                    rejects.append((line, "checksum", f"checksum {line[star + 1:]}, expected {checksum(line[:star])}"))
+                    continue
+                line = line[:star]
+            bodies.append(line)
+
+        rows = [body.split(",") for body in bodies]
+        counts = np.fromiter(map(len, rows), dtype=np.int64, count=len(rows))
+        width = len(self.fields)
+        for i in np.flatnonzero(counts != width):
+            rejects.append((bodies[i], "field count", f"{counts[i]} fields, expected {width}"))
+        keep = np.flatnonzero(counts == width)
+        table = list(zip(*[rows[i] for i in keep])) or [()] * width  # one tuple per field
+
+        reasons = {}  # row -> (kind, detail) of its first failed check
+        columns = {}
+        for field, values in zip(self.fields, table):
+            if field in self.numeric_fields:
+                numbers, bad = parse_numbers(values)
+                self._flag(reasons, bad, f"{field} not a number", values)
+                low, high = RANGES.get(field, (-np.inf, np.inf))
+                with np.errstate(invalid="ignore"):
+                    self._flag(reasons, (numbers < low) | (numbers > high), f"{field} out of range", values)
+                columns[field] = numbers
+                continue
+            if field == "MISSION_TIME":
+                self._flag(reasons, bad_clocks(values), "MISSION_TIME malformed", values)
+            elif field in CHOICES:
+                allowed = CHOICES[field] + ("",)
+                self._flag(reasons, [value not in allowed for value in values],
+                           f"{field} unknown value", values)
+            columns[field] = np.array(values, dtype=object)
+
+        ok = np.ones(len(keep), dtype=bool)
+        for i, (kind, detail) in sorted(reasons.items()):
+            ok[i] = False
+            rejects.append((bodies[keep[i]], kind, detail))
+        self.accepted += int(ok.sum())
+        self.quarantine(rejects)
+        return {field: column[ok] for field, column in columns.items()}
+
+    @staticmethod
+    def _flag(reasons, bad, kind, values):
+        """Record `kind` for the rows in `bad` that have no earlier failure."""
+        bad = np.asarray(bad)
+        if not bad.any():
+            return
+        for i in np.flatnonzero(bad):
+            reasons.setdefault(i, (kind, f"{kind}: {values[i]!r}"))
+
+    def quarantine(self, rejects):
+        if not rejects:
+            return
+        now = time.time()
+        for line, kind, detail in rejects:
+            self.rejected[kind] += 1
+            self.recent.append((now, detail, line))
+        if self.quarantine_path is None:
+            return
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        try:
+            os.makedirs(os.path.dirname(self.quarantine_path), exist_ok=True)
+            with open(self.quarantine_path, "a") as f:
+                f.writelines(f"{stamp}\t{detail}\t{line}\n" for line, _, detail in rejects)
+        except OSError:
+            pass  # the counters and `recent` still have them
+
+    def summary(self):
+        total = sum(self.rejected.values())
+        return f"{self.accepted} packets accepted, {total} quarantined"
+
+    def details(self):
+        return "\n".join(f"{kind}: {count}" for kind, count in self.rejected.most_common()) or "No bad lines"
+
+    def reset(self):
+        self.accepted = 0
+        self.rejected.clear()
+        self.recent.clear()
+
+
+def read_validated_csv(path, validator, chunk=100000):
+    """DataFrame of the valid packets of a telemetry CSV; bad rows go to the quarantine."""
+    import pandas as pd  # only for files; validating lines off the link must not pay for it
+
+    frames = []
+    with open(path, errors="replace") as f:
+        first = f.readline()
+        lines = [] if first.strip().split(",")[:2] == validator.fields[:2] else [first]
+        for line in f:
+            lines.append(line)
+            if len(lines) == chunk:
+                frames.append(pd.DataFrame(validator.validate(lines)))
+                lines = []
+        frames.append(pd.DataFrame(validator.validate(lines)))
+    return pd.concat(frames, ignore_index=True)
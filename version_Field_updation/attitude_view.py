@@ -0,0 +1,190 @@
+import math
+import os
+import time
+
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QPainter, QPen, QColor
+from PyQt5.QtWidgets import QWidget
+
+
+def euler_to_quaternion(tilt_x, tilt_y, yaw):
+    """Quaternion (w, x, y, z) for roll=TILT_X, pitch=TILT_Y and yaw in degrees."""
+    hr, hp, hy = np.radians([tilt_x, tilt_y, yaw]) / 2.0
+    cr, sr = math.cos(hr), math.sin(hr)
+    cp, sp = math.cos(hp), math.sin(hp)
+    cy, sy = math.cos(hy), math.sin(hy)
+    return np.array([
+        cr * cp * cy + sr * sp * sy,
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy,
+    ])
+
+
+def slerp(q0, q1, t):
+    """Spherical linear interpolation between unit quaternions."""
+    dot = float(np.dot(q0, q1))
+    if dot < 0.0:
+        q1, dot = -q1, -dot
+    if dot > 0.9995:
+        q = q0 + t * (q1 - q0)
+        return q / np.linalg.norm(q)
+    theta = math.acos(dot)
+    sin_theta = math.sin(theta)
+    return (math.sin((1 - t) * theta) * q0 + math.sin(t * theta) * q1) / sin_theta
+
+
+def quaternion_matrix(q):
+    """3x3 rotation matrix of a unit quaternion."""
+    w, x, y, z = q
+    return np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)],
+        [2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)],
+        [2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)],
+    ])
+
+
+class AttitudeInterpolator:
+    """Eases the displayed attitude towards each new sample over one packet interval."""
+
+    def __init__(self):
+        self.start_q = np.array([1.0, 0.0, 0.0, 0.0])
+        self.target_q = self.start_q.copy()
+        self.start_time = 0.0
+        self.interval = 0.1
+        self.last_arrival = None
+
+    def push(self, tilt_x, tilt_y, yaw, now=None):
+        now = time.monotonic() if now is None else now
+        if self.last_arrival is not None:
+            # Smoothed estimate of the packet interval, clamped to sane rates
+            delta = min(max(now - self.last_arrival, 0.02), 1.0)
+            self.interval = 0.8 * self.interval + 0.2 * delta
+        self.last_arrival = now
+        self.start_q = self.at(now)
+        self.target_q = euler_to_quaternion(tilt_x, tilt_y, yaw)
+        self.start_time = now
+
+    def at(self, now):
+        t = min(max((now - self.start_time) / self.interval, 0.0), 1.0)
+        return slerp(self.start_q, self.target_q, t)
+
+    def settled(self, now):
+        return now - self.start_time >= self.interval
+
+
+class AttitudeViewMixin:
+    """Sample intake and frame throttling shared by the attitude renderers."""
+
+    def init_attitude(self, scheduler):
+        self.attitude = AttitudeInterpolator()
+        self.idle = False
+        if scheduler is not None:
+            scheduler.subscribe(self.render_frame)
+
+    def push_sample(self, tilt_x, tilt_y, yaw):
+        """New attitude in degrees; yaw is an angle (see heading.Heading), not the ROT_Z rate."""
+        if not all(math.isfinite(v) for v in (tilt_x, tilt_y, yaw)):
+            return
+        self.attitude.push(tilt_x, tilt_y, yaw)
+        self.idle = False
+
+    def render_frame(self, now):
+        """Frame scheduler callback; redraws only while the attitude is moving."""
+        if self.idle or not self.isVisible():
+            return
+        settled = self.attitude.settled(now)
+        self.show_quaternion(self.attitude.at(now))
+        self.idle = settled
+
+
+# CanSat body drawn as a box: 1 x 1 footprint, 2 tall
+BOX_VERTICES = np.array([
+    [x, y, z] for z in (-1.0, 1.0) for y in (-0.5, 0.5) for x in (-0.5, 0.5)
+])
+BOX_EDGES = [
+    (0, 1), (1, 3), (3, 2), (2, 0),
+    (4, 5), (5, 7), (7, 6), (6, 4),
+    (0, 4), (1, 5), (2, 6), (3, 7),
+]
+AXES = [((1.2, 0, 0), QColor('red')), ((0, 1.2, 0), QColor('green')), ((0, 0, 1.6), QColor('blue'))]
+
+# Fixed camera looking slightly down on the vehicle
+_CAMERA = quaternion_matrix(euler_to_quaternion(-60, 0, -30))
+
+
+class SoftwareAttitudeView(AttitudeViewMixin, QWidget):
+    """QPainter wireframe renderer, works without OpenGL (offscreen/headless)."""
+
+    def __init__(self, scheduler=None, parent=None):
+        super().__init__(parent)
+        self.setMinimumSize(150, 150)
+        self.rotation = np.eye(3)
+        self.init_attitude(scheduler)
+
+    def show_quaternion(self, q):
+        self.rotation = quaternion_matrix(q)
+        self.update()
+
+    def project(self, points):
+        scale = min(self.width(), self.height()) / 4.0
+        view = points @ (_CAMERA @ self.rotation).T
+        cx, cy = self.width() / 2.0, self.height() / 2.0
+        return [QPointF(cx + p[0] * scale, cy - p[1] * scale) for p in view]
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), Qt.white)
+        corners = self.project(BOX_VERTICES)
+        painter.setPen(QPen(QColor('black'), 2))
+        for a, b in BOX_EDGES:
+            painter.drawLine(corners[a], corners[b])
+        origin = self.project(np.zeros((1, 3)))[0]
+        for axis, color in AXES:
+            painter.setPen(QPen(color, 2))
+            painter.drawLine(origin, self.project(np.array([axis]))[0])
+        painter.end()
+
+
+def create_attitude_view(scheduler=None, parent=None):
+    """OpenGL attitude view when available, wireframe fallback otherwise."""
+    if os.environ.get("QT_QPA_PLATFORM") != "offscreen":
+        try:
+            return _create_gl_view(scheduler, parent)
+        except ImportError:
+            pass
+    return SoftwareAttitudeView(scheduler, parent)
+
+
+def _create_gl_view(scheduler, parent):
+    import pyqtgraph as pg
+    import pyqtgraph.opengl as gl
+    from PyQt5.QtGui import QMatrix4x4, QQuaternion
+
+    class _GLAttitudeView(AttitudeViewMixin, gl.GLViewWidget):
+        """pyqtgraph GLViewWidget rendering the CanSat body as a cylinder."""
+
+        def __init__(self):
+            super().__init__(parent)
+            self.setMinimumSize(150, 150)
+            self.setBackgroundColor('w')
+            self.setCameraPosition(distance=6, elevation=25, azimuth=45)
+            mesh = gl.MeshData.cylinder(rows=2, cols=24, radius=[0.5, 0.5], length=2.0)
+            self.body = gl.GLMeshItem(meshdata=mesh, smooth=True, color=(0.3, 0.5, 0.9, 1.0),
+                                      shader='shaded', drawEdges=False)
+            self.axes = gl.GLAxisItem(size=pg.Vector(1.2, 1.2, 1.6))
+            self.addItem(self.body)
+            self.addItem(self.axes)
+            self.init_attitude(scheduler)
+
+        def show_quaternion(self, q):
+            matrix = QMatrix4x4()
+            matrix.rotate(QQuaternion(*q))
+            centered = QMatrix4x4(matrix)
+            centered.translate(0, 0, -1.0)  # cylinder mesh starts at z=0
+            self.body.setTransform(pg.Transform3D(centered))
+            self.axes.setTransform(pg.Transform3D(matrix))
+
+    return _GLAttitudeView()
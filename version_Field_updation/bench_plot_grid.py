@@ -0,0 +1,87 @@
+"""Frame time of the shared-scene PlotGrid vs six separate PlotWidgets.
+
+    python bench_plot_grid.py [--points 100000 1000000] [--frames 20]
+
+Runs offscreen if no display is available. Each frame appends one packet,
+updates every curve and repaints the window synchronously.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+if "DISPLAY" not in os.environ and "QT_QPA_PLATFORM" not in os.environ:
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+import pyqtgraph as pg
+from PyQt5.QtWidgets import QApplication, QGridLayout, QWidget
+
+from plot_grid import PlotGrid, DEFAULT_PANELS
+from telemetry_store import TelemetryStore
+
+
+def fill_store(points):
+    store = TelemetryStore(capacity=points + 16)
+    t = np.arange(points, dtype=float)
+    store.extend({field: np.sin(t / (50.0 + i)) * 100 + i for i, field in enumerate(DEFAULT_PANELS)})
+    return store
+
+
+class SixWidgetLayout(QWidget):
+    """The layout used by the existing GUIs: one PlotWidget per graph."""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+        layout = QGridLayout(self)
+        self.curves = {}
+        for i, field in enumerate(DEFAULT_PANELS):
+            plot = pg.PlotWidget()
+            plot.setBackground('w')
+            plot.showGrid(x=True, y=True)
+            self.curves[field] = plot.plot(pen=pg.mkPen(color='b', width=2))
+            layout.addWidget(plot, i // 3, i % 3)
+
+    def update_curves(self):
+        x = np.arange(len(self.store))
+        for field, curve in self.curves.items():
+            curve.setData(x, self.store.column(field))
+
+
+def frame_time(app, window, store, frames):
+    window.resize(1200, 700)
+    window.show()
+    app.processEvents()
+    row = {field: 0.0 for field in DEFAULT_PANELS}
+    times = []
+    for _ in range(frames):
+        store.append(row)
+        start = time.perf_counter()
+        window.update_curves()
+        window.repaint()
+        app.processEvents()
+        times.append(time.perf_counter() - start)
+    window.close()
+    return np.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--frames", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    print(f"{'points':>10} {'six widgets (ms)':>18} {'plot grid (ms)':>16}")
+    for points in args.points:
+        store = fill_store(points)
+        six = frame_time(app, SixWidgetLayout(store), store, args.frames)
+        store = fill_store(points)
+        grid = frame_time(app, PlotGrid(store), store, args.frames)
+        print(f"{points:>10} {six:>18.1f} {grid:>16.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""Append cost of StreamingCurve vs PlotDataItem.setData on long series.
+
+    python bench_streaming_curve.py [--points 100000 1000000 10000000] [--frames 10] [--append 10]
+
+Runs offscreen if no display is available. Each frame appends `--append`
+points, updates the curve and repaints the plot synchronously; the
+PlotDataItem gets the whole series with clipToView and peak downsampling,
+as the plots did before. Reports the median update and frame times.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+if "DISPLAY" not in os.environ and "QT_QPA_PLATFORM" not in os.environ:
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+import pyqtgraph as pg
+from PyQt5.QtWidgets import QApplication
+
+from streaming_curve import StreamingCurve
+
+
+def series(points):
+    x = np.arange(points, dtype=float)
+    return x, np.sin(x / 50.0) * 100 + np.random.default_rng(0).normal(0, 1, points)
+
+
+def run(app, points, frames, append, streaming):
+    x, y = series(points + frames * append)
+    plot = pg.PlotWidget()
+    plot.resize(800, 500)
+    pen = pg.mkPen(color='b', width=2)
+    start = time.perf_counter()
+    if streaming:
+        curve = StreamingCurve(pen=pen)
+        plot.addItem(curve)
+        curve.extend(x[:points], y[:points])
+    else:
+        plot.setClipToView(True)
+        plot.setDownsampling(auto=True, mode='peak')
+        curve = plot.plot(x[:points], y[:points], pen=pen)
+    plot.show()
+    plot.repaint()
+    app.processEvents()
+    load = time.perf_counter() - start
+
+    updates, totals = [], []
+    n = points
+    for _ in range(frames):
+        start = time.perf_counter()
+        if streaming:
+            curve.extend(x[n:n + append], y[n:n + append])
+        else:
+            curve.setData(x[:n + append], y[:n + append])
+        n += append
+        updated = time.perf_counter()
+        plot.repaint()
+        app.processEvents()
+        updates.append(updated - start)
+        totals.append(time.perf_counter() - start)
+    plot.close()
+    return load * 1000, np.median(updates) * 1000, np.median(totals) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[100000, 1000000, 10000000])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--append", type=int, default=10, help="points appended per frame")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    print(f"{'points':>10} {'item':>16} {'load (ms)':>10} {'update (ms)':>12} {'frame (ms)':>11}")
+    for points in args.points:
+        for name, streaming in (("setData", False), ("StreamingCurve", True)):
+            load, update, frame = run(app, points, args.frames, args.append, streaming)
+            print(f"{points:>10} {name:>16} {load:>10.1f} {update:>12.2f} {frame:>11.1f}")
+
+
+if __name__ == '__main__':
+    main()
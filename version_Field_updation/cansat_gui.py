@@ -1,29 +1,112 @@
+import os
 import sys
-import pandas as pd
-import pyqtgraph as pg
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # modules shared by the GUIs
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
     QGroupBox, QHBoxLayout, QLabel, QPushButton, QComboBox, QLineEdit, 
-    QGridLayout, QFrame, QFileDialog)
+    QGridLayout, QFrame, QFileDialog, QToolButton, QStackedWidget, QCheckBox)
 from PyQt5.QtCore import QTimer, Qt
 from PyQt5.QtGui import QFont, QPixmap
-import os
 from datetime import datetime, timedelta
-import serial
+import argparse
+from serial_link import SerialLink, PortMonitor
+from telemetry_store import FIELDS, TEXT_FIELDS, format_value, packet_columns
+from ground_track import GroundTrackWidget
+from frame_scheduler import FrameScheduler
+from attitude_view import create_attitude_view
+from exporter import ExportWorker
+from telemetry_server import TelemetryServer, subscription_worker
+from plot_grid import PlotGrid, DEFAULT_PANELS
+from log_console import LogBuffer, LogConsole, LEVELS
+from pages import PageStack
+from simulation import SimulationStreamer, load_profile
+from vehicles import VehicleRouter
+from spectrogram import SpectrogramView, VIBRATION_FIELDS
+from session import Session, SESSION_DIR
+from validation import PacketValidator, read_validated_csv
+from rolling_stats import ROLLING_FIELDS, STATS, STAT_LABELS, format_stat
+from processors import ProcessorPipeline, load_processor
+from flight_overlay import EVENTS, FlightLoader, FlightOverlay
+
+# Telemetry panel row label -> packet field shown on it
+TELEMETRY_LABELS = {
+    "Team ID:": "TEAM_ID",
+    "Mission Time:": "MISSION_TIME",
+    "Packet Count:": "PACKET_COUNT",
+    "Mode:": "MODE",
+    "State:": "STATE",
+    "Altitude:": "ALTITUDE",
+    "Air Speed:": "AIR_SPEED",
+    "Heatshield deployed:": "HS_DEPLOYED",
+    "Parachute deployed:": "PC_DEPLOYED",
+    "Temperature:": "TEMPERATURE",
+    "Voltage:": "VOLTAGE",
+    "Pressure:": "PRESSURE",
+    "GPS Time:": "GPS_TIME",
+    "GPS Altitude:": "GPS_ALTITUDE",
+    "GPS Latitude:": "GPS_LATITUDE",
+    "GPS Longitude:": "GPS_LONGITUDE",
+    "GPS Sats:": "GPS_SATS",
+    "Tilt X:": "TILT_X",
+    "Tilt Y:": "TILT_Y",
+    "Rotation Z:": "ROT_Z",
+    "CMD Echo:": "CMD_ECHO"
+}
 
 class CanSatGroundControl(QMainWindow):
-    def __init__(self):
+    def __init__(self, session_dir=SESSION_DIR, resume=True):
         
         super().__init__()
         self.data = None
+        self.data_path = None  # CSV being replayed, reloaded on a warm restart
         self.current_index = 0
+        self.telemetry_server = None  # Set when this window re-publishes its feed
+        self.frame_scheduler = FrameScheduler(fps=60, parent=self)
+        self.log_buffer = LogBuffer()  # Filled even before the Logs page is opened
+        self.log_threshold = "INFO"
+        self.team_id = "2044"
+        self.sim_profile = None
+        self.sim_streamer = None
+        self.validator = PacketValidator(FIELDS, TEXT_FIELDS)  # Malformed lines are quarantined, not ingested
+        # Calibrations and conversions of packet fields, timed per batch and dropped when over budget
+        self.processors = ProcessorPipeline(on_disabled=self.processor_disabled)
+        self.scrub_position = None  # packet under the plot crosshair; the labels show it instead of the latest
         self.mission_start_time = None  # To keep track of mission start time
         self.elapsed_time = timedelta()  # To store elapsed time for the mission
+        
+        # One store (and query, plots) per TEAM_ID seen on the feed, memory-mapped
+        # under the session directory so a crashed GUI can reattach to it
+        self.session = Session(session_dir, resume)
+        self.vehicles = VehicleRouter(self.team_id, store_factory=self.session.store)
+        resumed = self.session.resumed
+        for team_id in (resumed or {}).get("vehicles", []):
+            self.vehicles.vehicle(team_id)
+        self.select_vehicle(self.vehicles.default)
         self.initUI()
+        self.vehicles.on_new = self.add_vehicle
+        
+        # Serial link with hot-plug monitoring and automatic reconnect
+        self.serial_link = SerialLink(parent=self)
+        self.serial_link.lines.connect(self.ingest_lines)
+        self.serial_link.status.connect(self.on_link_status)
+        self.port_monitor = PortMonitor(parent=self)
+        self.port_monitor.ports_changed.connect(self.update_ports)
+        self.port_monitor.start()
         
         # Update timer
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_data)
+        self.timer.timeout.connect(self.update_mission_time)  # No-op until a mission starts
         self.timer.start(1000)  # Update every second
+        
+        # Committed row counts and GUI state for a warm restart
+        self.checkpoint_timer = QTimer(self)
+        self.checkpoint_timer.timeout.connect(lambda: self.session.checkpoint(self.checkpoint_state()))
+        self.checkpoint_timer.start(1000)
+        if self.session.directory != session_dir:
+            self.log("WARNING", f"{session_dir} is in use by another console, "
+                                f"this one keeps its session in {self.session.directory}")
+        if resumed is not None:
+            self.resume_session(resumed)
 
     def initUI(self):
         self.setWindowTitle("CanSat2024")
@@ -45,13 +128,17 @@ class CanSatGroundControl(QMainWindow):
         logo_label.setFixedSize(120, 50)
         logo_label.setAlignment(Qt.AlignCenter)
         
-        # Team info labels
-        self.team_id_label = QLabel("2000")
-        self.team_id_label.setFont(QFont('Arial', 12))
+        # Vehicle selector, one entry per TEAM_ID received
+        self.vehicle_combo = QComboBox()
+        self.vehicle_combo.setFont(QFont('Arial', 12))
+        for vehicle in self.vehicles:
+            self.vehicle_combo.addItem(vehicle.team_id)
+        self.vehicle_combo.currentTextChanged.connect(
+            lambda team_id: self.select_vehicle(self.vehicles.vehicles[team_id]) if team_id else None)
         
         logo_container.addWidget(logo_label)
         # logo_container.addWidget(QLabel("AEROSPACE"))  # Add AEROSPACE text
-        logo_container.addWidget(self.team_id_label)
+        logo_container.addWidget(self.vehicle_combo)
         logo_container.addStretch()
         
         top_bar.addLayout(logo_container)
@@ -65,6 +152,8 @@ class CanSatGroundControl(QMainWindow):
         disconnect_btn = QPushButton("Disconnect")
         
         refresh_btn.clicked.connect(self.load_csv_file)
+        connect_btn.clicked.connect(self.connect_serial)
+        disconnect_btn.clicked.connect(self.disconnect_serial)
         
         connection_layout.addWidget(self.port_combo)
         connection_layout.addWidget(refresh_btn)
@@ -74,19 +163,62 @@ class CanSatGroundControl(QMainWindow):
         
         main_layout.addLayout(top_bar)
         
-        # Tab bar
-        tab_layout = QHBoxLayout()
-        tabs = ["Logs", "Commands", "Charts", "About", "Simulation"]
-        for tab in tabs:
-            btn = QPushButton(tab)
-            tab_layout.addWidget(btn)
-        main_layout.addLayout(tab_layout)
+        # Pages, each built on its first visit
+        self.pages = PageStack()
+        self.pages.add_page("Logs", self.build_logs_page)
+        self.pages.add_page("Commands", lambda: self.placeholder_page("No commands sent yet."))
+        self.pages.add_page("Charts", self.build_charts_page)
+        self.pages.add_page("Vibration", self.build_vibration_page)
+        self.pages.add_page("About", self.build_about_page)
+        self.pages.add_page("Simulation", self.build_simulation_page)
+        self.pages.add_page("Overlay", self.build_overlay_page)
+        self.pages.page_changed.connect(self.on_page_changed)
+        main_layout.addLayout(self.pages.tab_bar())
+        main_layout.addWidget(self.pages, 1)
+        self.pages.show_page("Charts")
+        
+        # Bottom bar - Command input
+        bottom_layout = QHBoxLayout()
+        cmd_input = QLineEdit()
+        cmd_input.setPlaceholderText("CMD,2044,")
+        send_btn = QPushButton("SEND")
+        export_btn = QPushButton("Export")
+        export_btn.clicked.connect(self.export_data)
+        self.plots_btn = QToolButton()
+        self.plots_btn.setText("Plots")
+        self.plots_btn.setPopupMode(QToolButton.InstantPopup)
+        self.plots_btn.setMenu(self.plot_menu(self.vehicle))
+        log_level = QComboBox()
+        log_level.addItem("RAW (lowest)", "RAW")
+        for level in LEVELS[1:]:
+            log_level.addItem(level, level)
+        log_level.setCurrentIndex(LEVELS.index("INFO"))
+        log_level.currentIndexChanged.connect(
+            lambda index: self.set_log_threshold(log_level.itemData(index)))
+        
+        bottom_layout.addWidget(cmd_input)
+        bottom_layout.addWidget(send_btn)
+        bottom_layout.addWidget(export_btn)
+        bottom_layout.addWidget(self.plots_btn)
+        bottom_layout.addStretch()
+        bottom_layout.addWidget(QLabel("Log level:"))
+        bottom_layout.addWidget(log_level)
+        
+        main_layout.addLayout(bottom_layout)
+        
+        self.setCentralWidget(central_widget)
         
-        # Main content area
-        content_layout = QHBoxLayout()
+        # Accepted/quarantined line counters, per-reason breakdown in the tooltip
+        self.quarantine_label = QLabel()
+        self.statusBar().addPermanentWidget(self.quarantine_label)
+        self.update_quarantine_status()
+
+    def build_charts_page(self):
+        page = QWidget()
+        content_layout = QHBoxLayout(page)
         
         # Left panel - Telemetry data
-        telemetry_group = QGroupBox()
+        telemetry_group = self.telemetry_group = QGroupBox("Live")
         telemetry_layout = QGridLayout()
         
         # Define telemetry fields
@@ -116,11 +248,24 @@ class CanSatGroundControl(QMainWindow):
             ("Camera 2 State:", "OK")
         ]
         
+        # Value, then rolling statistics over the last packets for numeric fields
+        window = self.vehicle.rolling.window
+        for column, text in enumerate(["Value"] + [STAT_LABELS[stat].capitalize() for stat in STATS], 1):
+            header = QLabel(f"<b>{'Rate/s' if text == 'Rate' else text}</b>")
+            header.setToolTip("Current packet" if column == 1 else f"Over the last {window} packets")
+            telemetry_layout.addWidget(header, 0, column)
+        
         self.telemetry_labels = {}
-        for i, (label, initial_value) in enumerate(telemetry_fields):
+        self.stat_labels = {}
+        for i, (label, initial_value) in enumerate(telemetry_fields, 1):
             telemetry_layout.addWidget(QLabel(label), i, 0)
             self.telemetry_labels[label] = QLabel(initial_value)
             telemetry_layout.addWidget(self.telemetry_labels[label], i, 1)
+            field = TELEMETRY_LABELS.get(label)
+            if field in ROLLING_FIELDS:
+                self.stat_labels[field] = [QLabel("-") for _ in STATS]
+                for column, stat_label in enumerate(self.stat_labels[field], 2):
+                    telemetry_layout.addWidget(stat_label, i, column)
         
         telemetry_group.setLayout(telemetry_layout)
         content_layout.addWidget(telemetry_group)
@@ -128,31 +273,20 @@ class CanSatGroundControl(QMainWindow):
         # Right panel - Graphs
         graphs_layout = QGridLayout()
         
-        # Create graphs
-        graph_configs = [
-            ("Pressure", "Pa"),
-            ("Altitude", "m"),
-            ("Tilt X", "deg"),
-            ("Temperature", "°C"),
-            ("Air speed", "m/s"),
-            ("Tilt Y", "deg")
-        ]
+        # Graphs share one scene with linked time axes; the ground track is
+        # drawn from GPS latitude/longitude. Each vehicle has its own pair,
+        # stacked so switching vehicle only flips the current widget.
+        self.plot_stack = QStackedWidget()
+        self.track_stack = QStackedWidget()
+        for vehicle in self.vehicles:
+            self.create_vehicle_views(vehicle)
+        self.select_vehicle(self.vehicle)
+        graphs_layout.addWidget(self.plot_stack, 0, 0, 2, 3)
+        graphs_layout.addWidget(self.track_stack, 0, 3)
         
-        self.plots = {}
-        for i, (title, unit) in enumerate(graph_configs):
-            plot = pg.PlotWidget()
-            plot.setBackground('w')
-            plot.showGrid(x=True, y=True)
-            plot.setLabel('left', f'{title} ({unit})')
-            plot.setLabel('bottom', 'Packet')
-            plot.setTitle(title)
-            
-            self.plots[title] = {
-                'widget': plot,
-                'curve': plot.plot(pen=pg.mkPen(color='b', width=2))
-            }
-            
-            graphs_layout.addWidget(plot, i//3, i%3)
+        # Attitude from TILT_X/TILT_Y and the ROT_Z rate integrated into yaw, redrawn by the frame scheduler
+        self.attitude_view = create_attitude_view(self.frame_scheduler)
+        graphs_layout.addWidget(self.attitude_view, 1, 3)
         
         content_layout.addLayout(graphs_layout)
         
@@ -160,43 +294,300 @@ class CanSatGroundControl(QMainWindow):
         content_layout.setStretchFactor(telemetry_group, 1)
         content_layout.setStretchFactor(graphs_layout, 4)
         
-        main_layout.addLayout(content_layout)
-        
-        # Bottom bar - Command input
-        bottom_layout = QHBoxLayout()
-        cmd_input = QLineEdit()
-        cmd_input.setPlaceholderText("CMD,2044,")
-        send_btn = QPushButton("SEND")
-        log_level = QComboBox()
-        log_level.addItem("ERROR (lowest)")
-        
-        bottom_layout.addWidget(cmd_input)
-        bottom_layout.addWidget(send_btn)
-        bottom_layout.addStretch()
-        bottom_layout.addWidget(QLabel("Log level:"))
-        bottom_layout.addWidget(log_level)
-        
-        main_layout.addLayout(bottom_layout)
-        
-        self.setCentralWidget(central_widget)
+        return page
+
+    def create_vehicle_views(self, vehicle):
+        fields = list(self.plot_grid.order) if self.plot_grid is not None else DEFAULT_PANELS
+        vehicle.views['plot_grid'] = PlotGrid(vehicle.store, fields, query=vehicle.query, rolling=vehicle.rolling)
+        vehicle.views['plot_grid'].scrubbed.connect(self.scrub_to)
+        vehicle.views['ground_track'] = GroundTrackWidget(vehicle.store)
+        self.plot_stack.addWidget(vehicle.views['plot_grid'])
+        self.track_stack.addWidget(vehicle.views['ground_track'])
+
+    def plot_menu(self, vehicle):
+        if 'menu' not in vehicle.views:
+            vehicle.views['menu'] = vehicle.views['plot_grid'].field_menu(self)
+        return vehicle.views['menu']
+
+    def add_vehicle(self, vehicle):
+        """A new TEAM_ID showed up on the feed."""
+        if self.pages.page("Charts") is not None:
+            self.create_vehicle_views(vehicle)
+        self.vehicle_combo.addItem(vehicle.team_id)
+        self.log("INFO", f"New vehicle on the feed: TEAM_ID {vehicle.team_id}")
+
+    def select_vehicle(self, vehicle):
+        """Point the dashboard at another vehicle; its data and plots are already live."""
+        self.vehicle = vehicle
+        self.scrub_position = None
+        self.store = vehicle.store
+        self.query = vehicle.query  # Post-flight/interactive range queries
+        self.plot_grid = vehicle.views.get('plot_grid')
+        self.ground_track = vehicle.views.get('ground_track')
+        if self.plot_grid is None:
+            return  # Charts page not built yet
+        self.plot_stack.setCurrentWidget(self.plot_grid)
+        self.track_stack.setCurrentWidget(self.ground_track)
+        if hasattr(self, 'plots_btn'):
+            self.plots_btn.setMenu(self.plot_menu(vehicle))
+        if self.pages.page("Vibration") is not None:
+            self.spectrogram.set_store(vehicle.store)
+        self.refresh_views()
+
+    def build_vibration_page(self):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        field_combo = QComboBox()
+        field_combo.addItems(VIBRATION_FIELDS)
+        self.spectrogram = SpectrogramView(self.store, VIBRATION_FIELDS[0])
+        field_combo.currentTextChanged.connect(self.spectrogram.set_field)
+        layout.addWidget(field_combo)
+        layout.addWidget(self.spectrogram)
+        return page
+
+    def build_logs_page(self):
+        self.log_console = LogConsole(self.log_buffer, threshold=self.log_threshold)
+        return self.log_console
+
+    def build_about_page(self):
+        about = QLabel("CanSat 2024 Ground Station\nTeam TARSR (2044)")
+        about.setFont(QFont('Arial', 14))
+        about.setAlignment(Qt.AlignCenter)
+        return about
+
+    def build_simulation_page(self):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        buttons = QHBoxLayout()
+        for text, slot in [("Load profile", self.load_sim_profile),
+                           ("SIM ENABLE", lambda: self.send_command(f"CMD,{self.team_id},SIM,ENABLE")),
+                           ("SIM ACTIVATE", lambda: self.send_command(f"CMD,{self.team_id},SIM,ACTIVATE")),
+                           ("Start SIMP", self.start_simulation),
+                           ("Stop SIMP", self.stop_simulation),
+                           ("SIM DISABLE", lambda: self.send_command(f"CMD,{self.team_id},SIM,DISABLE"))]:
+            btn = QPushButton(text)
+            btn.clicked.connect(slot)
+            buttons.addWidget(btn)
+        layout.addLayout(buttons)
+        self.sim_status = QLabel("No pressure profile loaded.")
+        self.sim_stats = QLabel("")
+        layout.addWidget(self.sim_status)
+        layout.addWidget(self.sim_stats)
+        layout.addStretch()
+        return page
+
+    def build_overlay_page(self):
+        """Recorded flights overlaid on shared panels, aligned on a mission event."""
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        controls = QHBoxLayout()
+        add_btn = QPushButton("Add flights")
+        add_btn.clicked.connect(self.add_overlay_flights)
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self.clear_overlay)
+        self.overlay_event = QComboBox()
+        for event, label in EVENTS.items():
+            self.overlay_event.addItem(label, event)
+        self.overlay_event.currentIndexChanged.connect(
+            lambda index: self.set_overlay_event(self.overlay_event.itemData(index)))
+        self.overlay_reference = QComboBox()
+        self.overlay_reference.currentIndexChanged.connect(
+            lambda index: self.overlay.set_reference(index) if index >= 0 else None)
+        differences = QCheckBox("Difference to reference")
+        differences.toggled.connect(lambda checked: self.overlay.set_differences(checked))
+        for widget in (add_btn, clear_btn, QLabel("Align on:"), self.overlay_event,
+                       QLabel("Reference:"), self.overlay_reference, differences):
+            controls.addWidget(widget)
+        controls.addStretch()
+        self.overlay_status = QLabel("No flights loaded.")
+        self.overlay = FlightOverlay()
+        layout.addLayout(controls)
+        layout.addWidget(self.overlay_status)
+        layout.addWidget(self.overlay, 1)
+        return page
+
+    def add_overlay_flights(self):
+        paths, _ = QFileDialog.getOpenFileNames(self, "Open Flights", "", "CSV Files (*.csv)")
+        if not paths:
+            return
+        # First opening converts each CSV to memory-mapped columns, off the GUI thread
+        self.overlay_loader = FlightLoader(paths, parent=self)
+        self.overlay_loader.loaded.connect(self.on_overlay_flight)
+        self.overlay_loader.failed.connect(
+            lambda path, error: self.log("ERROR", f"Error loading flight {path}: {error}"))
+        self.overlay_loader.start()
+        self.overlay_status.setText(f"Loading {len(paths)} flight(s)...")
+
+    def on_overlay_flight(self, flight):
+        if flight.bad_rows:
+            self.log("WARNING", f"{flight.name}: {flight.bad_rows} malformed rows skipped")
+        self.overlay.add_flight(flight)
+        self.overlay_reference.addItem(flight.name)
+        self.update_overlay_status()
+        self.log("INFO", f"Flight added to overlay: {flight.name} ({len(flight)} packets)")
+
+    def set_overlay_event(self, event):
+        self.overlay.set_event(event)
+        self.update_overlay_status()
+
+    def clear_overlay(self):
+        self.overlay.clear_flights()
+        self.overlay_reference.clear()
+        self.overlay_status.setText("No flights loaded.")
+
+    def update_overlay_status(self):
+        text = f"{len(self.overlay.flights)} flight(s)"
+        missing = self.overlay.missing_event()
+        if missing:
+            text += f"; no {EVENTS[self.overlay.event].lower()} in {', '.join(missing)}, aligned on the first packet"
+        self.overlay_status.setText(text)
+
+    def load_sim_profile(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Open Pressure Profile", "", "Profiles (*.txt *.csv);;All Files (*)")
+        if file_name:
+            self.sim_profile = load_profile(file_name)
+            self.sim_status.setText(f"{len(self.sim_profile)} pressure values from {os.path.basename(file_name)}")
+            self.log("INFO", f"Simulation profile loaded: {file_name} ({len(self.sim_profile)} values)")
+
+    def send_command(self, command):
+        if self.serial_link.send(f"{command}\n".encode()):
+            self.log("INFO", f"Sent {command}")
+        else:
+            self.log("ERROR", f"Not connected, {command} not sent")
+
+    def start_simulation(self):
+        """Stream the profile as SIMP commands at 1 Hz from a worker thread."""
+        if self.sim_profile is None or len(self.sim_profile) == 0:
+            self.log("WARNING", "Load a pressure profile first")
+            return
+        self.stop_simulation()
+        self.sim_streamer = SimulationStreamer(self.serial_link.send, self.team_id, self.sim_profile, parent=self)
+        self.sim_streamer.progress.connect(
+            lambda sent, total: self.sim_status.setText(f"SIMP {sent}/{total}"))
+        self.sim_streamer.stats.connect(self.show_simulation_stats)
+        self.sim_streamer.start()
+        self.log("INFO", "SIMP streaming started")
+
+    def stop_simulation(self):
+        if self.sim_streamer is not None and self.sim_streamer.isRunning():
+            self.sim_streamer.stop()
+
+    def show_simulation_stats(self, stats):
+        if stats['sent']:
+            text = (f"{stats['sent']} sent, {stats['failed']} failed; send jitter mean {stats['mean_ms']:.2f} ms, "
+                    f"p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms")
+        else:
+            text = "Nothing sent"
+        self.sim_stats.setText(text)
+        self.log("INFO", f"SIMP streaming finished: {text}")
+
+    def placeholder_page(self, text):
+        label = QLabel(text)
+        label.setAlignment(Qt.AlignCenter)
+        return label
+
+    def on_page_changed(self, previous, current):
+        """Stop rendering the page that was hidden; the data pipeline keeps running."""
+        if previous == "Charts":
+            self.frame_scheduler.unsubscribe(self.attitude_view.render_frame)
+        if current == "Charts":
+            self.frame_scheduler.subscribe(self.attitude_view.render_frame)
+            self.refresh_views()
+
+    def charts_visible(self):
+        return self.pages.current == "Charts"
+
+    def set_log_threshold(self, level):
+        self.log_threshold = level
+        if self.pages.page("Logs") is not None:
+            self.log_console.set_threshold(level)
 
     def load_csv_file(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv)")
         if file_name:
             try:
-                self.data = pd.read_csv(file_name)
-                self.current_index = 0
-                print("CSV file loaded successfully")
-                self.start_mission_timer()  # Start the mission timer after loading the CSV
+                quarantined = sum(self.validator.rejected.values())
+                self.start_mission(read_validated_csv(file_name, self.validator))
+                self.data_path = file_name
+                quarantined = sum(self.validator.rejected.values()) - quarantined
+                self.log("WARNING" if quarantined else "INFO",
+                         f"CSV file loaded: {file_name} ({len(self.data)} packets, {quarantined} lines quarantined)")
+                self.update_quarantine_status()
             except Exception as e:
-                print(f"Error loading CSV file: {e}")
+                self.log("ERROR", f"Error loading CSV file: {e}")
+
+    def start_mission(self, data=None):
+        """Drop everything recorded and start over, replaying `data` if given."""
+        self.data = data
+        self.data_path = None
+        self.current_index = 0
+        self.vehicles.clear()
+        for vehicle in self.vehicles:
+            if vehicle.views:
+                vehicle.views['plot_grid'].clear_curves()
+                vehicle.views['ground_track'].reset()
+        self.start_mission_timer()
+
+    def checkpoint_state(self):
+        """GUI state needed to pick the session up again after a crash."""
+        return {
+            "vehicles": [vehicle.team_id for vehicle in self.vehicles],
+            "selected": self.vehicle.team_id,
+            "current_index": self.current_index,
+            "data_path": self.data_path,
+            "port": self.serial_link.port if self.serial_link.wanted else None,
+            "mission_start": self.mission_start_time.timestamp() if self.mission_start_time else None,
+        }
+
+    def resume_session(self, state):
+        """Carry on from the last checkpoint of a session that did not shut down cleanly.
+
+        The stores are already reattached to their mapped columns; this
+        restores the selection, mission timer and data sources.
+        """
+        self.vehicle_combo.setCurrentText(state.get("selected") or self.team_id)
+        if state.get("mission_start") is not None:
+            self.mission_start_time = datetime.fromtimestamp(state["mission_start"])
+            self.update_mission_time()
+        self.refresh_views()
+        if state.get("data_path"):
+            # Replayed rows are already in the store; reading the CSV can wait for the first frame
+            QTimer.singleShot(0, lambda: self.reload_replay(state["data_path"], state.get("current_index", 0)))
+        if state.get("port"):
+            self.serial_link.open(state["port"])
+        packets = sum(len(vehicle.store) for vehicle in self.vehicles)
+        self.log("INFO", f"Resumed session: {packets} packets from {len(self.vehicles)} vehicle(s)")
+
+    def reload_replay(self, path, index):
+        try:
+            self.data = read_validated_csv(path, PacketValidator(FIELDS, TEXT_FIELDS, quarantine_path=None))  # already counted
+        except Exception as e:
+            self.log("ERROR", f"Error reloading CSV file: {e}")
+            return
+        self.data_path = path
+        self.current_index = index
+
+    def export_data(self):
+        """Export the recorded telemetry to CSV or Parquet on a worker thread."""
+        file_name, selected = QFileDialog.getSaveFileName(
+            self, "Export Telemetry", "cansat_Data.csv",
+            "CSV Files (*.csv);;Parquet Files (*.parquet)")
+        if not file_name:
+            return
+        fmt = "parquet" if "parquet" in selected.lower() or file_name.endswith(".parquet") else "csv"
+        self.export_worker = ExportWorker(self.store, file_name, fmt, self)
+        self.export_worker.progress.connect(
+            lambda done, total: self.statusBar().showMessage(f"Exporting... {done}/{total} packets"))
+        self.export_worker.done.connect(
+            lambda path, count: self.statusBar().showMessage(f"Exported {count} packets to {path}", 5000))
+        self.export_worker.failed.connect(lambda error: self.log("ERROR", f"Error exporting data: {error}"))
+        self.export_worker.start()
 
     def start_mission_timer(self):
         """Start the mission timer when the simulation starts."""
         self.mission_start_time = datetime.now()
         self.elapsed_time = timedelta()  # Reset the elapsed time
-        self.timer.timeout.connect(self.update_mission_time)  # Connect to mission time update
-        print("Mission timer started.")
+        self.log("INFO", "Mission timer started.")
 
     def update_mission_time(self):
         """Update the mission time displayed on the GUI."""
@@ -207,66 +598,171 @@ class CanSatGroundControl(QMainWindow):
 
     def update_data(self):
         if self.data is not None and self.current_index < len(self.data):
-            row = self.data.iloc[self.current_index]
-            
-            # Update telemetry labels
-            mapping = {
-                "Team ID:": "TEAM_ID",
-                "Mission Time:": self.get_mission_time(),
-                "Packet Count:": "PACKET_COUNT",
-                "Mode:": "MODE",
-                "State:": "STATE",
-                "Altitude:": "ALTITUDE",
-                "Air Speed:": "AIR_SPEED",
-                "Heatshield deployed:": "HS_DEPLOYED",
-                "Parachute deployed:": "PC_DEPLOYED",
-                "Temperature:": "TEMPERATURE",
-                "Voltage:": "VOLTAGE",
-                "Pressure:": "PRESSURE",
-                "GPS Time:": "GPS_TIME",
-                "GPS Altitude:": "GPS_ALTITUDE",
-                "GPS Latitude:": "GPS_LATITUDE",
-                "GPS Longitude:": "GPS_LONGITUDE",
-                "GPS Sats:": "GPS_SATS",
-                "Tilt X:": "TILT_X",
-                "Tilt Y:": "TILT_Y",
-                "Rotation Z:": "ROT_Z",
-                "CMD Echo:": "CMD_ECHO"
-            }
-            
-            for label, column in mapping.items():
-                if label in self.telemetry_labels:
-                    if column == "MISSION_TIME":
-                        self.telemetry_labels[label].setText(self.get_mission_time())
-                    elif column in row:
-                        self.telemetry_labels[label].setText(str(row[column]))
-            
-            # Update graphs
-            for title, plot_data in self.plots.items():
-                column_mapping = {
-                    "Pressure": "PRESSURE",
-                    "Altitude": "ALTITUDE",
-                    "Tilt X": "TILT_X",
-                    "Temperature": "TEMPERATURE",
-                    "Air speed": "AIR_SPEED",
-                    "Tilt Y": "TILT_Y"
-                }
-                
-                column = column_mapping.get(title)
-                if column in self.data.columns:
-                    y_data = self.data[column][:self.current_index + 1].tolist()
-                    x_data = list(range(len(y_data)))
-                    plot_data['curve'].setData(x_data, y_data)
-            
+            self.ingest_packet(self.data.iloc[self.current_index].to_dict())
             self.current_index += 1
 
+    def ingest_packet(self, packet):
+        """Add one parsed packet to the store, re-publish it and refresh the views."""
+        self.ingest_packets([packet])
+
+    def ingest_packets(self, packets):
+        if packets:
+            self.ingest_columns(packet_columns(packets))
+
+    def ingest_lines(self, lines):
+        """Raw telemetry lines from the serial link."""
+        for line in lines:
+            self.log_buffer.append("RAW", line)
+        packets = self.validator.validate(lines)
+        if len(packets["TEAM_ID"]):
+            self.ingest_columns(packets)
+        self.update_quarantine_status()
+
+    def ingest_columns(self, columns):
+        """Run the processors over a batch from a local source, re-publish and store it."""
+        columns = self.processors.run(columns)
+        if self.telemetry_server is not None:
+            self.telemetry_server.publish(columns)
+        self.ingest_batch(columns)
+
+    def add_processor(self, processor):
+        self.processors.add(processor)
+        self.log("INFO", f"Processor loaded: {processor} (reads {', '.join(processor.reads)}; "
+                         f"writes {', '.join(processor.writes)})")
+
+    def processor_disabled(self, processor, reason):
+        self.log("ERROR", f"Processor {processor} disabled: {reason}")
+
+    def update_quarantine_status(self):
+        self.quarantine_label.setText(self.validator.summary())
+        self.quarantine_label.setToolTip(self.validator.details())
+
+    def ingest_batch(self, columns):
+        """Add a block of packets (dict of columns), e.g. from a telemetry subscription."""
+        self.vehicles.extend(columns)
+        self.refresh_views()
+
+    def refresh_views(self):
+        if len(self.store) == 0:
+            return
+        if self.pages.current == "Vibration":
+            self.spectrogram.update_spectrum()
+        if not self.charts_visible():
+            return
+        latest = self.store.row(len(self.store) - 1)
+        self.show_packet(len(self.store) - 1 if self.scrub_position is None else self.scrub_position)
+        
+        # Update graphs (views of the store columns, no copies)
+        self.plot_grid.update_curves()
+        
+        self.ground_track.update_track()
+        self.attitude_view.push_sample(latest["TILT_X"], latest["TILT_Y"], self.vehicle.heading.update())
+
+    def scrub_to(self, position):
+        """Show the packet under the plot crosshair in the telemetry panel, the latest again for -1."""
+        if self.sender() is not self.plot_grid:
+            return
+        self.scrub_position = None if position < 0 else position
+        if len(self.store):
+            self.show_packet(len(self.store) - 1 if position < 0 else position)
+
+    def show_packet(self, position):
+        """Fill the telemetry labels from stored packet `position`."""
+        row = self.store.row(position)
+        if self.scrub_position is None:
+            self.telemetry_group.setTitle("Live")
+        else:
+            self.telemetry_group.setTitle(f"At cursor: packet {position + 1} of {len(self.store)}")
+        for label, column in TELEMETRY_LABELS.items():
+            if label in self.telemetry_labels:
+                if column == "MISSION_TIME":
+                    self.telemetry_labels[label].setText(self.get_mission_time())
+                elif column in row:
+                    self.telemetry_labels[label].setText(format_value(column, row[column]))
+        
+        stats = self.vehicle.rolling.row(position)
+        for field, labels in self.stat_labels.items():
+            for label, value in zip(labels, stats[field]):
+                label.setText(format_stat(value))
+
     def get_mission_time(self):
         """Returns the formatted mission time."""
         return str(self.elapsed_time).split('.')[0]  # HH:MM:SS format
 
+    def serve_telemetry(self, address):
+        """Publish every ingested packet to local subscribers."""
+        try:
+            self.telemetry_server = TelemetryServer(address).start()
+        except OSError as e:
+            self.log("ERROR", f"Error publishing telemetry on {address}: {e}")
+            return
+        self.log("INFO", f"Publishing telemetry on {self.telemetry_server.address}")
+
+    def subscribe_telemetry(self, address):
+        """Follow another ground station's feed instead of a local source."""
+        self.subscription = subscription_worker(address, self)
+        self.subscription.batch.connect(self.ingest_batch)
+        self.subscription.failed.connect(lambda error: self.log("ERROR", f"Error subscribing to telemetry: {error}"))
+        self.subscription.start()
+
+    def log(self, level, message):
+        self.log_buffer.append(level, message)
+
+    def on_link_status(self, message):
+        self.statusBar().showMessage(message)
+        self.log("WARNING" if "lost" in message else "INFO", message)
+
+    def update_ports(self, ports):
+        """Refresh the port list on hot-plug, keeping the current selection."""
+        current = self.port_combo.currentText()
+        self.port_combo.clear()
+        for device, description, _ in ports:
+            self.port_combo.addItem(device, description)
+        index = self.port_combo.findText(current)
+        if index >= 0:
+            self.port_combo.setCurrentIndex(index)
+        elif current:
+            self.port_combo.insertItem(0, current)
+            self.port_combo.setCurrentIndex(0)
+
+    def connect_serial(self):
+        port = self.port_combo.currentText()
+        if port:
+            self.serial_link.open(port if port.startswith(("/", "COM")) else f"/dev/{port}")
+
+    def disconnect_serial(self):
+        self.serial_link.close()
+
+    def closeEvent(self, event):
+        self.checkpoint_timer.stop()
+        self.session.close(self.checkpoint_state())
+        self.stop_simulation()
+        self.port_monitor.stop()
+        self.serial_link.close()
+        if self.telemetry_server is not None:
+            self.telemetry_server.stop()
+        super().closeEvent(event)
+
 if __name__ == '__main__':
-    app = QApplication(sys.argv)
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--serve', nargs='?', const='127.0.0.1:5760', metavar='ADDRESS',
+                        help='re-publish the feed to other consoles (host:port or unix:/path)')
+    parser.add_argument('--subscribe', nargs='?', const='127.0.0.1:5760', metavar='ADDRESS',
+                        help='watch the feed published by another ground station')
+    parser.add_argument('--new-session', action='store_true',
+                        help='discard the state of a crashed session instead of resuming it')
+    parser.add_argument('--processor', action='append', default=[], metavar='MODULE:NAME',
+                        help='run a processor plugin on every batch before it is stored (repeatable)')
+    args, qt_args = parser.parse_known_args()
+    
+    app = QApplication(sys.argv[:1] + qt_args)
     app.setStyle('Fusion')
-    main_window = CanSatGroundControl()
+    main_window = CanSatGroundControl(resume=not args.new_session)
+    for spec in args.processor:
+        main_window.add_processor(load_processor(spec))
+    if args.serve:
+        main_window.serve_telemetry(args.serve)
+    if args.subscribe:
+        main_window.subscribe_telemetry(args.subscribe)
     main_window.show()
     sys.exit(app.exec_())
\ No newline at end of file
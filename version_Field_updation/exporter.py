@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from telemetry_store import FIELDS, TEXT_FIELDS, INTEGER_FIELDS
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+BLOCK_SIZE = 131072  # packets written per block
+NEEDS_QUOTES = r'[,"\r\n]'  # text values that have to be quoted in a CSV field
+
+
+def snapshot(store):
+    """Views of every column at the current length.
+
+    The store is append-only, so these stay valid while the GUI keeps adding
+    packets (a reallocation leaves the old arrays alive through the views).
+    """
+    return {field: store.column(field) for field in FIELDS}, len(store)
+
+
+def block_table(columns, start, stop):
+    """Arrow table for packets [start, stop), built straight from the column arrays."""
+    arrays = []
+    for field in FIELDS:
+        values = columns[field][start:stop]
+        if field in TEXT_FIELDS:
+            arrays.append(pa.array(values, type=pa.string()))
+        elif field in INTEGER_FIELDS:
+            missing = np.isnan(values)
+            arrays.append(pa.array(np.where(missing, 0, values).astype(np.int64), mask=missing))
+        else:
+            arrays.append(pa.array(values, from_pandas=True))  # NaN -> null, an empty field like pandas writes
+    return pa.Table.from_arrays(arrays, names=FIELDS)
+
+
+def needs_quotes(table):
+    """Whether any text value of an Arrow block has a comma, quote or line break in it."""
+    return any(pc.any(pc.match_substring_regex(table[field], NEEDS_QUOTES)).as_py() for field in TEXT_FIELDS)
+
+
+def block_frame(columns, start, stop):
+    frame = pd.DataFrame({field: columns[field][start:stop] for field in FIELDS})
+    for field in INTEGER_FIELDS:
+        frame[field] = frame[field].astype("Int64")
+    return frame
+
+
+def export_csv(store, path, progress=None, block_size=BLOCK_SIZE):
+    """Write the store in the 30-field cansat_Data.csv layout.
+
+    Text values are quoted only where they have to be, as the csv module
+    does. Arrow writes a block unquoted when nothing in it needs quotes (it
+    would otherwise quote every string); pandas writes the rest.
+    """
+    columns, length = snapshot(store)
+    with open(path, "wb") as f:
+        f.write((",".join(FIELDS) + "\n").encode())
+        for start in range(0, length, block_size):
+            stop = min(start + block_size, length)
+            table = block_table(columns, start, stop) if pa is not None else None
+            if table is not None and not needs_quotes(table):
+                pa_csv.write_csv(table, f, pa_csv.WriteOptions(include_header=False, quoting_style="none"))
+            else:
+                f.write(block_frame(columns, start, stop).to_csv(
+                    header=False, index=False, lineterminator="\n").encode())
+            if progress:
+                progress(stop, length)
+    return length
+
+
+def export_parquet(store, path, progress=None, block_size=BLOCK_SIZE):
+    """Write the store as Parquet, one row group per block."""
+    if pa is None:
+        raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+    columns, length = snapshot(store)
+    writer = None
+    try:
+        for start in range(0, length, block_size):
+            stop = min(start + block_size, length)
+            table = block_table(columns, start, stop)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            if progress:
+                progress(stop, length)
+    finally:
+        if writer is not None:
+            writer.close()
+    return length
+
+
+EXPORTERS = {
+    "csv": export_csv,
+    "parquet": export_parquet,
+}
+
+
+class ExportWorker(QThread):
+    """Runs an export off the GUI thread and reports progress."""
+
+    progress = pyqtSignal(int, int)
+    done = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def __init__(self, store, path, fmt="csv", parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.path = path
+        self.export = EXPORTERS[fmt]
+
+    def run(self):
+        try:
+            count = self.export(self.store, self.path, progress=self.progress.emit)
+            self.done.emit(self.path, count)
+        except Exception as e:
+            self.failed.emit(str(e))
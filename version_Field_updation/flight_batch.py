@@ -0,0 +1,151 @@
+"""Summarise a directory of recorded flights in parallel.
+
+    python flight_batch.py LOG_DIR [--pattern "*.csv"] [--workers N] [--output summary.csv]
+
+Each log is parsed and summarised in a worker process; the per-flight rows
+are merged into one table sorted by file name. Malformed rows are skipped
+and counted in the bad_rows column.
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # modules shared by the GUIs
+from mission_time import MissionClock
+from telemetry_store import FIELDS, NUMERIC_FIELDS, TEXT_FIELDS
+from validation import PacketValidator, read_validated_csv
+
+SUMMARY_FIELDS = ["flight", "packets", "bad_rows", "lost_packets", "duration_s", "apogee_m", "apogee_s",
+                  "max_air_speed", "heatshield_s", "parachute_s", "min_voltage"]
+
+
+def read_flight(path):
+    """One recorded flight as a DataFrame with typed columns, and the number of rows skipped.
+
+    Rows go through the same PacketValidator checks as a live feed, laid out
+    as the header names them; malformed rows are left out, not quarantined.
+    Columns the header names beyond the telemetry fields are not checked and
+    not returned. Raises ValueError if the header names no telemetry field,
+    i.e. the file is not a telemetry log (or has lost its header line).
+    """
+    with open(path, errors="replace") as f:
+        header = f.readline().rstrip("\r\n").split(",")
+    if not any(field in FIELDS for field in header):
+        raise ValueError("not a telemetry log: no telemetry fields in the header")
+    validator = PacketValidator(header, TEXT_FIELDS.union(header).difference(NUMERIC_FIELDS), quarantine_path=None)
+    data = read_validated_csv(path, validator)
+    return data[[field for field in FIELDS if field in header]], sum(validator.rejected.values())
+
+
+def first_time(flags, seconds):
+    """Mission seconds of the first row where `flags` is set, NaN if never."""
+    hits = np.flatnonzero(flags)
+    return seconds[hits[0]] if len(hits) else np.nan
+
+
+def deployed(data, field):
+    if field not in data:
+        return np.zeros(len(data), dtype=bool)
+    values = data[field].fillna("N").str.strip().to_numpy(dtype=str)
+    return values != "N"
+
+
+def column(data, field):
+    if field not in data:
+        return np.full(len(data), np.nan)
+    return data[field].to_numpy(dtype=float, na_value=np.nan)
+
+
+def nanmax(values):
+    return np.nanmax(values) if np.isfinite(values).any() else np.nan
+
+
+def summarize_flight(path):
+    """Apogee, max air speed, deployment times, packet loss and minimum voltage of one log."""
+    data, bad_rows = read_flight(path)
+    if len(data) == 0:
+        raise ValueError("no packets" if not bad_rows else f"no packets, {bad_rows} malformed rows")
+    if "MISSION_TIME" in data:
+        seconds = MissionClock().extend(data["MISSION_TIME"].fillna("").to_numpy(dtype=str))
+    else:
+        seconds = np.full(len(data), np.nan)
+    start = seconds[np.isfinite(seconds)][0] if np.isfinite(seconds).any() else np.nan
+    seconds = seconds - start
+
+    altitude = column(data, "ALTITUDE")
+    apogee = np.nanargmax(altitude) if np.isfinite(altitude).any() else None
+    counts = column(data, "PACKET_COUNT")
+    counts = np.unique(counts[np.isfinite(counts)])
+    lost = int(counts[-1] - counts[0] + 1 - len(counts)) if len(counts) else 0
+    voltage = column(data, "VOLTAGE")
+    return {
+        "flight": os.path.basename(path),
+        "packets": len(data),
+        "bad_rows": bad_rows,
+        "lost_packets": lost,
+        "duration_s": nanmax(seconds),
+        "apogee_m": altitude[apogee] if apogee is not None else np.nan,
+        "apogee_s": seconds[apogee] if apogee is not None else np.nan,
+        "max_air_speed": nanmax(column(data, "AIR_SPEED")),
+        "heatshield_s": first_time(deployed(data, "HS_DEPLOYED"), seconds),
+        "parachute_s": first_time(deployed(data, "PC_DEPLOYED"), seconds),
+        "min_voltage": np.nanmin(voltage) if np.isfinite(voltage).any() else np.nan,
+    }
+
+
+def safe_summary(path):
+    """summarize_flight that reports a broken log as a row instead of failing the batch."""
+    try:
+        return summarize_flight(path)
+    except Exception as e:
+        return {"flight": os.path.basename(path), "error": str(e)}
+
+
+def summarize_flights(paths, workers=None):
+    """Summary table of every log in `paths`, computed in `workers` processes."""
+    workers = workers or os.cpu_count()
+    if workers == 1 or len(paths) <= 1:
+        rows = [safe_summary(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # One file per task keeps the pool balanced when log sizes differ
+            rows = list(pool.map(safe_summary, paths))
+    table = pd.DataFrame(rows, columns=SUMMARY_FIELDS + (["error"] if any("error" in r for r in rows) else []))
+    return table.sort_values("flight", ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory")
+    parser.add_argument("--pattern", default="*.csv")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--output", help="write the summary table to this CSV file")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.directory, args.pattern)))
+    if not paths:
+        print(f"No logs matching {args.pattern} in {args.directory}")
+        return 1
+    start = time.perf_counter()
+    table = summarize_flights(paths, args.workers)
+    elapsed = time.perf_counter() - start
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(table.to_string(index=False))
+    print(f"{len(paths)} flights in {elapsed:.2f} s with {args.workers or os.cpu_count()} workers")
+    if table["bad_rows"].sum() > 0:
+        print(f"WARNING: {int(table['bad_rows'].sum())} malformed rows skipped, see the bad_rows column")
+    if "error" in table:
+        print(f"WARNING: {table['error'].notna().sum()} files could not be summarised, see the error column")
+    if args.output:
+        table.to_csv(args.output, index=False)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
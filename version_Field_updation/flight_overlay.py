@@ -0,0 +1,411 @@
+"""Overlay recorded flights on shared plot panels, aligned on a mission event.
+
+    python flight_overlay.py FLIGHT.csv [FLIGHT.csv ...] [--event apogee] [--reference 0] [--differences]
+
+Each CSV is converted once into one .npy file per column, plus the
+column's min/max pyramid, under .cache/flights and memory-mapped from then
+on, so reopening a set of multi-million-packet flights reads only the pages
+that get drawn.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from flight_batch import deployed, read_flight
+from mission_time import MissionClock, elapsed
+from plot_grid import DEFAULT_PANELS
+from telemetry_store import FIELD_LABELS, NUMERIC_FIELDS
+
+FLIGHT_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "flights")
+CACHE_VERSION = 3   # part of every cache directory name; bump when the layout changes
+BLOCK = 64          # samples per bin of the finest min/max level; each level up is 4x coarser
+LAUNCH_CLIMB = 5.0  # m above the first altitude that counts as launch when STATE has no ASCENT
+EVENTS = {
+    "start": "First packet",
+    "launch": "Launch",
+    "apogee": "Apogee",
+    "heatshield": "Heat shield",
+    "parachute": "Parachute",
+}
+
+
+def find_events(data, seconds):
+    """{event: seconds} of the EVENTS found in a flight; start is always 0."""
+    events = {"start": 0.0}
+    launch = None
+    if "STATE" in data:
+        hits = np.flatnonzero(data["STATE"].fillna("").str.strip().str.upper().to_numpy(dtype=str) == "ASCENT")
+        launch = hits[0] if len(hits) else None
+    altitude = data["ALTITUDE"].to_numpy(dtype=float, na_value=np.nan) if "ALTITUDE" in data else None
+    if altitude is not None and np.isfinite(altitude).any():
+        if launch is None:
+            ground = altitude[np.flatnonzero(np.isfinite(altitude))[0]]
+            with np.errstate(invalid="ignore"):
+                hits = np.flatnonzero(altitude > ground + LAUNCH_CLIMB)
+            launch = hits[0] if len(hits) else None
+        events["apogee"] = seconds[np.nanargmax(altitude)]
+    if launch is not None:
+        events["launch"] = seconds[launch]
+    for event, field in (("heatshield", "HS_DEPLOYED"), ("parachute", "PC_DEPLOYED")):
+        hits = np.flatnonzero(deployed(data, field))
+        if len(hits):
+            events[event] = seconds[hits[0]]
+    return {event: float(t) for event, t in events.items()}
+
+
+def cache_dir(path, root=FLIGHT_CACHE):
+    """Cache directory of a CSV; a new one whenever the file changes."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{CACHE_VERSION}"
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(root, f"{name}-{hashlib.sha1(key.encode()).hexdigest()[:12]}")
+
+
+def pyramid_levels(values):
+    """[(low, high)] min/max pyramid of `values`: BLOCK samples per bin, then 4x coarser per level."""
+    low = high = values
+    levels = []
+    step = BLOCK
+    while len(low) > 1:
+        starts = np.arange(0, len(low), step)
+        low, high = np.fmin.reduceat(low, starts), np.fmax.reduceat(high, starts)
+        levels.append((low, high))
+        step = 4
+    return levels
+
+
+def convert_flight(path, directory):
+    """Write a CSV's stamped packets as SECONDS.npy plus <field>.npy, and flight.json.
+
+    The pyramid of each field goes to <field>.low.npy and <field>.high.npy,
+    all levels back to back, finest first. Raises ValueError for a flight
+    without a single MISSION_TIME stamp, which has nothing to overlay.
+    """
+    data, bad_rows = read_flight(path)
+    seconds = np.full(len(data), np.nan)
+    if "MISSION_TIME" in data:
+        seconds = elapsed(MissionClock().extend(data["MISSION_TIME"].fillna("").to_numpy(dtype=str)))
+    keep = np.isfinite(seconds)  # packets before the first stamp have no place on a time axis
+    if not keep.any():
+        raise ValueError(f"{os.path.basename(path)} has no packets" if len(data) == 0
+                         else f"{os.path.basename(path)} has no MISSION_TIME stamps")
+    data = data[keep].reset_index(drop=True)
+    seconds = seconds[keep]
+    tmp = directory + ".tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+    np.save(os.path.join(tmp, "SECONDS.npy"), seconds)
+    fields = [field for field in NUMERIC_FIELDS if field in data]
+    levels = [len(low) for low, _ in pyramid_levels(seconds)]
+    for field in fields:
+        values = data[field].to_numpy(dtype=float, na_value=np.nan)
+        np.save(os.path.join(tmp, f"{field}.npy"), values)
+        pyramid = pyramid_levels(values)
+        for name, side in (("low", 0), ("high", 1)):
+            stacked = np.concatenate([np.empty(0)] + [level[side] for level in pyramid])
+            np.save(os.path.join(tmp, f"{field}.{name}.npy"), stacked)
+    meta = {"name": os.path.basename(path), "source": os.path.abspath(path), "packets": len(data),
+            "bad_rows": bad_rows, "fields": fields, "levels": levels, "events": find_events(data, seconds)}
+    with open(os.path.join(tmp, "flight.json"), "w") as f:
+        json.dump(meta, f)
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp, directory)
+
+
+def bin_extremes(low, high, starts, stop):
+    """fmin of `low` and fmax of `high` over [starts[i], starts[i + 1]) (the last bin ends at `stop`).
+
+    Bins with no samples are NaN.
+    """
+    first = starts[0]
+    low, high = low[first:stop], high[first:stop]
+    bounds = np.append(starts, stop) - first
+    empty = bounds[1:] <= bounds[:-1]
+    if len(low) == 0:
+        nan = np.full(len(starts), np.nan)
+        return nan, nan.copy()
+    clipped = np.minimum(bounds[:-1], len(low) - 1)
+    lows = np.fmin.reduceat(low, clipped)
+    highs = np.fmax.reduceat(high, clipped)
+    lows[empty] = highs[empty] = np.nan
+    return lows, highs
+
+
+class ArchivedFlight:
+    """A converted flight: memory-mapped columns, event times and per-field min/max pyramids.
+
+    Level k of a pyramid holds the min and max of every BLOCK * 4**k
+    samples, so reducing any time range to one min/max pair per pixel
+    touches a few thousand values whatever the length of the flight.
+    """
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, "flight.json")) as f:
+            meta = json.load(f)
+        self.directory = directory
+        self.name = meta["name"]
+        self.fields = meta["fields"]
+        self.events = meta["events"]
+        self.levels = meta["levels"]
+        self.bad_rows = meta["bad_rows"]  # malformed rows of the CSV left out
+        self.seconds = np.load(os.path.join(directory, "SECONDS.npy"), mmap_mode="r")
+        self.columns = {}
+        self.pyramids = {}
+
+    @classmethod
+    def open(cls, path, root=FLIGHT_CACHE):
+        """Flight from a CSV, converted first if it is not cached yet."""
+        directory = cache_dir(path, root)
+        if not os.path.exists(os.path.join(directory, "flight.json")):
+            convert_flight(path, directory)
+        return cls(directory)
+
+    def __len__(self):
+        return len(self.seconds)
+
+    def duration(self):
+        return float(self.seconds[-1]) if len(self.seconds) else 0.0
+
+    def column(self, field):
+        if field not in self.columns:
+            if field in self.fields:
+                self.columns[field] = np.load(os.path.join(self.directory, f"{field}.npy"), mmap_mode="r")
+            else:
+                self.columns[field] = np.full(len(self), np.nan)
+        return self.columns[field]
+
+    def pyramid(self, field):
+        """[(low, high)] of `field`, finest level first."""
+        if field not in self.pyramids:
+            bounds = np.cumsum([0] + self.levels)
+            if field in self.fields:
+                low, high = (np.load(os.path.join(self.directory, f"{field}.{name}.npy"), mmap_mode="r")
+                             for name in ("low", "high"))
+            else:
+                low = high = np.full(bounds[-1], np.nan)
+            self.pyramids[field] = [(low[a:b], high[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+        return self.pyramids[field]
+
+    def decimate(self, field, edges):
+        """Points (seconds, values) drawing `field` between `edges[0]` and `edges[-1]`.
+
+        With fewer samples than two per bin the samples themselves (plus one
+        beyond each edge); otherwise the min and max of each bin between
+        consecutive `edges`, from the coarsest pyramid level that still has
+        two blocks per bin.
+        """
+        positions = np.searchsorted(self.seconds, edges)
+        lo, hi = int(positions[0]), int(positions[-1])
+        bins = len(edges) - 1
+        if hi - lo <= 2 * bins:
+            lo, hi = max(lo - 1, 0), min(hi + 1, len(self))
+            return np.asarray(self.seconds[lo:hi]), np.asarray(self.column(field)[lo:hi])
+        per_bin = (hi - lo) / bins
+        block, level = 1, None
+        for k in range(len(self.pyramid(field))):
+            if 2 * BLOCK * 4 ** k > per_bin:
+                break
+            block, level = BLOCK * 4 ** k, k
+        if level is None:
+            values = self.column(field)
+            low, high = bin_extremes(values, values, positions[:-1], hi)
+        else:
+            low, high = self.pyramid(field)[level]
+            low, high = bin_extremes(low, high, positions[:-1] // block, -(-hi // block))
+        return np.repeat(edges[:-1], 2), np.column_stack([low, high]).ravel()
+
+    def sample(self, field, times):
+        """`field` linearly interpolated at `times` (seconds), NaN outside the flight."""
+        if len(self) < 2:
+            return np.full(len(times), np.nan)
+        # np.interp would read the whole mapped column; this only touches the neighbours of `times`
+        i = np.clip(np.searchsorted(self.seconds, times, side="right"), 1, len(self) - 1)
+        t0, t1 = self.seconds[i - 1], self.seconds[i]
+        values = self.column(field)
+        v0, v1 = values[i - 1], values[i]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = v0 + np.where(t1 > t0, (times - t0) / (t1 - t0), 0.0) * (v1 - v0)
+        result[(times < self.seconds[0]) | (times > self.seconds[-1])] = np.nan
+        return result
+
+
+class FlightLoader(QThread):
+    """Converts or opens flights off the GUI thread."""
+
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str, str)
+
+    def __init__(self, paths, root=FLIGHT_CACHE, parent=None):
+        super().__init__(parent)
+        self.paths = list(paths)
+        self.root = root
+
+    def run(self):
+        for path in self.paths:
+            try:
+                flight = ArchivedFlight.open(path, self.root)
+            except Exception as e:
+                self.failed.emit(path, str(e))
+                continue
+            self.loaded.emit(flight)
+
+
+class FlightOverlay(pg.GraphicsLayoutWidget):
+    """Several flights on the same panels, x = seconds from a chosen event of each flight.
+
+    All flights are decimated on the same per-pixel bins of the visible
+    range, redrawn at most 30 times a second while panning or zooming, so
+    the cost of a frame follows the plot width rather than the flight
+    lengths. With `differences` each panel shows every flight minus the
+    reference flight, both interpolated at the bin centres.
+    """
+
+    def __init__(self, fields=DEFAULT_PANELS, columns=3, parent=None):
+        super().__init__(parent)
+        self.setBackground('w')
+        self.fields = list(fields)
+        self.flights = []
+        self.event = "start"
+        self.reference = 0
+        self.differences = False
+        self.panels = {}
+        master = None
+        for i, field in enumerate(self.fields):
+            title, unit = FIELD_LABELS.get(field, (field, ""))
+            plot = self.addPlot(row=i // columns, col=i % columns)
+            plot.showGrid(x=True, y=True)
+            plot.setTitle(title)
+            plot.setLabel('left', f'{title} ({unit})' if unit else title)
+            plot.setXLink(master)
+            plot.vb.setAutoVisible(y=True)
+            master = master or plot
+            self.panels[field] = {'plot': plot, 'curves': []}
+        self.master = master
+        self.master.enableAutoRange(x=False)
+        self.legend = self.master.addLegend(offset=(-10, 10))
+        self.set_x_label()
+        self.range_proxy = pg.SignalProxy(self.master.vb.sigXRangeChanged, rateLimit=30, slot=self.redraw)
+        self.master.vb.sigResized.connect(self.redraw)  # the bins are one per pixel
+
+    def add_flight(self, flight):
+        color = pg.intColor(len(self.flights), hues=10)
+        for field, panel in self.panels.items():
+            curve = pg.PlotDataItem(pen=pg.mkPen(color=color, width=1),
+                                    name=flight.name if field == self.fields[0] else None)
+            panel['plot'].addItem(curve)
+            panel['curves'].append(curve)
+        self.flights.append(flight)
+        self.fit()
+
+    def clear_flights(self):
+        for panel in self.panels.values():
+            for curve in panel['curves']:
+                panel['plot'].removeItem(curve)
+            panel['curves'] = []
+        self.legend.clear()
+        self.flights = []
+        self.reference = 0
+
+    def offset(self, flight):
+        """Flight seconds of the alignment event, 0 (first packet) if the flight lacks it."""
+        return flight.events.get(self.event, 0.0)
+
+    def missing_event(self):
+        """Names of the flights without the alignment event."""
+        return [flight.name for flight in self.flights if self.event not in flight.events]
+
+    def set_event(self, event):
+        self.event = event
+        self.set_x_label()
+        self.fit()
+
+    def set_reference(self, index):
+        self.reference = index
+        self.redraw()
+
+    def set_differences(self, differences):
+        self.differences = differences
+        self.set_x_label()
+        self.redraw()
+
+    def set_x_label(self):
+        label = f"Time from {EVENTS[self.event].lower()} (s)"
+        for field, panel in self.panels.items():
+            panel['plot'].setLabel('bottom', label)
+            title = FIELD_LABELS.get(field, (field, ""))[0]
+            panel['plot'].setTitle(f"{title} - reference" if self.differences else title)
+
+    def fit(self):
+        """Show the aligned time span of every flight."""
+        if not self.flights:
+            return
+        start = min(-self.offset(flight) for flight in self.flights)
+        stop = max(flight.duration() - self.offset(flight) for flight in self.flights)
+        self.master.setXRange(start, max(stop, start + 1), padding=0.02)
+        self.redraw()
+
+    def redraw(self, *_):
+        if not self.flights:
+            return
+        x0, x1 = self.master.vb.viewRange()[0]
+        pixels = max(int(self.master.vb.width()), 100)
+        edges = np.linspace(x0, x1, pixels + 1)
+        centres = (edges[:-1] + edges[1:]) / 2
+        reference = min(self.reference, len(self.flights) - 1)
+        for field, panel in self.panels.items():
+            if self.differences:
+                base = self.flights[reference].sample(field, centres + self.offset(self.flights[reference]))
+            for i, (flight, curve) in enumerate(zip(self.flights, panel['curves'])):
+                offset = self.offset(flight)
+                if not self.differences:
+                    x, y = flight.decimate(field, edges + offset)
+                    x = x - offset
+                elif i == reference:
+                    x = y = np.empty(0)
+                else:
+                    x, y = centres, flight.sample(field, centres + offset) - base
+                # An unbroken line takes pyqtgraph's much faster polyline path
+                curve.setData(x, y, connect='all' if np.isfinite(y).all() else 'finite')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("flights", nargs="+")
+    parser.add_argument("--event", choices=list(EVENTS), default="start")
+    parser.add_argument("--reference", type=int, default=0, help="index of the reference flight")
+    parser.add_argument("--differences", action="store_true", help="plot each flight minus the reference")
+    parser.add_argument("--fields", nargs="+", default=DEFAULT_PANELS)
+    args = parser.parse_args()
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+    overlay = FlightOverlay(args.fields)
+    overlay.event = args.event
+    overlay.reference = args.reference
+    overlay.set_differences(args.differences)
+    for path in args.flights:
+        try:
+            overlay.add_flight(ArchivedFlight.open(path))
+        except ValueError as e:
+            print(f"Skipped: {e}")
+    if not overlay.flights:
+        print("No flight to overlay")
+        return 1
+    missing = overlay.missing_event()
+    if missing:
+        print(f"No {args.event} in {', '.join(missing)}; aligned on the first packet")
+    overlay.setWindowTitle("Flight overlay")
+    overlay.resize(1400, 800)
+    overlay.show()
+    return app.exec_()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
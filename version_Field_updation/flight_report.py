@@ -0,0 +1,252 @@
+"""Render a post-flight report (plot panels + event timeline) without a display.
+
+    python flight_report.py FLIGHT.csv [-o report.png|report.pdf] [--fields F ...] [--width 1800]
+
+Each series is reduced to a min/max pair per output pixel column before it
+is drawn, and the panels are painted onto separate QImages in parallel.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+if "DISPLAY" not in os.environ and "QT_QPA_PLATFORM" not in os.environ:
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+import pyqtgraph as pg
+from PyQt5.QtCore import QMarginsF, QPointF, QRectF, QSize, QSizeF, Qt
+from PyQt5.QtGui import (QColor, QFont, QGuiApplication, QImage, QPageSize, QPainter, QPdfWriter, QPen,
+    QTransform)
+
+from flight_batch import read_flight
+from mission_time import MissionClock, elapsed
+from plot_grid import DEFAULT_PANELS
+from telemetry_store import FIELD_LABELS
+
+COLUMNS = 3
+PANEL_HEIGHT = 380
+TIMELINE_HEIGHT = 170
+MARGIN = (70, 40, 20, 45)  # left, top, right, bottom of each plot area (px)
+
+
+def decimate(x, y, pixels):
+    """Min and max of `y` in each of `pixels` x bins: all a line that wide can show."""
+    if len(x) <= 2 * pixels:
+        return x, y
+    edges = np.linspace(x[0], x[-1], pixels + 1)[:-1]
+    starts = np.unique(np.searchsorted(x, edges))
+    low = np.fmin.reduceat(y, starts)
+    high = np.fmax.reduceat(y, starts)
+    return np.repeat(x[starts], 2), np.column_stack([low, high]).ravel()
+
+
+def nice_ticks(low, high, count=6):
+    """Round tick positions (1, 2, 5 x 10^k steps) covering [low, high]."""
+    if not (np.isfinite(low) and np.isfinite(high)) or high <= low:
+        return []
+    raw = (high - low) / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    ticks = np.arange(math.ceil(low / step) * step, high + step / 2, step)
+    return [t for t in ticks if t <= high + step * 1e-9]
+
+
+def flight_events(data, seconds):
+    """[(seconds, label)] for state changes, apogee and deployments."""
+    events = []
+    if "STATE" in data:
+        states = data["STATE"].fillna("").to_numpy(dtype=str)
+        changes = np.flatnonzero(states[1:] != states[:-1]) + 1
+        for i in np.concatenate([[0], changes]):
+            if states[i]:
+                events.append((seconds[i], states[i]))
+    for field, label in (("HS_DEPLOYED", "Heat shield"), ("PC_DEPLOYED", "Parachute")):
+        if field in data:
+            hits = np.flatnonzero(data[field].fillna("N").str.strip().to_numpy(dtype=str) != "N")
+            if len(hits):
+                events.append((seconds[hits[0]], label))
+    if "ALTITUDE" in data:
+        altitude = data["ALTITUDE"].to_numpy(dtype=float, na_value=np.nan)
+        if np.isfinite(altitude).any():
+            apogee = np.nanargmax(altitude)
+            events.append((seconds[apogee], f"Apogee {altitude[apogee]:g} m"))
+    return sorted(events, key=lambda event: event[0])
+
+
+def plot_area(size):
+    left, top, right, bottom = MARGIN
+    return QRectF(left, top, size.width() - left - right, size.height() - top - bottom)
+
+
+def draw_axes(painter, area, x_range, y_range, title, x_label, y_ticks=True):
+    """Frame, grid, tick labels and title; returns the data -> pixel transform."""
+    (x0, x1), (y0, y1) = x_range, y_range
+    transform = QTransform()
+    transform.translate(area.left(), area.bottom())
+    transform.scale(area.width() / (x1 - x0), -area.height() / (y1 - y0))
+    transform.translate(-x0, -y0)
+
+    painter.setFont(QFont('Arial', 9))
+    grid = QPen(QColor(225, 225, 225))
+    for x in nice_ticks(x0, x1):
+        px = transform.map(QPointF(x, y0)).x()
+        painter.setPen(grid)
+        painter.drawLine(QPointF(px, area.top()), QPointF(px, area.bottom()))
+        painter.setPen(Qt.black)
+        painter.drawText(QRectF(px - 40, area.bottom() + 4, 80, 16), Qt.AlignHCenter, f"{x:g}")
+    for y in nice_ticks(y0, y1, 5) if y_ticks else []:
+        py = transform.map(QPointF(x0, y)).y()
+        painter.setPen(grid)
+        painter.drawLine(QPointF(area.left(), py), QPointF(area.right(), py))
+        painter.setPen(Qt.black)
+        painter.drawText(QRectF(0, py - 8, area.left() - 6, 16), Qt.AlignRight | Qt.AlignVCenter, f"{y:g}")
+    painter.setPen(Qt.black)
+    painter.drawRect(area)
+    painter.drawText(QRectF(area.left(), area.bottom() + 22, area.width(), 16), Qt.AlignHCenter, x_label)
+    painter.setFont(QFont('Arial', 11, QFont.Bold))
+    painter.drawText(QRectF(area.left(), 8, area.width(), 24), Qt.AlignHCenter, title)
+    return transform
+
+
+def padded_range(values):
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return 0.0, 1.0
+    low, high = float(finite.min()), float(finite.max())
+    pad = (high - low) * 0.05 or 1.0
+    return low - pad, high + pad
+
+
+def render_panel(field, x, y, size, x_label):
+    """One time-series panel as a QImage."""
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.white)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    area = plot_area(size)
+    title, unit = FIELD_LABELS.get(field, (field, ""))
+    xs, ys = decimate(x, y, int(area.width()))
+    transform = draw_axes(painter, area, (x[0], x[-1]) if x[-1] > x[0] else (x[0], x[0] + 1),
+                          padded_range(ys), f"{title} ({unit})" if unit else title, x_label)
+    painter.setClipRect(area)
+    painter.setTransform(transform)
+    pen = QPen(QColor('blue'), 1.5)
+    pen.setCosmetic(True)
+    painter.setPen(pen)
+    painter.drawPath(pg.arrayToQPath(xs, ys, connect='finite'))
+    painter.end()
+    return image
+
+
+def render_timeline(events, x_range, size, x_label):
+    """Event markers along the mission time axis, each label on the first row where it fits."""
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.white)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    area = plot_area(size)
+    transform = draw_axes(painter, area, x_range, (0, 1), "Event timeline", x_label, y_ticks=False)
+    painter.setFont(QFont('Arial', 9))
+    metrics = painter.fontMetrics()
+    row_ends = [-math.inf] * int((area.height() - 4) // 16)  # right edge of the last label per row
+    for t, label in events:
+        if not np.isfinite(t):
+            continue
+        px = transform.map(QPointF(t, 0)).x()
+        painter.setPen(QPen(QColor('darkRed'), 1.5))
+        painter.drawLine(QPointF(px, area.top()), QPointF(px, area.bottom()))
+        text = f"{label} ({t:g} s)"
+        row = next((i for i, end in enumerate(row_ends) if end < px), None)
+        if row is None:
+            continue  # marker only, no room left for its label
+        width = metrics.horizontalAdvance(text)
+        row_ends[row] = px + width + 8
+        painter.setPen(Qt.black)
+        painter.drawText(QRectF(px + 3, area.top() + 4 + row * 16, width + 2, 16), Qt.AlignLeft, text)
+    painter.end()
+    return image
+
+
+def load_flight(path):
+    """(data, x, x label, malformed rows skipped) of a recorded flight."""
+    data, bad_rows = read_flight(path)
+    x_label = "Mission time (s)"
+    x = np.full(len(data), np.nan)
+    if "MISSION_TIME" in data:
+        x = elapsed(MissionClock().extend(data["MISSION_TIME"].fillna("").to_numpy(dtype=str)))
+    if not np.isfinite(x).any():
+        x, x_label = np.arange(len(data), dtype=float), "Packet"
+    return data, x, x_label, bad_rows
+
+
+def render_report(path, output, fields=DEFAULT_PANELS, width=1800, workers=None):
+    """Render every panel and the timeline of one flight, then compose them into `output`.
+
+    Returns (packets drawn, malformed rows skipped); raises ValueError for a
+    flight without packets.
+    """
+    data, x, x_label, bad_rows = load_flight(path)
+    if len(data) == 0:
+        raise ValueError(f"{os.path.basename(path)} has no packets")
+    keep = np.isfinite(x)
+    fields = [field for field in fields if field in data]
+    panel_size = QSize(width // COLUMNS, PANEL_HEIGHT)
+    timeline_size = QSize(width, TIMELINE_HEIGHT)
+    series = {field: data[field].to_numpy(dtype=float, na_value=np.nan)[keep] for field in fields}
+    x = x[keep]
+    events = flight_events(data[keep], x)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        panels = list(pool.map(lambda field: render_panel(field, x, series[field], panel_size, x_label), fields))
+        timeline = pool.submit(render_timeline, events, (x[0], max(x[-1], x[0] + 1)), timeline_size, x_label).result()
+
+    rows = -(-len(panels) // COLUMNS)
+    page = QImage(width, rows * PANEL_HEIGHT + TIMELINE_HEIGHT, QImage.Format_ARGB32_Premultiplied)
+    page.fill(Qt.white)
+    painter = QPainter(page)
+    for i, panel in enumerate(panels):
+        painter.drawImage((i % COLUMNS) * panel_size.width(), (i // COLUMNS) * PANEL_HEIGHT, panel)
+    painter.drawImage(0, rows * PANEL_HEIGHT, timeline)
+    painter.end()
+
+    if output.lower().endswith(".pdf"):
+        writer = QPdfWriter(output)
+        writer.setResolution(150)
+        writer.setPageSize(QPageSize(QSizeF(page.width(), page.height()) * 25.4 / 150, QPageSize.Millimeter))
+        writer.setPageMargins(QMarginsF(0, 0, 0, 0))
+        painter = QPainter(writer)
+        painter.drawImage(QRectF(0, 0, writer.width(), writer.height()), page)
+        painter.end()
+    elif not page.save(output):
+        raise OSError(f"could not write {output}")
+    return len(data), bad_rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("flight")
+    parser.add_argument("-o", "--output", default="report.png")
+    parser.add_argument("--fields", nargs="+", default=DEFAULT_PANELS)
+    parser.add_argument("--width", type=int, default=1800)
+    args = parser.parse_args()
+
+    app = QGuiApplication(sys.argv[:1])  # text rendering needs a (headless) application
+    app.setFont(QFont('Arial', 9))
+    start = time.perf_counter()
+    try:
+        packets, bad_rows = render_report(args.flight, args.output, args.fields, args.width)
+    except ValueError as e:
+        print(f"No report written: {e}")
+        return 1
+    print(f"{packets} packets -> {args.output} in {time.perf_counter() - start:.2f} s")
+    if bad_rows:
+        print(f"WARNING: {bad_rows} malformed rows skipped")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
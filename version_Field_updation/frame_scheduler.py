@@ -0,0 +1,39 @@
+import time
+
+from PyQt5.QtCore import QObject, QTimer, Qt
+
+
+class FrameScheduler(QObject):
+    """Single display-rate timer that drives every animated view.
+
+    Views subscribe a callback taking the frame timestamp (time.monotonic()).
+    Data can arrive at any rate; rendering happens at most once per frame.
+    """
+
+    def __init__(self, fps=60, parent=None):
+        super().__init__(parent)
+        self.fps = fps
+        self.subscribers = []
+        self.frame_count = 0
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.setInterval(int(1000 / fps))
+        self.timer.timeout.connect(self.tick)
+
+    def subscribe(self, callback):
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+        if not self.subscribers:
+            self.timer.stop()
+
+    def tick(self):
+        now = time.monotonic()
+        self.frame_count += 1
+        for callback in list(self.subscribers):
+            callback(now)
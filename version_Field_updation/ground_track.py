@@ -0,0 +1,257 @@
+import math
+import os
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QGraphicsPixmapItem
+
+TILE_SIZE = 256
+MAX_ZOOM = 19
+TILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tiles")
+MISS_EXPIRY = 30.0  # seconds before a tile that was missing is looked up again
+
+
+def mercator(lat, lon):
+    """Project lat/lon (deg) to normalized Web Mercator x, y in [0, 1]."""
+    lat = np.clip(np.asarray(lat, dtype=float), -85.05112878, 85.05112878)
+    lon = np.asarray(lon, dtype=float)
+    x = (lon + 180.0) / 360.0
+    rad = np.radians(lat)
+    y = (1.0 - np.log(np.tan(rad) + 1.0 / np.cos(rad)) / math.pi) / 2.0
+    return x, y
+
+
+def simplify_track(x, y, tolerance):
+    """Douglas-Peucker simplification, returns the indices of kept points."""
+    n = len(x)
+    if n < 3:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        px, py = x[a + 1:b] - x[a], y[a + 1:b] - y[a]
+        norm = math.hypot(dx, dy)
+        if norm == 0:
+            dist = np.hypot(px, py)
+        else:
+            dist = np.abs(px * dy - py * dx) / norm
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            k = a + 1 + i
+            keep[k] = True
+            stack.append((a, k))
+            stack.append((k, b))
+    return np.flatnonzero(keep)
+
+
+class TileCache:
+    """Pre-seeded {z}/{x}/{y}.png tile directory with an LRU of decoded tiles.
+
+    Tiles are only read from disk; nothing is ever fetched from the network.
+    A missing or unreadable tile is remembered for `miss_expiry` seconds and
+    then looked up again, so tiles seeded while the GUI runs still show up.
+    """
+
+    def __init__(self, root=TILE_DIR, capacity=256, miss_expiry=MISS_EXPIRY):
+        self.root = root
+        self.capacity = capacity
+        self.miss_expiry = miss_expiry
+        self.tiles = OrderedDict()
+        self.misses = {}  # (z, x, y) -> time.monotonic() after which to retry
+
+    def path(self, z, x, y):
+        return os.path.join(self.root, str(z), str(x), f"{y}.png")
+
+    def get(self, z, x, y):
+        """Return the QPixmap for a tile, or None if it is not (yet) seeded."""
+        key = (z, x, y)
+        if key in self.tiles:
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+        now = time.monotonic()
+        if self.misses.get(key, now) > now:
+            return None
+        path = self.path(z, x, y)
+        pixmap = QPixmap(path) if os.path.exists(path) else None
+        if pixmap is None or pixmap.isNull():
+            self.misses[key] = now + self.miss_expiry
+            if len(self.misses) > self.capacity:
+                self.misses = {k: t for k, t in self.misses.items() if t > now}
+            return None
+        self.misses.pop(key, None)
+        self.tiles[key] = pixmap
+        while len(self.tiles) > self.capacity:
+            self.tiles.popitem(last=False)
+        return pixmap
+
+
+class TrackSimplifier:
+    """Incrementally simplified polyline for one zoom level.
+
+    Kept vertices are final; only the tail after the last one is re-simplified
+    when new points arrive, so a long trace is never reprocessed as a whole.
+    """
+
+    MAX_TAIL = 4096
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.indices = [0]
+
+    def update(self, x, y):
+        n = len(x)
+        if n == 0:
+            return np.empty(0, dtype=int)
+        anchor = self.indices[-1]
+        tail = simplify_track(x[anchor:n], y[anchor:n], self.tolerance) + anchor
+        # Interior vertices are kept from now on, the end point keeps moving
+        self.indices.extend(tail[1:-1].tolist())
+        if n - self.indices[-1] > self.MAX_TAIL:
+            # Straight stretches would otherwise keep the tail growing forever
+            self.indices.append(n - 1)
+        if self.indices[-1] == n - 1:
+            return np.asarray(self.indices)
+        return np.asarray(self.indices + [n - 1])
+
+
+class GroundTrackWidget(pg.PlotWidget):
+    """Ground-track panel: GPS trajectory drawn over cached map tiles."""
+
+    def __init__(self, store, tile_cache=None, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.tile_cache = tile_cache or TileCache()
+        self.setBackground('w')
+        self.setTitle("Ground Track")
+        self.setAspectLocked(True)
+        self.getViewBox().invertY(True)
+        self.hideAxis('left')
+        self.hideAxis('bottom')
+
+        self.track_curve = self.plot(pen=pg.mkPen(color='r', width=2))
+        self.track_curve.setZValue(10)
+        self.position_marker = self.plot(symbol='o', symbolSize=8, symbolBrush='r', pen=None)
+        self.position_marker.setZValue(11)
+
+        self.x = np.empty(1024)
+        self.y = np.empty(1024)
+        self.count = 0
+        self.consumed = 0
+        self.generation = store.generation
+        self.zoom = None
+        self.simplifiers = {}
+        self.tile_items = {}
+        self.missing_tiles = False  # some tile in view was not found, retry on update
+        self.getViewBox().sigRangeChanged.connect(self.on_range_changed)
+
+    def reset(self):
+        self.count = 0
+        self.consumed = 0
+        self.generation = self.store.generation
+        self.simplifiers = {}
+        self.track_curve.setData([], [])
+        self.position_marker.setData([], [])
+
+    def update_track(self):
+        """Pull packets appended to the store since the last call and redraw."""
+        total = len(self.store)
+        if self.generation != self.store.generation:  # the store was cleared
+            self.reset()
+        if not self.isVisible():
+            return
+        if self.missing_tiles:
+            self.load_tiles()
+        if total == self.consumed:
+            return
+        lat = self.store.column("GPS_LATITUDE")[self.consumed:total]
+        lon = self.store.column("GPS_LONGITUDE")[self.consumed:total]
+        self.consumed = total
+        valid = np.isfinite(lat) & np.isfinite(lon) & ((lat != 0) | (lon != 0))
+        if not valid.any():
+            return
+        x, y = mercator(lat[valid], lon[valid])
+        self._append(x, y)
+        first_fix = self.zoom is None
+        if first_fix:
+            self.center_on(self.x[self.count - 1], self.y[self.count - 1], zoom=16)
+        else:
+            self.redraw()
+
+    def _append(self, x, y):
+        needed = self.count + len(x)
+        if needed > len(self.x):
+            size = max(needed, 2 * len(self.x))
+            self.x = np.resize(self.x, size)
+            self.y = np.resize(self.y, size)
+        self.x[self.count:needed] = x
+        self.y[self.count:needed] = y
+        self.count = needed
+
+    def center_on(self, x, y, zoom):
+        span = self.width() / (TILE_SIZE * 2 ** zoom)
+        self.setRange(xRange=(x - span / 2, x + span / 2),
+                      yRange=(y - span / 2, y + span / 2), padding=0)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_track()
+
+    def current_zoom(self):
+        (x0, x1), _ = self.getViewBox().viewRange()
+        width = max(x1 - x0, 1e-12)
+        pixels = max(self.getViewBox().width(), 1)
+        zoom = round(math.log2(pixels / (TILE_SIZE * width)))
+        return int(min(max(zoom, 0), MAX_ZOOM))
+
+    def on_range_changed(self, *args):
+        self.zoom = self.current_zoom()
+        self.load_tiles()
+        self.redraw()
+
+    def redraw(self):
+        if self.count == 0 or self.zoom is None:
+            return
+        x, y = self.x[:self.count], self.y[:self.count]
+        simplifier = self.simplifiers.get(self.zoom)
+        if simplifier is None:
+            # Half a screen pixel at this zoom level
+            simplifier = TrackSimplifier(0.5 / (TILE_SIZE * 2 ** self.zoom))
+            self.simplifiers[self.zoom] = simplifier
+        keep = simplifier.update(x, y)
+        self.track_curve.setData(x[keep], y[keep])
+        self.position_marker.setData([x[-1]], [y[-1]])
+
+    def load_tiles(self):
+        """Show the cached tiles covering the view, dropping the rest."""
+        z = self.zoom
+        scale = 2 ** z
+        (x0, x1), (y0, y1) = self.getViewBox().viewRange()
+        tx0, tx1 = max(int(x0 * scale), 0), min(int(x1 * scale), scale - 1)
+        ty0, ty1 = max(int(y0 * scale), 0), min(int(y1 * scale), scale - 1)
+        wanted = set()
+        self.missing_tiles = False
+        if (tx1 - tx0 + 1) * (ty1 - ty0 + 1) <= 64:
+            wanted = {(z, tx, ty) for tx in range(tx0, tx1 + 1) for ty in range(ty0, ty1 + 1)}
+
+        for key in list(self.tile_items):
+            if key not in wanted:
+                self.removeItem(self.tile_items.pop(key))
+        for key in wanted - set(self.tile_items):
+            pixmap = self.tile_cache.get(*key)
+            if pixmap is None:
+                self.missing_tiles = True
+                continue
+            item = QGraphicsPixmapItem(pixmap)
+            item.setPos(key[1] / scale, key[2] / scale)
+            item.setScale(1.0 / (pixmap.width() * scale))
+            item.setZValue(-10)
+            self.addItem(item)
+            self.tile_items[key] = item
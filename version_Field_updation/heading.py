@@ -0,0 +1,42 @@
+import numpy as np
+
+
+class Heading:
+    """Yaw angle of a store, its ROT_Z rate integrated over MISSION_SECONDS.
+
+    ROT_Z is a rotation rate (deg/s), so each packet adds its rate times the
+    time since the previous stamped packet; packets at the same stamp add
+    nothing, and packets without a stamp or rate, or where the clock went
+    back, are skipped. Only the packets stored since the last call are
+    integrated, and a cleared store starts again from 0 deg.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.reset()
+
+    def reset(self):
+        self.generation = self.store.generation
+        self.integrated = 0       # packets added to `yaw` so far
+        self.yaw = 0.0            # degrees, 0..360
+        self.last_stamp = np.nan  # MISSION_SECONDS of the last stamped packet integrated
+
+    def update(self):
+        """Yaw in degrees after the latest stored packet."""
+        if self.generation != self.store.generation:
+            self.reset()
+        length = len(self.store)
+        if length == self.integrated:
+            return self.yaw
+        seconds = self.store.column("MISSION_SECONDS")[self.integrated:length]
+        rates = self.store.column("ROT_Z")[self.integrated:length]
+        stamped = np.isfinite(seconds)
+        seconds, rates = seconds[stamped], rates[stamped]
+        elapsed = np.diff(seconds, prepend=self.last_stamp)
+        steps = rates * elapsed
+        valid = np.isfinite(steps) & (elapsed > 0)
+        self.yaw = float((self.yaw + steps[valid].sum()) % 360.0)
+        if len(seconds):
+            self.last_stamp = seconds[-1]
+        self.integrated = length
+        return self.yaw
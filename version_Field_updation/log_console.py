@@ -0,0 +1,188 @@
+import time
+
+import numpy as np
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QListView, QAbstractItemView
+
+LEVELS = ["RAW", "DEBUG", "INFO", "WARNING", "ERROR"]
+LEVEL_COLORS = {
+    "RAW": QColor('gray'),
+    "DEBUG": QColor('darkCyan'),
+    "INFO": QColor('black'),
+    "WARNING": QColor('darkOrange'),
+    "ERROR": QColor('red'),
+}
+
+
+class RingIndex:
+    """Fixed-size FIFO of int64 with O(1) append, pop-front and random access.
+
+    Positions are absolute: `popped` entries have left the front and
+    `appended` entries have been added in total.
+    """
+
+    def __init__(self, capacity):
+        self.values = np.zeros(capacity, dtype=np.int64)
+        self.appended = 0
+        self.popped = 0
+
+    def __len__(self):
+        return self.appended - self.popped
+
+    def append(self, value):
+        self.values[self.appended % len(self.values)] = value
+        self.appended += 1
+
+    def pop_below(self, limit):
+        """Drop front entries smaller than `limit`."""
+        size = len(self.values)
+        while self.popped < self.appended and self.values[self.popped % size] < limit:
+            self.popped += 1
+
+    def at(self, position):
+        """Entry at absolute `position`, None once it has left the ring."""
+        if self.popped <= position < self.appended:
+            return int(self.values[position % len(self.values)])
+        return None
+
+
+class LogBuffer:
+    """Bounded ring of log lines with a precomputed index per level threshold.
+
+    index[k] holds the sequence numbers of the retained entries whose level
+    is at least LEVELS[k], so switching the filter never rescans the buffer.
+    """
+
+    def __init__(self, capacity=100000):
+        self.capacity = capacity
+        self.texts = [None] * capacity
+        self.levels = np.zeros(capacity, dtype=np.int8)
+        self.times = np.zeros(capacity)
+        self.count = 0
+        self.index = [RingIndex(capacity) for _ in LEVELS]
+
+    def append(self, level, text):
+        level = LEVELS.index(level) if isinstance(level, str) else level
+        seq = self.count
+        slot = seq % self.capacity
+        self.texts[slot] = text
+        self.levels[slot] = level
+        self.times[slot] = time.time()
+        self.count += 1
+        oldest = self.count - self.capacity
+        for threshold in range(level + 1):
+            self.index[threshold].append(seq)
+        if oldest > 0:
+            for ring in self.index:
+                ring.pop_below(oldest)
+
+    def entry(self, seq):
+        """(level, time, text) of entry `seq`, None if it was overwritten."""
+        if seq is None or seq < self.count - self.capacity or seq >= self.count:
+            return None
+        slot = seq % self.capacity
+        return int(self.levels[slot]), self.times[slot], self.texts[slot]
+
+
+class LogModel(QAbstractListModel):
+    """Virtual list over a LogBuffer: rows are looked up only when the view draws them.
+
+    New and evicted lines are announced to the view in batches every
+    `interval` ms, so a flood of raw packets costs one update per tick.
+    """
+
+    def __init__(self, buffer, threshold="INFO", interval=100, parent=None):
+        super().__init__(parent)
+        self.buffer = buffer
+        self.threshold = LEVELS.index(threshold)
+        self.first = 0  # absolute index position of row 0
+        self.rows = 0
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.flush)
+        self.timer.start(interval)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self.buffer.entry(self.buffer.index[self.threshold].at(self.first + index.row()))
+        if entry is None:
+            return None
+        level, stamp, text = entry
+        if role == Qt.DisplayRole:
+            clock = time.strftime("%H:%M:%S", time.localtime(stamp))
+            return f"{clock} {LEVELS[level]:<7} {text}"
+        if role == Qt.ForegroundRole:
+            return LEVEL_COLORS[LEVELS[level]]
+        return None
+
+    def set_threshold(self, level):
+        self.beginResetModel()
+        self.threshold = LEVELS.index(level) if isinstance(level, str) else level
+        ring = self.buffer.index[self.threshold]
+        self.first, self.rows = ring.popped, len(ring)
+        self.endResetModel()
+
+    def flush(self):
+        """Tell the view about rows evicted from the front and appended at the end."""
+        ring = self.buffer.index[self.threshold]
+        removed = min(ring.popped - self.first, self.rows)
+        if ring.popped - self.first > self.rows:
+            self.set_threshold(self.threshold)
+            return
+        if removed > 0:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            self.first += removed
+            self.rows -= removed
+            self.endRemoveRows()
+        added = ring.appended - (self.first + self.rows)
+        if added > 0:
+            self.beginInsertRows(QModelIndex(), self.rows, self.rows + added - 1)
+            self.rows += added
+            self.endInsertRows()
+
+
+class LogConsole(QListView):
+    """Log view that follows the newest line unless the user scrolled up."""
+
+    def __init__(self, buffer=None, threshold="INFO", parent=None):
+        super().__init__(parent)
+        self.buffer = buffer or LogBuffer()
+        self.log_model = LogModel(self.buffer, threshold, parent=self)
+        self.setModel(self.log_model)
+        self.setUniformItemSizes(True)  # lets the view skip measuring every row
+        self.setLayoutMode(QListView.Batched)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setFont(QFont('Monospace', 9))
+        self.follow = True
+        self.verticalScrollBar().valueChanged.connect(self.on_scroll)
+        self.log_model.rowsInserted.connect(self.on_rows_inserted)
+
+    def log(self, level, text):
+        self.buffer.append(level, text)
+
+    def set_threshold(self, level):
+        self.log_model.set_threshold(level)
+        self.scrollToBottom()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.log_model.flush()
+        self.log_model.timer.start()
+        if self.follow:
+            self.scrollToBottom()
+
+    def hideEvent(self, event):
+        # Lines keep going into the buffer; the view catches up when shown again
+        self.log_model.timer.stop()
+        super().hideEvent(event)
+
+    def on_scroll(self, value):
+        self.follow = value == self.verticalScrollBar().maximum()
+
+    def on_rows_inserted(self, *args):
+        if self.follow and self.isVisible():
+            self.scrollToBottom()
@@ -0,0 +1,88 @@
+import numpy as np
+
+DAY = 86400.0
+ROLLOVER = DAY / 2   # a clock jump back by more than this is a midnight rollover
+GAP_SECONDS = 5.0    # plots break the line across longer telemetry gaps
+
+_COLON = ord(":") - ord("0")
+
+
+def parse_clock(text):
+    """"HH:MM:SS" or "HH:MM:SS.ss" -> seconds since midnight, NaN if malformed."""
+    try:
+        hours, minutes, seconds = str(text).split(":")
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except ValueError:
+        return np.nan
+
+
+def parse_clock_array(values):
+    """Vectorized parse_clock for a whole chunk of timestamps.
+
+    Well-formed "HH:MM:SS" strings are decoded straight from their character
+    codes; anything else (fractional seconds, junk) goes through parse_clock.
+    """
+    text = np.asarray(values, dtype=str)
+    n = len(text)
+    seconds = np.full(n, np.nan)
+    if n == 0:
+        return seconds
+    width = text.dtype.itemsize // 4
+    ok = np.zeros(n, dtype=bool)
+    if width >= 8:
+        codes = np.ascontiguousarray(text).view(np.uint32).reshape(n, width).astype(np.int64) - ord("0")
+        digits = codes[:, [0, 1, 3, 4, 6, 7]]
+        ok = (codes[:, 2] == _COLON) & (codes[:, 5] == _COLON) & ((digits >= 0) & (digits <= 9)).all(axis=1)
+        if width > 8:
+            ok &= codes[:, 8] == -ord("0")  # exactly 8 characters (NUL padded)
+        d = digits[ok]
+        seconds[ok] = (d[:, 0] * 10 + d[:, 1]) * 3600 + (d[:, 2] * 10 + d[:, 3]) * 60 + d[:, 4] * 10 + d[:, 5]
+    for i in np.flatnonzero(~ok):
+        seconds[i] = parse_clock(text[i])
+    return seconds
+
+
+class MissionClock:
+    """Turns MISSION_TIME stamps into continuous seconds as packets arrive.
+
+    Midnight rollovers add a day instead of jumping back, and unparsable
+    stamps repeat the last good value so the result stays sorted.
+    """
+
+    def __init__(self):
+        self.offset = 0.0
+        self.last_raw = np.nan
+        self.last = np.nan
+
+    def reset(self):
+        self.__init__()
+
+    def push(self, text):
+        return self.extend([text])[0]
+
+    def extend(self, values):
+        raw = parse_clock_array(values)
+        valid = np.isfinite(raw)
+        if valid.any():
+            # Forward-fill invalid stamps from the previous valid one
+            index = np.where(valid, np.arange(len(raw)), -1)
+            np.maximum.accumulate(index, out=index)
+            filled = np.where(index >= 0, raw[np.maximum(index, 0)], self.last_raw)
+            previous = np.concatenate([[self.last_raw], filled[:-1]])
+            with np.errstate(invalid="ignore"):
+                rollovers = np.cumsum(filled - previous < -ROLLOVER)
+            result = filled + self.offset + DAY * rollovers
+            self.offset += DAY * rollovers[-1]
+            self.last_raw = filled[-1]
+            self.last = result[-1]
+            return result
+        return np.full(len(raw), self.last)
+
+
+def elapsed(seconds):
+    """Seconds since the first valid stamp."""
+    valid = np.flatnonzero(np.isfinite(seconds))
+    if len(valid) == 0:
+        return seconds
+    return seconds - seconds[valid[0]]
+
@@ -0,0 +1,54 @@
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QButtonGroup, QHBoxLayout, QPushButton, QStackedWidget
+
+
+class PageStack(QStackedWidget):
+    """Tabbed pages that are built the first time they are opened.
+
+    Each page is registered with a factory; until it is visited nothing of it
+    exists. `page_changed(old, new)` lets the window suspend the rendering of
+    the page that was just hidden and resume the one being shown.
+    """
+
+    page_changed = pyqtSignal(str, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.factories = {}
+        self.pages = {}
+        self.buttons = {}
+        self.current = None
+        self.group = QButtonGroup(self)
+        self.group.setExclusive(True)
+
+    def add_page(self, name, factory):
+        self.factories[name] = factory
+        button = QPushButton(name)
+        button.setCheckable(True)
+        button.clicked.connect(lambda checked, name=name: self.show_page(name))
+        self.group.addButton(button)
+        self.buttons[name] = button
+
+    def tab_bar(self):
+        """Row of tab buttons, one per registered page."""
+        layout = QHBoxLayout()
+        for button in self.buttons.values():
+            layout.addWidget(button)
+        return layout
+
+    def page(self, name):
+        """The page widget, None if it has not been built yet."""
+        return self.pages.get(name)
+
+    def show_page(self, name):
+        if name == self.current:
+            return
+        page = self.pages.get(name)
+        if page is None:
+            page = self.factories[name]()
+            self.pages[name] = page
+            self.addWidget(page)
+        previous, self.current = self.current, name
+        self.setCurrentWidget(page)
+        self.buttons[name].setChecked(True)
+        self.page_changed.emit(previous or "", name)
@@ -0,0 +1,239 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtWidgets import QMenu
+
+from mission_time import GAP_SECONDS
+from rolling_stats import RollingStats, ROLLING_FIELDS, STATS, STAT_LABELS, series_label, series_name
+from streaming_curve import StreamingCurve
+from telemetry_query import TelemetryQuery
+from telemetry_store import FIELD_LABELS, NUMERIC_FIELDS, format_value
+
+DEFAULT_PANELS = ["PRESSURE", "ALTITUDE", "TILT_X", "TEMPERATURE", "AIR_SPEED", "TILT_Y"]
+
+
+class PlotGrid(pg.GraphicsLayoutWidget):
+    """All telemetry plots in one GraphicsLayoutWidget (one view, one scene).
+
+    Every panel's x axis is linked to the first one, so panning or zooming
+    any plot moves them all in a single pass. Curves are StreamingCurves fed
+    only the packets appended since the last draw. Panels are created on
+    first use; removed panels are detached and kept for re-adding, and
+    neither they nor a hidden grid are updated.
+
+    Hovering a panel puts a crosshair on the nearest packet in every panel,
+    found by binary search on the query's time index, and emits `scrubbed`.
+
+    A panel shows either a stored field or a derived series of `rolling`
+    such as "ALTITUDE:MEAN", plotted the same way.
+    """
+
+    scrubbed = pyqtSignal(int)  # packet under the crosshair, -1 once the cursor leaves the plots
+
+    def __init__(self, store, fields=DEFAULT_PANELS, columns=3, x_label="Mission time (s)", query=None,
+                 rolling=None, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.query = query if query is not None else TelemetryQuery(store)
+        self.rolling = rolling if rolling is not None else RollingStats(store)
+        self.columns = columns
+        self.x_label = x_label
+        self.setBackground('w')
+        self.panels = {}
+        self.detached = {}
+        self.order = []
+        self.rendered = -1  # store length last drawn, -1 forces a redraw
+        self.origin = None  # first MISSION_SECONDS stamp; x is the packet index until there is one
+        self.cursor = None  # packet under the crosshair
+        self.generation = store.generation  # store generation the curves were drawn from
+        # At most one crosshair lookup per frame however fast the mouse moves
+        self.mouse_proxy = pg.SignalProxy(self.scene().sigMouseMoved, rateLimit=60, slot=self.mouse_moved)
+        for field in fields:
+            self.add_panel(field)
+
+    def create_panel(self, field):
+        title, unit = series_label(field, self.rolling.window)
+        plot = pg.PlotItem()
+        plot.showGrid(x=True, y=True)
+        plot.setLabel('left', f'{title} ({unit})' if unit else title)
+        plot.setLabel('bottom', self.x_label)
+        plot.setTitle(title)
+        curve = StreamingCurve(pen=pg.mkPen(color='b', width=2))
+        plot.addItem(curve)
+        line = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen(color='r', width=1))
+        label = pg.TextItem(color='k', fill=pg.mkBrush(255, 255, 255, 200), anchor=(0, 1))
+        for item in (line, label):
+            item.hide()
+            plot.addItem(item, ignoreBounds=True)
+        return {'plot': plot, 'curve': curve, 'line': line, 'label': label}
+
+    def add_panel(self, field):
+        if field in self.panels:
+            return self.panels[field]
+        panel = self.detached.pop(field, None) or self.create_panel(field)
+        panel['curve'].gap = GAP_SECONDS if self.origin is not None else None
+        self.panels[field] = panel
+        self.order.append(field)
+        self.relayout()
+        self.rendered = -1
+        self.update_curves()
+        return panel
+
+    def remove_panel(self, field):
+        if field not in self.panels:
+            return
+        panel = self.panels.pop(field)
+        self.order.remove(field)
+        self.ci.removeItem(panel['plot'])
+        panel['plot'].setXLink(None)
+        panel['curve'].clear()  # caught up from the store when re-added
+        panel['line'].hide()
+        panel['label'].hide()
+        self.detached[field] = panel
+        self.relayout()
+
+    def set_fields(self, fields):
+        for field in list(self.order):
+            if field not in fields:
+                self.remove_panel(field)
+        for field in fields:
+            self.add_panel(field)
+
+    def relayout(self):
+        """Place panels row by row and link every x axis to the first panel."""
+        for panel in self.panels.values():
+            if panel['plot'] in self.ci.items:
+                self.ci.removeItem(panel['plot'])
+        master = None
+        for i, field in enumerate(self.order):
+            plot = self.panels[field]['plot']
+            self.ci.addItem(plot, row=i // self.columns, col=i % self.columns)
+            plot.setXLink(master)
+            master = master or plot
+
+    def values(self, field, start=0, stop=None):
+        """Stored column or derived series of a panel, packets `start`..`stop`."""
+        if field in self.rolling:
+            return self.rolling.series(field, start, stop)
+        return self.store.column(field)[start:stop]
+
+    def x_data(self, start=0):
+        """Seconds since the first stamp of packets `start`..., packet index if there are no timestamps."""
+        if self.origin is None:
+            return np.arange(start, len(self.store), dtype=float)
+        return self.store.column("MISSION_SECONDS")[start:] - self.origin
+
+    def x_at(self, position):
+        if self.origin is None:
+            return float(position)
+        return self.store.column("MISSION_SECONDS")[position] - self.origin
+
+    def position_at(self, x):
+        """Packet nearest to plot coordinate `x`, None if there is none."""
+        if len(self.store) == 0:
+            return None
+        if self.origin is None:
+            return int(np.clip(round(x), 0, len(self.store) - 1))
+        return self.query.nearest(self.origin + x)
+
+    def mouse_moved(self, event):
+        pos = event[0]
+        for panel in self.panels.values():
+            view = panel['plot'].vb
+            if view.sceneBoundingRect().contains(pos):
+                self.set_cursor(self.position_at(view.mapSceneToView(pos).x()))
+                return
+        self.set_cursor(None)
+
+    def set_cursor(self, position):
+        """Put the crosshair of every panel on packet `position`; None hides it."""
+        if position is not None and not np.isfinite(self.x_at(position)):
+            position = None
+        if position == self.cursor:
+            return
+        self.cursor = position
+        for field, panel in self.panels.items():
+            panel['line'].setVisible(position is not None)
+            panel['label'].setVisible(position is not None)
+            if position is None:
+                continue
+            x = self.x_at(position)
+            value = self.values(field, position, position + 1)[0]
+            y = value if np.isfinite(value) else panel['plot'].vb.viewRange()[1][1]
+            panel['line'].setPos(x)
+            panel['label'].setText(format_value(field, value))
+            panel['label'].setPos(x, y)
+        self.scrubbed.emit(-1 if position is None else position)
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.set_cursor(None)
+
+    def find_origin(self, start):
+        """Switch the x axis to mission time at the first stamped packet after `start`."""
+        seconds = self.store.column("MISSION_SECONDS")[start:]
+        valid = np.flatnonzero(np.isfinite(seconds))
+        if len(valid) == 0:
+            return False
+        self.origin = seconds[valid[0]]
+        for panel in self.panels.values():
+            panel['curve'].gap = GAP_SECONDS
+        return True
+
+    def update_curves(self):
+        """Append the packets stored since the last draw to the shown panels."""
+        length = len(self.store)
+        if not self.isVisible():
+            return
+        if self.generation != self.store.generation:
+            self.clear_curves()  # the store was cleared behind our back
+        if length == self.rendered:
+            return
+        curves = [panel['curve'] for panel in self.panels.values()]
+        if self.origin is None and self.find_origin(max(self.rendered, 0)):
+            for curve in curves:
+                curve.clear()  # drawn against the packet index so far
+        self.rendered = length
+        if not curves:
+            return
+        start = min(len(curve) for curve in curves)
+        x = self.x_data(start)
+        for field, panel in self.panels.items():
+            curve = panel['curve']
+            drawn = len(curve)
+            curve.extend(x[drawn - start:], self.values(field, drawn))
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_curves()
+
+    def field_menu(self, parent=None):
+        """Checkable menu of every numeric field and rolling statistic; toggling adds or removes its panel."""
+        menu = QMenu(parent)
+        for field in NUMERIC_FIELDS:
+            self.add_field_action(menu, field, FIELD_LABELS.get(field, (field, "")))
+        menu.addSeparator()
+        for stat in STATS:
+            submenu = menu.addMenu(f"Rolling {STAT_LABELS[stat]}")
+            for field in ROLLING_FIELDS:
+                name = series_name(field, stat)
+                title = FIELD_LABELS.get(field, (field, ""))[0]
+                self.add_field_action(submenu, name, (title, series_label(name)[1]))
+        return menu
+
+    def add_field_action(self, menu, field, label):
+        title, unit = label
+        action = menu.addAction(f"{title} ({unit})" if unit else title)
+        action.setCheckable(True)
+        action.setChecked(field in self.panels)
+        action.toggled.connect(
+            lambda checked, field=field: self.add_panel(field) if checked else self.remove_panel(field))
+
+    def clear_curves(self):
+        self.set_cursor(None)
+        self.rendered = -1
+        self.origin = None
+        self.generation = self.store.generation
+        for panel in list(self.panels.values()) + list(self.detached.values()):
+            panel['curve'].gap = None
+            panel['curve'].clear()
@@ -0,0 +1,161 @@
+"""Processor plugins run over every batch of packets before it is stored.
+
+A processor declares the packet fields it `reads` and `writes` and gets
+each batch as NumPy columns:
+
+    class Fahrenheit(Processor):
+        reads = ("TEMPERATURE",)
+        writes = ("TEMPERATURE",)
+        budget_us = 2.0
+
+        def process(self, columns):
+            return {"TEMPERATURE": columns["TEMPERATURE"] * 1.8 + 32}
+
+Load one with `cansat_gui.py --processor module:name`, where name is a
+Processor instance or a class or function returning one.
+"""
+import importlib
+import time
+
+import numpy as np
+
+from telemetry_store import FIELDS, NUMERIC_FIELDS
+
+BATCH_ALLOWANCE_MS = 0.5  # fixed per-batch slack on top of the per-packet budget
+STRIKES = 3               # batches in a row over budget before a processor is disabled
+
+
+class Processor:
+    """Base class of a batch processor plugin.
+
+    process(columns) gets a dict of the `reads` columns of a batch
+    (numeric fields as float arrays, text fields as object arrays) and
+    returns a dict of new arrays for some or all of `writes`; the inputs
+    must not be modified in place. A batch may take BATCH_ALLOWANCE_MS
+    plus `budget_us` per packet.
+    """
+
+    name = None
+    reads = ()
+    writes = ()
+    budget_us = 10.0
+
+    def process(self, columns):
+        raise NotImplementedError
+
+    def __str__(self):
+        return self.name or type(self).__name__
+
+
+class LinearCalibration(Processor):
+    """value * scale + offset on one numeric field, e.g. a sensor calibration or unit conversion."""
+
+    def __init__(self, field, scale=1.0, offset=0.0, name=None):
+        self.reads = self.writes = (field,)
+        self.scale = scale
+        self.offset = offset
+        self.name = name or f"{field} calibration"
+
+    def process(self, columns):
+        field = self.reads[0]
+        return {field: columns[field] * self.scale + self.offset}
+
+
+def load_processor(spec):
+    """Processor named by "module:name" (an instance, or a class or function making one)."""
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"Processor spec must be module:name, got {spec!r}")
+    processor = getattr(importlib.import_module(module), name)
+    return processor if isinstance(processor, Processor) else processor()
+
+
+class ProcessorPipeline:
+    """Runs processors over each batch of packets, timing every run.
+
+    Processors run in the order added, a later one seeing what earlier ones
+    wrote. A processor over its budget for STRIKES batches in a row, or one
+    that raises or returns columns it did not declare or of the wrong
+    shape or type, is disabled and reported with `on_disabled(processor, reason)`;
+    the batch goes on without it.
+    """
+
+    def __init__(self, processors=(), strikes=STRIKES, on_disabled=None):
+        self.strikes = strikes
+        self.on_disabled = on_disabled
+        self.entries = []
+        for processor in processors:
+            self.add(processor)
+
+    def add(self, processor):
+        unknown = [field for field in tuple(processor.reads) + tuple(processor.writes) if field not in FIELDS]
+        if unknown:
+            raise ValueError(f"{processor}: unknown fields {', '.join(unknown)}")
+        self.entries.append({"processor": processor, "enabled": True, "reason": None,
+                             "batches": 0, "packets": 0, "seconds": 0.0, "last_ms": 0.0, "over": 0})
+        return processor
+
+    def run(self, columns):
+        """Dict of columns with every enabled processor's writes applied."""
+        count = len(columns[FIELDS[0]])
+        if count == 0 or not self.entries:
+            return columns
+        columns = dict(columns)
+        for entry in self.entries:
+            if not entry["enabled"]:
+                continue
+            processor = entry["processor"]
+            start = time.perf_counter()
+            try:
+                written = processor.process({field: columns[field] for field in processor.reads})
+                elapsed = time.perf_counter() - start
+                if not isinstance(written, dict):
+                    self.disable(entry, f"returned {type(written).__name__}, not a dict of columns")
+                    continue
+                bad = [field for field, values in written.items()
+                       if field not in processor.writes or np.shape(values) != (count,)]
+                if bad:
+                    self.disable(entry, f"returned bad columns {', '.join(map(str, bad))}")
+                    continue
+                written = {field: np.asarray(values, dtype=np.float64 if field in NUMERIC_FIELDS else object)
+                           for field, values in written.items()}
+            except Exception as e:
+                self.disable(entry, f"raised {type(e).__name__}: {e}")
+                continue
+            self.account(entry, count, elapsed)
+            columns.update(written)
+            if entry["over"] >= self.strikes:
+                self.disable(entry, f"over budget for {entry['over']} batches "
+                                    f"(last {entry['last_ms']:.2f} ms for {count} packets, "
+                                    f"budget {processor.budget_us:g} us/packet)")
+        return columns
+
+    def account(self, entry, count, elapsed):
+        entry["batches"] += 1
+        entry["packets"] += count
+        entry["seconds"] += elapsed
+        entry["last_ms"] = elapsed * 1000
+        budget = BATCH_ALLOWANCE_MS / 1000 + entry["processor"].budget_us * count / 1e6
+        entry["over"] = entry["over"] + 1 if elapsed > budget else 0
+
+    def disable(self, entry, reason):
+        entry["enabled"] = False
+        entry["reason"] = reason
+        if self.on_disabled is not None:
+            self.on_disabled(entry["processor"], reason)
+
+    def enable(self, processor):
+        for entry in self.entries:
+            if entry["processor"] is processor:
+                entry.update(enabled=True, reason=None, over=0)
+
+    def stats(self):
+        """One dict per processor: name, enabled, reason, batches, packets, mean_us (per packet), last_ms."""
+        return [{"name": str(entry["processor"]), "enabled": entry["enabled"], "reason": entry["reason"],
+                 "batches": entry["batches"], "packets": entry["packets"],
+                 "mean_us": entry["seconds"] * 1e6 / entry["packets"] if entry["packets"] else 0.0,
+                 "last_ms": entry["last_ms"]}
+                for entry in self.entries]
+
+    def __len__(self):
+        return len(self.entries)
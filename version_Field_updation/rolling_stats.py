@@ -0,0 +1,130 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from telemetry_store import FIELD_LABELS, NUMERIC_FIELDS
+
+WINDOW = 10  # packets per window; 10 s at the nominal 1 Hz
+STATS = ("MIN", "MAX", "MEAN", "STD", "RATE")
+STAT_LABELS = {"MIN": "min", "MAX": "max", "MEAN": "mean", "STD": "std", "RATE": "rate"}
+CHUNK = 65536  # packets computed at a time, bounding the window temporaries
+
+# Fields with rolling statistics; identifiers and counters have none worth showing
+ROLLING_FIELDS = [field for field in NUMERIC_FIELDS if field not in ("TEAM_ID", "PACKET_COUNT")]
+
+
+def series_name(field, stat):
+    """Name of a derived series, e.g. "ALTITUDE:MEAN"."""
+    return f"{field}:{stat}"
+
+
+def split_series(name):
+    """(field, stat) of a derived series name, (name, None) for a plain field."""
+    field, _, stat = name.partition(":")
+    return field, stat or None
+
+
+def format_stat(value):
+    return "-" if np.isnan(value) else f"{value:.4g}"
+
+
+def series_label(name, window=WINDOW):
+    """Plot title and unit of a plain field or derived series."""
+    field, stat = split_series(name)
+    title, unit = FIELD_LABELS.get(field, (field, ""))
+    if stat is None:
+        return title, unit
+    if stat == "RATE":
+        return f"{title} rate", f"{unit}/s" if unit else "1/s"
+    return f"{title} {STAT_LABELS[stat]} ({window} pkt)", unit
+
+
+def finite_or_nan(values):
+    return np.where(np.isfinite(values), values, np.nan)
+
+
+class RollingStats:
+    """Rolling statistics of every field in ROLLING_FIELDS over a store.
+
+    Every statistic at a packet is taken over the last `window` packets
+    and nothing before them, computed with NumPy over sliding windows of
+    just the packets asked for: a row costs O(window) however long the
+    store is, and a span O(window) per packet, with no per-packet state
+    to keep up during ingest. Min, max, mean and standard deviation skip
+    non-finite values. The rate is the finite difference between the
+    first values at the last two MISSION_SECONDS stamps in the window, so
+    packets sent faster than the clock's one-second resolution still get
+    one; a value without a stamp restarts it, and it is NaN until the
+    window holds two stamps again.
+    """
+
+    def __init__(self, store, fields=ROLLING_FIELDS, window=WINDOW):
+        self.store = store
+        self.fields = list(fields)
+        self.window = window
+
+    def windows(self, field, start, stop):
+        """Sliding windows [packet, window] of a column for packets start..stop, NaN before packet 0."""
+        first = start - self.window + 1
+        values = np.full(stop - first, np.nan)
+        values[max(-first, 0):] = self.store.column(field)[max(first, 0):stop]
+        return sliding_window_view(finite_or_nan(values), self.window)
+
+    def compute(self, fields, start, stop, stats=STATS):
+        """Array [field, packet, stat] of `fields` for packets start..stop, in `stats` order."""
+        windows = np.stack([self.windows(field, start, stop) for field in fields])
+        finite = ~np.isnan(windows)
+        count = finite.sum(axis=2)
+        results = {}
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if "MEAN" in stats or "STD" in stats:
+                results["MEAN"] = mean = np.where(finite, windows, 0.0).sum(axis=2) / count
+            if "STD" in stats:
+                deviation = np.where(finite, windows - mean[..., None], 0.0)
+                results["STD"] = np.where(count < 2, np.nan, np.sqrt((deviation ** 2).sum(axis=2) / (count - 1)))
+        if "MIN" in stats:
+            results["MIN"] = np.fmin.reduce(windows, axis=2)
+        if "MAX" in stats:
+            results["MAX"] = np.fmax.reduce(windows, axis=2)
+        if "RATE" in stats:
+            results["RATE"] = self.rate(windows, self.windows("MISSION_SECONDS", start, stop))
+        return np.stack([results[stat] for stat in stats], axis=2)
+
+    def rate(self, windows, stamps):
+        """Rate at the end of each window [field, packet, window], stamps [packet, window]."""
+        stamps = np.broadcast_to(stamps, windows.shape)
+        finite = ~np.isnan(windows)
+        stamped = ~np.isnan(stamps)
+        slot = np.arange(self.window)
+        # A value without a stamp drops everything before it
+        reset = np.where(finite & ~stamped, slot, -1).max(axis=2, keepdims=True)
+        valid = finite & stamped & (slot > reset)
+        # Heads: valid values whose stamp differs from the previous valid one in the window
+        previous = np.maximum.accumulate(np.where(valid, slot, -1), axis=2)
+        previous[..., 1:] = previous[..., :-1].copy()
+        previous[..., 0] = -1
+        before = np.take_along_axis(stamps, np.maximum(previous, 0), axis=2)
+        heads = valid & ((previous < 0) | (before != stamps))
+        last = np.where(heads, slot, -1).max(axis=2, keepdims=True)
+        prior = np.where(heads & (slot < last), slot, -1).max(axis=2, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            elapsed = np.take_along_axis(stamps, last, axis=2) - np.take_along_axis(stamps, prior, axis=2)
+            change = np.take_along_axis(windows, last, axis=2) - np.take_along_axis(windows, prior, axis=2)
+            rates = change / np.where(elapsed > 0, elapsed, np.nan)
+        return np.where(prior >= 0, rates, np.nan)[..., 0]
+
+    def series(self, name, start=0, stop=None):
+        """Values of derived series `name` (see series_name) for packets start..stop."""
+        field, stat = split_series(name)
+        stop = len(self.store) if stop is None else min(stop, len(self.store))
+        parts = [self.compute([field], lo, min(lo + CHUNK, stop), [stat])[0, :, 0]
+                 for lo in range(start, stop, CHUNK)]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    def row(self, position):
+        """{field: (min, max, mean, std, rate)} at packet `position`."""
+        results = self.compute(self.fields, position, position + 1)
+        return {field: results[i, 0] for i, field in enumerate(self.fields)}
+
+    def __contains__(self, name):
+        field, stat = split_series(name)
+        return stat in STATS and field in self.fields
@@ -0,0 +1,168 @@
+import threading
+import time
+
+import serial
+from serial.tools import list_ports
+from PyQt5.QtCore import QThread, pyqtSignal
+
+MIN_BACKOFF = 0.01   # first reconnect attempt after a drop (s)
+MAX_BACKOFF = 2.0
+BATCH_INTERVAL = 0.05  # lines are handed to the GUI at most this often (s)
+
+
+def available_ports():
+    """[(device, description, serial_number)] of the serial ports present now."""
+    return [(p.device, p.description, p.serial_number) for p in sorted(list_ports.comports())]
+
+
+class PortMonitor(QThread):
+    """Enumerates serial ports in the background and reports hot-plug changes."""
+
+    ports_changed = pyqtSignal(list)
+
+    def __init__(self, interval=1.0, parent=None):
+        super().__init__(parent)
+        self.interval = interval
+
+    def run(self):
+        known = None
+        while not self.isInterruptionRequested():
+            ports = available_ports()
+            if ports != known:
+                known = ports
+                self.ports_changed.emit(ports)
+            deadline = time.monotonic() + self.interval
+            while time.monotonic() < deadline and not self.isInterruptionRequested():
+                time.sleep(0.05)
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait()
+
+
+class SerialLink(QThread):
+    """Reads telemetry lines off the I/O thread and keeps the link up.
+
+    When the port drops (USB glitch, cable pulled) the link retries with
+    exponential backoff, also following the device if it comes back under a
+    different name (matched by USB serial number). Nothing already received
+    is touched, so the session's history survives the outage. Opening
+    another port while connected closes the current one and reconnects.
+    """
+
+    lines = pyqtSignal(list)
+    status = pyqtSignal(str)
+
+    def __init__(self, baudrate=9600, parent=None):
+        super().__init__(parent)
+        self.baudrate = baudrate
+        self.port = None
+        self.serial_number = None
+        self.connection = None
+        self.write_lock = threading.Lock()
+        self.wanted = False
+        self.switch = False  # set by `open` to move a running link to another port
+        self.reconnects = 0
+
+    def open(self, port):
+        serial_number = next((sn for dev, _, sn in available_ports() if dev == port), None)
+        if (port, serial_number) != (self.port, self.serial_number):
+            self.port = port
+            self.serial_number = serial_number
+            self.switch = True
+        self.wanted = True
+        if not self.isRunning():
+            self.start()
+
+    def close(self):
+        self.wanted = False
+        self.wait()
+
+    def send(self, data):
+        """Write `data` from the calling thread; False while the link is down."""
+        with self.write_lock:
+            connection = self.connection
+            if connection is None:
+                return False
+            try:
+                connection.write(data)
+                return True
+            except (serial.SerialException, OSError):
+                return False
+
+    def resolve_port(self):
+        """The configured port, or wherever the same device re-appeared."""
+        if self.serial_number:
+            for device, _, serial_number in available_ports():
+                if serial_number == self.serial_number:
+                    return device
+        return self.port
+
+    def connect_port(self):
+        port = self.resolve_port()
+        connection = serial.Serial(port=port, baudrate=self.baudrate, timeout=BATCH_INTERVAL)
+        with self.write_lock:
+            self.connection = connection
+        if not self.switch:  # `open` may have just picked another port
+            self.port = port
+        self.status.emit(f"Connected to {port}")
+
+    def close_connection(self):
+        with self.write_lock:
+            try:
+                self.connection.close()
+            except (serial.SerialException, OSError):
+                pass
+            self.connection = None
+
+    def drop_connection(self, reason):
+        self.close_connection()
+        self.status.emit(f"Link to {self.port} lost ({reason}), reconnecting")
+
+    def sleep_while_wanted(self, seconds):
+        deadline = time.monotonic() + seconds
+        while self.wanted and time.monotonic() < deadline:
+            time.sleep(min(0.01, seconds))
+
+    def run(self):
+        delay = MIN_BACKOFF
+        buffer = b""
+        batch = []
+        last_emit = time.monotonic()
+        while self.wanted:
+            if self.switch:
+                self.switch = False
+                delay = MIN_BACKOFF
+                if self.connection is not None:
+                    self.close_connection()
+                    self.status.emit(f"Switching to {self.port}")
+            if self.connection is None:
+                try:
+                    self.connect_port()
+                    delay = MIN_BACKOFF
+                    buffer = b""
+                except (serial.SerialException, OSError, ValueError):
+                    self.sleep_while_wanted(delay)
+                    delay = min(delay * 2, MAX_BACKOFF)
+                    self.reconnects += 1
+                    continue
+            try:
+                buffer += self.connection.read(max(self.connection.in_waiting, 1))
+            except (serial.SerialException, OSError) as e:
+                self.drop_connection(e)
+                continue
+            if b"\n" in buffer:
+                *complete, buffer = buffer.split(b"\n")
+                batch.extend(line.decode('utf-8', errors='replace').strip() for line in complete)
+            now = time.monotonic()
+            if batch and now - last_emit >= BATCH_INTERVAL:
+                self.lines.emit([line for line in batch if line])
+                batch = []
+                last_emit = now
+        if batch:
+            self.lines.emit([line for line in batch if line])
+        if self.connection is not None:
+            with self.write_lock:
+                self.connection.close()
+                self.connection = None
+            self.status.emit("Disconnected")
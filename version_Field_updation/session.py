@@ -0,0 +1,236 @@
+import itertools
+import json
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from mission_time import MissionClock
+from telemetry_store import TelemetryStore, FIELDS, DERIVED_FIELDS, TEXT_FIELDS
+
+SESSION_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "session")
+
+
+class MappedTelemetryStore(TelemetryStore):
+    """TelemetryStore whose columns live in memory-mapped .npy files.
+
+    Numeric columns are the mapped arrays themselves. Text columns stay
+    object arrays in memory and are mirrored as int32 codes into a
+    per-field vocabulary appended to <field>.vocab, so reopening the store
+    is one mmap per field plus one fancy index per text column.
+    Everything written is in the page cache at once, so it survives a crash
+    of the GUI process; `sync` makes rows up to the current length readable
+    by `open`.
+    """
+
+    def __init__(self, directory, capacity=4096):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.maps = {}
+        self.paths = {}
+        self.stale = []  # files replaced by a grown copy, removed once a checkpoint no longer needs them
+        self.words = {field: {None: 0} for field in TEXT_FIELDS}
+        self.vocab_files = {field: open(self._vocab_path(field), "w") for field in TEXT_FIELDS}
+        super().__init__(capacity)
+
+    @classmethod
+    def open(cls, directory, length, capacity, clock):
+        """Reattach to the files of a store that was checkpointed at `length` rows."""
+        store = cls.__new__(cls)
+        store.directory = directory
+        store.length = length
+        store.capacity = capacity
+        store.maps, store.paths, store.columns, store.words, store.vocab_files = {}, {}, {}, {}, {}
+        store.stale = []
+        for field in FIELDS + DERIVED_FIELDS:
+            path = store._path(field, capacity)
+            store.maps[field] = np.load(path, mmap_mode="r+")
+            store.paths[field] = path
+            if field not in TEXT_FIELDS:
+                store.columns[field] = store.maps[field]
+                continue
+            vocab = [None] + store._read_vocab(field)
+            store.words[field] = {word: code for code, word in enumerate(vocab)}
+            column = np.empty(capacity, dtype=object)
+            column[:length] = np.array(vocab, dtype=object)[store.maps[field][:length]]
+            store.columns[field] = column
+            store.vocab_files[field] = open(store._vocab_path(field), "a")
+        store.clock = MissionClock()
+        store.generation = 0
+        store.clock.offset, store.clock.last_raw, store.clock.last = clock
+        return store
+
+    def _read_vocab(self, field):
+        """Vocabulary of a text field, dropping a line left half-written by a crash."""
+        path = self._vocab_path(field)
+        with open(path) as f:
+            text = f.read()
+        complete = text[:text.rfind("\n") + 1]
+        if complete != text:
+            with open(path, "w") as f:
+                f.write(complete)
+        return [json.loads(line) for line in complete.splitlines()]
+
+    def _path(self, field, size):
+        return os.path.join(self.directory, f"{field}.{size}.npy")
+
+    def _vocab_path(self, field):
+        return os.path.join(self.directory, f"{field}.vocab")
+
+    def _new_column(self, field, size):
+        path = self._path(field, size)
+        if field in TEXT_FIELDS:
+            self.maps[field] = open_memmap(path, mode="w+", dtype=np.int32, shape=(size,))
+            self.paths[field] = path
+            return np.empty(size, dtype=object)
+        column = open_memmap(path, mode="w+", dtype=np.float64, shape=(size,))
+        column[:] = np.nan
+        self.maps[field] = column
+        self.paths[field] = path
+        return column
+
+    def _reserve(self, count):
+        if self.length + count <= self.capacity:
+            return
+        old_maps = dict(self.maps)
+        self.stale.extend(self.paths.values())
+        super()._reserve(count)  # new files for every column, numeric data copied
+        for field in TEXT_FIELDS:
+            self.maps[field][:self.length] = old_maps[field][:self.length]
+
+    def drop_stale(self):
+        for path in self.stale:
+            try:
+                os.remove(path)  # views held elsewhere keep their mapping
+            except OSError:
+                pass
+        self.stale = []
+
+    def _code(self, field, value):
+        words = self.words[field]
+        code = words.get(value)
+        if code is None:
+            code = words[value] = len(words)
+            self.vocab_files[field].write(json.dumps(value) + "\n")
+        return code
+
+    def append(self, packet):
+        super().append(packet)
+        i = self.length - 1
+        for field in TEXT_FIELDS:
+            self.maps[field][i] = self._code(field, self.columns[field][i])
+
+    def extend(self, frame):
+        start = self.length
+        super().extend(frame)
+        for field in TEXT_FIELDS:
+            values = self.columns[field][start:self.length]
+            self.maps[field][start:self.length] = [self._code(field, value) for value in values]
+
+    def sync(self):
+        for f in self.vocab_files.values():
+            f.flush()
+
+    def checkpoint(self):
+        """What `open` needs to reattach to this store."""
+        self.sync()
+        clock = self.clock
+        return {"length": self.length, "capacity": self.capacity,
+                "clock": [clock.offset, clock.last_raw, clock.last]}
+
+    def close(self):
+        for f in self.vocab_files.values():
+            f.close()
+
+
+def lock_directory(directory):
+    """Open handle holding an exclusive lock on `directory`, None if another process holds it.
+
+    The lock file sits next to the directory, so the directory itself can
+    be deleted and recreated while locked. The lock goes away with the
+    handle, including when the process dies.
+    """
+    f = open(directory + ".lock", "a")
+    try:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+class Session:
+    """On-disk state of the running session, for a warm restart after a crash.
+
+    Each vehicle's store is a MappedTelemetryStore under `directory`, and
+    checkpoint.json records the committed row counts plus the GUI state
+    needed to resume. A clean shutdown marks the checkpoint so the next
+    launch starts a new session.
+
+    The directory is locked while the session runs. If another console
+    holds it, the session uses the first free `<directory>-1`, `-2`...
+    instead, so only a directory nobody holds is ever resumed or deleted.
+    """
+
+    def __init__(self, directory=SESSION_DIR, resume=True):
+        os.makedirs(os.path.dirname(os.path.abspath(directory)), exist_ok=True)
+        for n in itertools.count():
+            candidate = directory if n == 0 else f"{directory}-{n}"
+            self.lock = lock_directory(candidate)
+            if self.lock is not None:
+                break
+        self.directory = directory = candidate
+        self.path = os.path.join(directory, "checkpoint.json")
+        self.stores = {}
+        self.resumed = self.read_checkpoint() if resume else None
+        if self.resumed is None:
+            shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+    def read_checkpoint(self):
+        """State saved by a session that did not shut down cleanly, else None."""
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return None if state.get("clean") else state
+
+    def store(self, team_id):
+        """Store for a vehicle, reattached to its files if the resumed session had it."""
+        directory = os.path.join(self.directory, f"vehicle_{team_id}")
+        saved = (self.resumed or {}).get("stores", {}).get(team_id)
+        if saved:
+            store = MappedTelemetryStore.open(directory, **saved)
+        else:
+            store = MappedTelemetryStore(directory)
+        self.stores[team_id] = store
+        return store
+
+    def checkpoint(self, state, clean=False):
+        """Atomically record `state` (JSON-able dict) and the committed length of every store."""
+        state = dict(state, clean=clean,
+                     stores={team_id: store.checkpoint() for team_id, store in self.stores.items()})
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+        for store in self.stores.values():
+            store.drop_stale()
+
+    def close(self, state):
+        self.checkpoint(state, clean=True)
+        for store in self.stores.values():
+            store.close()
+        self.lock.close()
@@ -0,0 +1,186 @@
+"""Simulation mode: stream a recorded pressure profile to the CanSat as SIMP commands.
+
+    python simulation.py PROFILE [--team-id 2044] [--period 1.0] [--rate 2000]
+
+The profile is streamed over a pseudo-terminal loopback while telemetry
+lines are written back at `--rate` per second, and the cadence and jitter
+seen on the wire are printed.
+"""
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+from PyQt5.QtCore import QThread, pyqtSignal
+
+SPIN_SECONDS = 0.002  # busy-wait the last stretch before each deadline
+
+
+def load_profile(path):
+    """Pressure values (Pa) from a simulation profile file.
+
+    Accepts the competition format ("CMD,$,SIMP,101325" per line, "#"
+    comments) or one value per line.
+    """
+    values = []
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            try:
+                values.append(float(line.rsplit(',', 1)[-1]))
+            except ValueError:
+                continue  # header or malformed line
+    return np.array(values)
+
+
+def simp_command(team_id, value):
+    return f"CMD,{team_id},SIMP,{value:.0f}\n".encode()
+
+
+class JitterStats:
+    """Send-time error against the ideal schedule, one entry per command."""
+
+    def __init__(self, capacity):
+        self.errors = np.zeros(capacity)
+        self.count = 0
+
+    def add(self, error):
+        self.errors[self.count] = error
+        self.count += 1
+
+    def summary(self):
+        errors = np.abs(self.errors[:self.count]) * 1000
+        if self.count == 0:
+            return {'sent': 0}
+        return {
+            'sent': self.count,
+            'mean_ms': float(errors.mean()),
+            'p99_ms': float(np.percentile(errors, 99)),
+            'max_ms': float(errors.max()),
+        }
+
+
+class SimulationStreamer(QThread):
+    """Sends one SIMP command per period from its own thread.
+
+    Deadlines are computed from the start time (start + k * period) rather
+    than from the previous send, so late wake-ups never accumulate into
+    drift. `send` is a callable taking bytes, e.g. SerialLink.send.
+    """
+
+    progress = pyqtSignal(int, int)
+    stats = pyqtSignal(dict)
+
+    def __init__(self, send, team_id, profile, period=1.0, parent=None):
+        super().__init__(parent)
+        self.send = send
+        self.team_id = team_id
+        self.profile = np.asarray(profile, dtype=float)
+        self.period = period
+        self.jitter = JitterStats(len(self.profile))
+        self.failed = 0
+
+    def wait_until(self, deadline):
+        while not self.isInterruptionRequested():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return True
+            if remaining > SPIN_SECONDS:
+                time.sleep(min(remaining - SPIN_SECONDS, 0.1))
+        return False
+
+    def run(self):
+        commands = [simp_command(self.team_id, value) for value in self.profile]
+        start = time.perf_counter()
+        for i, command in enumerate(commands):
+            deadline = start + i * self.period
+            if not self.wait_until(deadline):
+                break
+            if not self.send(command):
+                self.failed += 1
+            self.jitter.add(time.perf_counter() - deadline)
+            self.progress.emit(i + 1, len(commands))
+        summary = self.jitter.summary()
+        summary['failed'] = self.failed
+        self.stats.emit(summary)
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait()
+
+
+def loopback_test(profile, team_id, period, rate):
+    """Stream over a pty pair through SerialLink while telemetry floods the link."""
+    from PyQt5.QtCore import QCoreApplication
+    from serial_link import SerialLink
+    from telemetry_store import FIELDS
+
+    app = QCoreApplication([])
+    master, slave = os.openpty()
+    link = SerialLink(baudrate=115200)
+    received = {'lines': 0}
+    link.lines.connect(lambda lines: received.update(lines=received['lines'] + len(lines)))
+    link.open(os.ttyname(slave))
+    while link.connection is None:
+        time.sleep(0.01)
+
+    running = True
+    packet = (",".join(["0"] * len(FIELDS)) + "\n").encode()
+
+    def flood():
+        interval = 1.0 / rate
+        next_time = time.perf_counter()
+        while running:
+            os.write(master, packet)
+            next_time += interval
+            time.sleep(max(0.0, next_time - time.perf_counter()))
+
+    arrivals = []
+
+    def listen():
+        pending = b""
+        while running:
+            try:
+                pending += os.read(master, 4096)
+            except OSError:
+                return
+            while b"\n" in pending:
+                line, pending = pending.split(b"\n", 1)
+                if b",SIMP," in line:
+                    arrivals.append(time.perf_counter())
+
+    threads = [threading.Thread(target=flood, daemon=True), threading.Thread(target=listen, daemon=True)]
+    for thread in threads:
+        thread.start()
+    streamer = SimulationStreamer(link.send, team_id, profile, period)
+    streamer.stats.connect(lambda summary: print("send-side jitter:", summary))
+    streamer.finished.connect(app.quit)
+    streamer.start()
+    app.exec_()
+    time.sleep(0.2)
+    running = False
+    link.close()
+    intervals = np.diff(arrivals) - period
+    print(f"received {len(arrivals)}/{len(profile)} SIMP commands and {received['lines']} telemetry lines")
+    if len(intervals):
+        print(f"wire interval error: mean {np.abs(intervals).mean() * 1000:.3f} ms, "
+              f"max {np.abs(intervals).max() * 1000:.3f} ms, "
+              f"drift over run {(arrivals[-1] - arrivals[0] - period * (len(arrivals) - 1)) * 1000:.3f} ms")
+    os.close(master)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("profile")
+    parser.add_argument("--team-id", default="2044")
+    parser.add_argument("--period", type=float, default=1.0)
+    parser.add_argument("--rate", type=int, default=2000, help="telemetry lines/s on the loopback")
+    args = parser.parse_args()
+    loopback_test(load_profile(args.profile), args.team_id, args.period, args.rate)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Soak test: run the ground station offscreen through hours of accelerated flight.
+
+    python soak_test.py [--hours 12] [--rate 10] [--mission-minutes 30] [--batch 50]
+
+Synthetic missions are replayed back to back through the serial ingest
+path, each one started the way a CSV reload starts it. At the end of every
+mission the harness samples RSS, live Python objects, QObjects, Qt signal
+connections and the frame time. It exits with status 1 if any of
+them keeps growing from mission to mission once the bounded buffers
+(log ring, store capacity) have filled.
+"""
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+if "DISPLAY" not in os.environ and "QT_QPA_PLATFORM" not in os.environ:
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+
+from PyQt5.QtCore import QMetaMethod, QObject
+from PyQt5.QtWidgets import QApplication
+
+from cansat_gui import CanSatGroundControl
+from synthetic_feed import mission_lines
+
+# metric: (relative, absolute) growth allowed over the measured missions
+TOLERANCES = {
+    'rss_mb': (0.02, 2.0),
+    'python_objects': (0.01, 1000),
+    'qobjects': (0.0, 0),
+    'connections': (0.0, 0),
+    'frame_ms': (0.25, 2.0),
+}
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+
+
+def signal_connections(root):
+    """(QObjects under root, receivers connected to their signals)."""
+    objects = [root] + root.findChildren(QObject)
+    total = 0
+    for obj in objects:
+        meta = obj.metaObject()
+        for i in range(meta.methodCount()):
+            method = meta.method(i)
+            if method.methodType() != QMetaMethod.Signal:
+                continue
+            try:
+                total += obj.receivers(getattr(obj, bytes(method.name()).decode()))
+            except (AttributeError, TypeError, RuntimeError):
+                pass  # overloaded signal or object created on the C++ side
+    return len(objects), total
+
+
+def sample(window, frame_times):
+    gc.collect()
+    qobjects, connections = signal_connections(window)
+    return {
+        'rss_mb': rss_mb(),
+        'python_objects': len(gc.get_objects()),
+        'qobjects': qobjects,
+        'connections': connections,
+        # A low percentile tracks the cost of a frame rather than machine noise
+        'frame_ms': float(np.percentile(frame_times, 10)) * 1000,
+    }
+
+
+def run_mission(app, window, team_id, packets, rate, batch):
+    """Feed one mission in batches; returns per-batch frame times (s)."""
+    window.start_mission()
+    frame_times = []
+    for start in range(0, packets, batch):
+        lines = mission_lines(team_id, start, min(batch, packets - start), rate)
+        began = time.perf_counter()
+        window.ingest_lines(lines)
+        window.frame_scheduler.tick()
+        window.repaint()
+        app.processEvents()
+        frame_times.append(time.perf_counter() - began)
+    return frame_times
+
+
+def growth(values):
+    """Growth over the run along the Theil-Sen line (median pairwise slope) through `values`."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    i, j = np.triu_indices(n, 1)
+    return float(np.median((values[j] - values[i]) / (j - i))) * (n - 1)
+
+
+def check(samples):
+    failures = []
+    for metric, (relative, absolute) in TOLERANCES.items():
+        values = np.array([s[metric] for s in samples], dtype=float)
+        grown = growth(values)
+        limit = max(relative * values[0], absolute)
+        if grown > limit:
+            failures.append(f"{metric} grew by {grown:.3g} over {len(values)} missions (limit {limit:.3g})")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hours", type=float, default=12.0, help="simulated flight time")
+    parser.add_argument("--rate", type=float, default=10.0, help="packets per simulated second")
+    parser.add_argument("--mission-minutes", type=float, default=30.0)
+    parser.add_argument("--batch", type=int, default=50, help="packets per frame")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    session_dir = tempfile.TemporaryDirectory()  # never touch the operator's session
+    window = CanSatGroundControl(session_dir=session_dir.name, resume=False)
+    window.timer.stop()  # the harness drives ingest itself
+    window.show()
+    app.processEvents()
+
+    packets = int(args.mission_minutes * 60 * args.rate)
+    missions = max(1, int(round(args.hours * 60 / args.mission_minutes)))
+    # Missions until the log ring is full; memory grows legitimately before that
+    log_capacity = window.log_buffer.capacity
+    warmup = min(missions - 1, max(2, -(-log_capacity // packets) + 1))
+
+    print(f"{missions} missions x {packets} packets, first {warmup} are warm-up")
+    print(f"{'mission':>7} {'rss MB':>8} {'objects':>9} {'qobjects':>9} {'conns':>6} {'frame ms':>9} {'wall s':>7}")
+    samples = []
+    for mission in range(missions):
+        began = time.perf_counter()
+        frame_times = run_mission(app, window, window.team_id, packets, args.rate, args.batch)
+        s = sample(window, frame_times)
+        print(f"{mission + 1:>7} {s['rss_mb']:>8.1f} {s['python_objects']:>9} {s['qobjects']:>9} "
+              f"{s['connections']:>6} {s['frame_ms']:>9.2f} {time.perf_counter() - began:>7.1f}")
+        if mission >= warmup:
+            samples.append(s)
+    window.close()
+
+    if len(samples) < 3:
+        print("Not enough missions after warm-up to judge trends; run longer (--hours).")
+        return 2
+    failures = check(samples)
+    for failure in failures:
+        print("FAIL:", failure)
+    if not failures:
+        print("PASS: no metric grows from mission to mission")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QRectF
+from PyQt5.QtGui import QImage
+from numpy.lib.stride_tricks import sliding_window_view
+
+from telemetry_store import FIELD_LABELS
+
+VIBRATION_FIELDS = ["ACCEL_R", "ACCEL_P", "ACCEL_Y", "GYRO_P", "GYRO_Y"]
+
+
+class SlidingSpectrum:
+    """Sliding-window real FFT over a growing column, computed incrementally.
+
+    Windows of `nfft` samples start every `hop` samples, so consecutive
+    windows share nfft - hop samples; they are taken as strided views of the
+    store column and only windows not yet seen are transformed.
+    """
+
+    def __init__(self, nfft=64, hop=16):
+        self.nfft = nfft
+        self.hop = hop
+        self.bins = nfft // 2 + 1
+        self.taper = np.hanning(nfft)
+        self.next_start = 0  # first sample of the next window
+        self.columns = 0     # windows computed so far
+
+    def reset(self):
+        self.next_start = 0
+        self.columns = 0
+
+    def pending(self, length):
+        """Number of complete windows not computed yet in a column of `length` samples."""
+        if length - self.nfft < self.next_start:
+            return 0
+        return (length - self.nfft - self.next_start) // self.hop + 1
+
+    def update(self, samples):
+        """dB spectra (windows x bins) of the windows completed since the last call."""
+        count = self.pending(len(samples))
+        if count == 0:
+            return np.empty((0, self.bins))
+        stop = self.next_start + (count - 1) * self.hop + self.nfft
+        windows = sliding_window_view(samples[self.next_start:stop], self.nfft)[::self.hop]
+        missing = np.isnan(windows)
+        filled = np.where(missing, 0.0, windows)
+        mean = filled.sum(axis=1, keepdims=True) / np.maximum((~missing).sum(axis=1, keepdims=True), 1)
+        segments = np.where(missing, 0.0, filled - mean) * self.taper  # detrended, gaps as zeros
+        power = np.abs(np.fft.rfft(segments, axis=1))
+        self.next_start += count * self.hop
+        self.columns += count
+        return 20 * np.log10(power + 1e-12)
+
+
+class SpectrogramImage(pg.GraphicsObject):
+    """Ring buffer of spectrogram columns painted straight from one QImage.
+
+    A new column is mapped through the colour table into its own slot of
+    the ring and nothing else is rewritten. Each slot remembers the packet
+    at the centre of its window; `positions` turns those into x coordinates
+    when painting, and columns between two gaps are drawn stretched between
+    the first and last centre.
+    """
+
+    def __init__(self, history, bins, levels, lut):
+        super().__init__()
+        self.levels = levels
+        # Colour table as RGB32 pixels
+        self.colors = (0xFF000000 | lut[:, 0].astype(np.uint32) << 16
+                       | lut[:, 1].astype(np.uint32) << 8 | lut[:, 2].astype(np.uint32))
+        self.image = QImage(history, bins, QImage.Format_RGB32)
+        pointer = self.image.bits()
+        pointer.setsize(self.image.byteCount())
+        self.pixels = np.frombuffer(pointer, dtype=np.uint32).reshape(bins, self.image.bytesPerLine() // 4)
+        self.centers = np.zeros(history, dtype=np.int64)  # packet at the centre of each slot's window
+        self.bin_height = 1.0
+        self.positions = lambda centers: centers.astype(float)
+        self.runs = []  # (first slot, slot count, QRectF) drawn by paint
+        self.bounds = QRectF()
+        self.clear()
+
+    def clear(self):
+        self.count = 0  # columns written since the last clear
+        self.pixels[:] = self.colors[0]
+        self.layout()
+
+    def add(self, spectra, centers):
+        """Write spectra (windows x bins, dB) of the windows centred on packets `centers`."""
+        history = len(self.centers)
+        low, high = self.levels
+        indices = np.clip((spectra[-history:] - low) * (len(self.colors) - 1) / (high - low), 0, len(self.colors) - 1)
+        slots = (self.count + max(len(spectra) - history, 0) + np.arange(len(indices))) % history
+        self.pixels[:, slots] = self.colors[indices.astype(np.intp)].T
+        self.centers[slots] = centers[-history:]
+        self.count += len(spectra)
+        self.layout()
+
+    def layout(self):
+        """Place the runs of columns between gaps, oldest first."""
+        history = len(self.centers)
+        shown = min(self.count, history)
+        slots = (self.count - shown + np.arange(shown)) % history
+        x = self.positions(self.centers[slots])
+        finite = np.isfinite(x)
+        steps = np.diff(x[finite])
+        width = np.median(steps) if len(steps) else 1.0
+        # A run ends at the wrap of the ring, at a gap, and around columns without a position
+        breaks = np.flatnonzero((np.diff(slots) != 1) | ~(np.abs(np.diff(x)) <= 2 * width)) + 1
+        self.runs = []
+        for run in np.split(np.arange(shown), breaks):
+            run = run[finite[run]]
+            if len(run) == 0:
+                continue
+            left = x[run[0]] - width / 2
+            right = x[run[-1]] + width / 2
+            self.runs.append((int(slots[run[0]]), len(run), QRectF(left, -self.bin_height / 2,
+                                                                   right - left, self.image.height() * self.bin_height)))
+        self.prepareGeometryChange()
+        self.bounds = QRectF()
+        for _, _, rect in self.runs:
+            self.bounds = self.bounds.united(rect)
+        self.update()
+
+    def boundingRect(self):
+        return self.bounds
+
+    def paint(self, painter, *args):
+        for first, count, rect in self.runs:
+            painter.drawImage(rect, self.image, QRectF(first, 0, count, self.image.height()))
+
+
+class SpectrogramView(pg.PlotWidget):
+    """Scrolling spectrogram of one telemetry field against mission time.
+
+    The last `history` windows are kept in a SpectrogramImage ring, so a
+    new window costs one column of pixels however long the history. Each
+    column is drawn at the MISSION_SECONDS of its window centre, counted
+    from the first stamp like the telemetry plots (the packet index until a
+    stamped packet arrives). Nothing is computed while hidden.
+    """
+
+    def __init__(self, store, field="ACCEL_R", nfft=64, hop=16, history=1024, levels=(-20, 40), parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.field = field
+        self.spectrum = SlidingSpectrum(nfft, hop)
+        self.history = history
+        self.setBackground('w')
+        self.setLabel('left', 'Frequency', units='cycles/packet')
+        lut = pg.colormap.get('viridis').getLookupTable(nPts=256)
+        self.image = SpectrogramImage(history, self.spectrum.bins, levels, lut)
+        self.image.bin_height = 1.0 / nfft  # bin j is centred on j / nfft cycles per packet
+        self.image.positions = self.x_data
+        self.addItem(self.image)
+        self.set_field(field)
+
+    def set_store(self, store):
+        self.store = store
+        self.set_field(self.field)
+
+    def set_field(self, field):
+        """Show another field; its spectrogram is rebuilt from the store history."""
+        self.field = field
+        title, _ = FIELD_LABELS.get(field, (field, ""))
+        self.setTitle(f"{title} spectrogram")
+        self.spectrum.reset()
+        self.generation = self.store.generation
+        self.origin = None  # first MISSION_SECONDS stamp
+        self.setLabel('bottom', 'Packet')
+        self.image.clear()
+        self.update_spectrum()
+
+    def x_data(self, centers):
+        """x of window centres: seconds since the first stamp, the packet index if there is none yet."""
+        if self.origin is None:
+            seconds = self.store.column("MISSION_SECONDS")[:len(self.store)]
+            stamped = np.flatnonzero(np.isfinite(seconds))
+            if len(stamped) == 0:
+                return centers.astype(float)
+            self.origin = seconds[stamped[0]]
+            self.setLabel('bottom', 'Mission time (s)')
+        return self.store.column("MISSION_SECONDS")[centers] - self.origin
+
+    def update_spectrum(self):
+        """Transform the windows completed since the last call and add their columns."""
+        if self.generation != self.store.generation:
+            self.set_field(self.field)  # store was cleared
+            return
+        if not self.isVisible():
+            return
+        hop, nfft = self.spectrum.hop, self.spectrum.nfft
+        # Windows older than the history are skipped, not computed
+        skip = self.spectrum.pending(len(self.store)) - self.history
+        if skip > 0:
+            self.spectrum.next_start += skip * hop
+            self.spectrum.columns += skip
+        start = self.spectrum.next_start
+        spectra = self.spectrum.update(self.store.column(self.field))
+        if len(spectra):
+            self.image.add(spectra, start + np.arange(len(spectra)) * hop + nfft // 2)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_spectrum()
@@ -0,0 +1,236 @@
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QPointF, QRectF
+from PyQt5.QtGui import QPainterPath
+from PyQt5.QtWidgets import QGraphicsItem
+
+LEVELS = (256, 64, 16, 4, 1)  # min/max bins per chunk of the coarser paths, finest first
+SMALL_APPEND = 16     # up to this many points are added with lineTo, more as one sub-path
+
+
+def segments(x, y, gap=None):
+    """Finite points of x, y and the pyqtgraph `connect` array joining them.
+
+    Consecutive points are joined unless one of them is not finite or, with
+    `gap`, they are more than `gap` apart along x.
+    """
+    finite = np.isfinite(x) & np.isfinite(y)
+    joined = finite[:-1] & finite[1:]
+    if gap is not None:
+        with np.errstate(invalid="ignore"):
+            joined &= np.diff(x) <= gap
+    keep = np.flatnonzero(finite)
+    connect = np.zeros(len(keep), dtype=bool)
+    if len(keep) > 1:
+        connect[:-1] = (np.diff(keep) == 1) & joined[keep[:-1]]
+    return x[keep], y[keep], connect
+
+
+def to_path(x, y, connect):
+    """QPainterPath of `segments` output; an unbroken line takes pyqtgraph's much faster polyline path."""
+    if connect[:-1].all():
+        connect = 'all'
+    return pg.arrayToQPath(x, y, connect=connect)
+
+
+def envelope(x, y, bins, gap=None):
+    """Points (x, y, connect) of the min and max of y in `bins` equal slices of the points.
+
+    With `gap`, a slice also starts after every step of more than `gap`
+    along x and the envelope is broken there, as `segments` breaks the line.
+    """
+    starts = np.arange(0, len(x), max(len(x) // bins, 1))
+    breaks = np.empty(0, dtype=int)
+    if gap is not None:
+        with np.errstate(invalid="ignore"):
+            breaks = np.flatnonzero(np.diff(x) > gap) + 1
+        starts = np.union1d(starts, breaks)
+    low = np.fmin.reduceat(y, starts)
+    high = np.fmax.reduceat(y, starts)
+    xs = np.repeat(x[starts], 2)
+    ys = np.column_stack([low, high]).ravel()
+    if len(breaks):
+        # A NaN point before the first point of each slice after a gap
+        at = 2 * np.searchsorted(starts, breaks)
+        xs, ys = np.insert(xs, at, np.nan), np.insert(ys, at, np.nan)
+    return segments(xs, ys)
+
+
+def extent(x, y):
+    """Bounding rect of the finite points, None if there are none."""
+    finite = np.isfinite(x) & np.isfinite(y)
+    if not finite.any():
+        return None
+    x, y = x[finite], y[finite]
+    return QRectF(QPointF(x.min(), y.min()), QPointF(x.max(), y.max()))
+
+
+def unite(a, b):
+    if a is None:
+        return b
+    return a if b is None else a.united(b)
+
+
+class StreamingCurve(pg.GraphicsObject):
+    """Line item for append-only series that never rebuilds what it already drew.
+
+    Points are grouped in chunks of `chunk` points, each with its own
+    QPainterPath and bounding rect. Appending extends only the path of the
+    last, partial chunk and grows the bounds by the new points' extent; only
+    the region of the new segments is repainted. A completed chunk also
+    keeps min/max envelopes (LEVELS bins), made into paths the first time
+    they are drawn; paint() skips chunks outside the exposed rect and draws
+    each chunk at the coarsest level that still has a bin per pixel, so a
+    full view of 10^7 points draws a few thousand lines.
+    """
+
+    def __init__(self, pen=None, gap=None, chunk=4096):
+        super().__init__()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)  # exposedRect in paint()
+        self.pen = pg.mkPen(pen)
+        self.gap = gap
+        self.chunk = chunk
+        self.x = np.empty(chunk)
+        self.y = np.empty(chunk)
+        self.clear()
+
+    def clear(self):
+        self.prepareGeometryChange()
+        self.chunks = []   # (rect, paths, envelopes) of completed chunks, paths[0] full resolution
+        self.size = 0      # points in the partial chunk (self.x/self.y)
+        self.count = 0
+        self.tail = QPainterPath()
+        self.tail_rect = None
+        self.tail_outline = None  # (size, bins, path) envelope of the partial chunk drawn last
+        self.last = None   # last point if it was finite, where the next segment starts
+        self.bounds = None
+        self.informViewBoundsChanged()
+        self.update()
+
+    def extend(self, x, y):
+        """Append points to the curve."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        dirty = None
+        done = 0
+        while done < len(x):
+            take = min(self.chunk - self.size, len(x) - done)
+            dirty = unite(dirty, self.extend_tail(x[done:done + take], y[done:done + take]))
+            done += take
+            if self.size == self.chunk:
+                self.seal()
+        self.count += len(x)
+        if dirty is None:
+            return
+        bounds = unite(self.bounds, dirty)
+        if bounds != self.bounds:
+            self.prepareGeometryChange()
+            self.bounds = bounds
+            self.informViewBoundsChanged()
+        px, py = self.padding()
+        self.update(dirty.adjusted(-px, -py, px, py))
+
+    def extend_tail(self, x, y):
+        """Add points to the partial chunk; returns the rect of the new segments."""
+        self.x[self.size:self.size + len(x)] = x
+        self.y[self.size:self.size + len(y)] = y
+        self.size += len(x)
+        if self.last is not None:
+            x = np.concatenate([[self.last[0]], x])
+            y = np.concatenate([[self.last[1]], y])
+        self.last = (x[-1], y[-1]) if np.isfinite(x[-1]) and np.isfinite(y[-1]) else None
+        xs, ys, connect = segments(x, y, self.gap)
+        if len(xs) == 0:
+            return None
+        if len(xs) <= SMALL_APPEND:
+            for i, point in enumerate(zip(xs, ys)):
+                if i > 0 and connect[i - 1]:
+                    self.tail.lineTo(*point)
+                elif self.tail.isEmpty() or self.tail.currentPosition() != QPointF(*point):
+                    self.tail.moveTo(*point)
+        else:
+            self.tail.addPath(to_path(xs, ys, connect))
+        rect = extent(xs, ys)
+        self.tail_rect = unite(self.tail_rect, rect)
+        return rect
+
+    def seal(self):
+        """Freeze the full partial chunk with its envelopes and start a new one."""
+        x, y = self.x[:self.size], self.y[:self.size]
+        envelopes = [None] + [envelope(x, y, bins, self.gap) for bins in LEVELS]
+        paths = [self.tail] + [None] * len(LEVELS)
+        self.chunks.append((self.tail_rect, paths, envelopes))
+        self.tail = QPainterPath()
+        self.tail_rect = None
+        self.size = 0
+
+    def padding(self):
+        """Half the pen width plus a pixel, in data units along x and y."""
+        px, py = self.pixelVectors()
+        if px is None:
+            return 0.0, 0.0
+        width = self.pen.widthF() / 2 + 1
+        return px.length() * width, py.length() * width
+
+    def boundingRect(self):
+        if self.bounds is None:
+            return QRectF()
+        px, py = self.padding()
+        return self.bounds.adjusted(-px, -py, px, py)
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        if self.bounds is None:
+            return None, None
+        if ax == 0:
+            return self.bounds.left(), self.bounds.right()
+        return self.bounds.top(), self.bounds.bottom()
+
+    def pixelPadding(self):
+        return self.pen.widthF() / 2 + 1
+
+    def viewTransformChanged(self):
+        self.prepareGeometryChange()  # the padding is in pixels
+
+    def paint(self, painter, option, widget=None):
+        if self.bounds is None:
+            return
+        px, py = self.padding()
+        area = option.exposedRect.adjusted(-px, -py, px, py)
+        pixels = abs(painter.transform().m11())  # pixels per x unit
+        painter.setPen(self.pen)
+        for rect, paths, envelopes in self.chunks:
+            if rect is None or not overlaps(rect, area):
+                continue
+            level = self.level(rect.width() * pixels)
+            if paths[level] is None:
+                paths[level] = to_path(*envelopes[level])
+            painter.drawPath(paths[level])
+        if self.tail_rect is not None and overlaps(self.tail_rect, area):
+            painter.drawPath(self.tail_path(self.level(self.tail_rect.width() * pixels)))
+
+    def level(self, width):
+        """Index of the coarsest path (0 = full) with a bin for each of `width` pixels."""
+        level = 0
+        for i, bins in enumerate(LEVELS, 1):
+            if width <= bins:
+                level = i
+        return level
+
+    def tail_path(self, level):
+        """The partial chunk at `level`; its envelope is recomputed only when it grew."""
+        if level == 0 or self.size <= 2 * LEVELS[level - 1]:
+            return self.tail
+        bins = LEVELS[level - 1]
+        if self.tail_outline is None or self.tail_outline[:2] != (self.size, bins):
+            x, y = self.x[:self.size], self.y[:self.size]
+            self.tail_outline = (self.size, bins, to_path(*envelope(x, y, bins, self.gap)))
+        return self.tail_outline[2]
+
+    def __len__(self):
+        return self.count
+
+
+def overlaps(rect, area):
+    """Like QRectF.intersects, but true for flat (zero height or width) rects too."""
+    return (rect.left() <= area.right() and rect.right() >= area.left()
+            and rect.top() <= area.bottom() and rect.bottom() >= area.top())
@@ -0,0 +1,62 @@
+import math
+
+from telemetry_store import FIELDS
+
+APOGEE = 725.0       # m
+ASCENT_TIME = 30.0   # s
+DESCENT_RATE = 5.0   # m/s under parachute
+LAUNCH_SITE = (37.1955, -80.5786)
+
+
+def clock(seconds):
+    seconds = int(seconds) % 86400
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def altitude_at(t):
+    """Altitude (m) of a plausible flight profile `t` seconds after launch."""
+    if t < ASCENT_TIME:
+        return APOGEE * math.sin(0.5 * math.pi * t / ASCENT_TIME)
+    return max(0.0, APOGEE - DESCENT_RATE * (t - ASCENT_TIME))
+
+
+def packet_line(team_id, index, rate=1.0, start_clock=12 * 3600):
+    """Telemetry line number `index` of a synthetic flight sent at `rate` Hz."""
+    t = index / rate
+    altitude = altitude_at(t)
+    state = "ASCENT" if t < ASCENT_TIME else ("DESCENT" if altitude > 0 else "LANDED")
+    pressure = 101.325 * (1 - 2.25577e-5 * altitude) ** 5.25588
+    values = {
+        "TEAM_ID": team_id,
+        "MISSION_TIME": clock(start_clock + t),
+        "PACKET_COUNT": index + 1,
+        "MODE": "F",
+        "STATE": state,
+        "ALTITUDE": f"{altitude:.1f}",
+        "AIR_SPEED": f"{abs(altitude - altitude_at(t - 1 / rate)) * rate:.1f}",
+        "HS_DEPLOYED": "P" if t > ASCENT_TIME else "N",
+        "PC_DEPLOYED": "C" if altitude < 100 and t > ASCENT_TIME else "N",
+        "TEMPERATURE": f"{25 - altitude * 0.0065:.1f}",
+        "VOLTAGE": f"{4.2 - t * 1e-4:.2f}",
+        "PRESSURE": f"{pressure:.3f}",
+        "GPS_TIME": clock(start_clock + t),
+        "GPS_ALTITUDE": f"{altitude:.1f}",
+        "GPS_LATITUDE": f"{LAUNCH_SITE[0] + t * 2e-6:.6f}",
+        "GPS_LONGITUDE": f"{LAUNCH_SITE[1] + t * 3e-6:.6f}",
+        "GPS_SATS": 8,
+        "TILT_X": f"{5 * math.sin(t):.2f}",
+        "TILT_Y": f"{5 * math.cos(t):.2f}",
+        "ROT_Z": f"{30 * math.sin(t / 7):.2f}",
+        "CMD_ECHO": "CXON",
+        # Structural vibration while the motor burns, then quiet descent
+        "ACCEL_R": f"{(2.0 if t < ASCENT_TIME else 0.1) * math.sin(2 * math.pi * 0.3 * index):.3f}",
+        "ACCEL_P": f"{0.5 * math.sin(2 * math.pi * 0.11 * index):.3f}",
+        "ACCEL_Y": f"{9.81 + 0.2 * math.cos(t):.3f}",
+        "GYRO_P": f"{5 * math.cos(t):.2f}",
+        "GYRO_Y": f"{30 * math.sin(t / 7):.2f}",
+    }
+    return ",".join(str(values.get(field, 0)) for field in FIELDS)
+
+
+def mission_lines(team_id, start, count, rate=1.0):
+    return [packet_line(team_id, i, rate) for i in range(start, start + count)]
@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+
+from telemetry_store import NUMERIC_FIELDS
+
+BLOCK_SIZE = 4096  # packets summarized per block
+TIME_KEYS = ("MISSION_TIME", "PACKET_COUNT")
+
+
+class BlockSummary:
+    """Min/max/sum/count of every numeric field over fixed-size packet blocks.
+
+    Only complete blocks are summarized; the partial last block is always
+    scanned raw, so summaries never have to be revised.
+    """
+
+    def __init__(self, store, block_size=BLOCK_SIZE):
+        self.store = store
+        self.block_size = block_size
+        self.blocks = 0
+        self.stats = {field: {"min": [], "max": [], "sum": [], "count": []} for field in NUMERIC_FIELDS}
+
+    def refresh(self):
+        complete = len(self.store) // self.block_size
+        if complete <= self.blocks:
+            return
+        start, stop = self.blocks * self.block_size, complete * self.block_size
+        for field, stats in self.stats.items():
+            values = self.store.column(field)[start:stop].reshape(-1, self.block_size)
+            finite = np.isfinite(values)
+            stats["min"].extend(np.fmin.reduce(values, axis=1))
+            stats["max"].extend(np.fmax.reduce(values, axis=1))
+            stats["sum"].extend(np.where(finite, values, 0.0).sum(axis=1))
+            stats["count"].extend(finite.sum(axis=1))
+        self.blocks = complete
+
+    def clear(self):
+        self.blocks = 0
+        for stats in self.stats.values():
+            for values in stats.values():
+                values.clear()
+
+
+def _raw_stats(values):
+    finite = values[np.isfinite(values)]
+    if len(finite) == 0:
+        return np.nan, np.nan, 0.0, 0
+    return finite.min(), finite.max(), finite.sum(), len(finite)
+
+
+class TelemetryQuery:
+    """Range selection, aggregation and resampling over a TelemetryStore.
+
+    Ranges are given in MISSION_TIME seconds (the store's MISSION_SECONDS,
+    continuous across midnight) or PACKET_COUNT and resolved to
+    packet positions by binary search on a sorted key index. Aggregates over
+    long ranges combine per-block summaries and only scan the two partial
+    blocks at the edges.
+    """
+
+    def __init__(self, store, block_size=BLOCK_SIZE):
+        self.store = store
+        self.summary = BlockSummary(store, block_size)
+        self.keys = {by: np.empty(1024) for by in TIME_KEYS}
+        self.monotonic = dict.fromkeys(TIME_KEYS, True)
+        self.indexed = 0
+        self.generation = store.generation
+
+    def refresh(self):
+        """Index packets appended since the last query."""
+        total = len(self.store)
+        if self.generation != self.store.generation:  # the store was cleared
+            self.summary.clear()
+            self.monotonic = dict.fromkeys(TIME_KEYS, True)
+            self.indexed = 0
+            self.generation = self.store.generation
+        if total > self.indexed:
+            new = {
+                "MISSION_TIME": self.store.column("MISSION_SECONDS")[self.indexed:total],
+                "PACKET_COUNT": self.store.column("PACKET_COUNT")[self.indexed:total],
+            }
+            for by, values in new.items():
+                keys = self.keys[by]
+                if total > len(keys):
+                    keys = self.keys[by] = np.resize(keys, max(total, 2 * len(keys)))
+                keys[self.indexed:total] = values
+                # Only the new packets and the seam need checking
+                seam = keys[max(self.indexed - 1, 0):total]
+                if not np.all(seam[1:] >= seam[:-1]):
+                    self.monotonic[by] = False
+            self.indexed = total
+        self.summary.refresh()
+
+    def key(self, by):
+        if by not in TIME_KEYS:
+            raise ValueError(f"Unknown time key: {by}")
+        self.refresh()
+        return self.keys[by][:self.indexed]
+
+    def positions(self, start=None, stop=None, by="MISSION_TIME"):
+        """Packet positions [lo, hi) with start <= key <= stop."""
+        keys = self.key(by)
+        if not self.monotonic[by]:
+            raise ValueError(f"{by} is not monotonic (clock rollover or out-of-order packets)")
+        lo = 0 if start is None else int(np.searchsorted(keys, start, side="left"))
+        hi = len(keys) if stop is None else int(np.searchsorted(keys, stop, side="right"))
+        return lo, max(lo, hi)
+
+    def nearest(self, value, by="MISSION_TIME"):
+        """Position of the packet whose key is closest to `value`, None if no key is set.
+
+        Binary search when the key is monotonic; a key that is not (packets
+        before the first stamp, out-of-order packets) falls back to a scan.
+        """
+        keys = self.key(by)
+        if not self.monotonic[by]:
+            with np.errstate(invalid="ignore"):
+                distance = np.abs(keys - value)
+            return int(np.nanargmin(distance)) if np.isfinite(distance).any() else None
+        if len(keys) == 0:
+            return None
+        i = int(np.searchsorted(keys, value))
+        if i == len(keys) or (i > 0 and value - keys[i - 1] <= keys[i] - value):
+            return i - 1
+        return i
+
+    def select(self, fields, start=None, stop=None, by="MISSION_TIME"):
+        """DataFrame of `fields` for packets whose `by` key is in [start, stop]."""
+        lo, hi = self.positions(start, stop, by)
+        frame = pd.DataFrame({field: self.store.column(field)[lo:hi] for field in fields})
+        frame.index = pd.Index(self.key(by)[lo:hi], name=by)
+        return frame
+
+    def _range_stats(self, field, lo, hi):
+        """(min, max, sum, count) over positions [lo, hi) using block summaries."""
+        values = self.store.column(field)
+        size = self.summary.block_size
+        first, last = -(-lo // size), min(hi // size, self.summary.blocks)
+        if last <= first:
+            return _raw_stats(values[lo:hi])
+        stats = self.summary.stats[field]
+        parts = [
+            _raw_stats(values[lo:first * size]),
+            _raw_stats(values[last * size:hi]),
+            (np.fmin.reduce(stats["min"][first:last]), np.fmax.reduce(stats["max"][first:last]),
+             sum(stats["sum"][first:last]), sum(stats["count"][first:last])),
+        ]
+        count = sum(p[3] for p in parts)
+        return (np.fmin.reduce([p[0] for p in parts]), np.fmax.reduce([p[1] for p in parts]),
+                sum(p[2] for p in parts), count)
+
+    def aggregate(self, fields, start=None, stop=None, by="MISSION_TIME"):
+        """min/max/mean/count per field over a key range, as a DataFrame."""
+        lo, hi = self.positions(start, stop, by)
+        rows = {}
+        for field in fields:
+            low, high, total, count = self._range_stats(field, lo, hi)
+            rows[field] = {"min": low, "max": high,
+                           "mean": total / count if count else np.nan, "count": count}
+        return pd.DataFrame(rows).T
+
+    def resample(self, fields, window, start=None, stop=None, by="MISSION_TIME",
+                 stats=("min", "max", "mean")):
+        """Aggregate `fields` over consecutive windows of `window` key units."""
+        keys = self.key(by)
+        lo, hi = self.positions(start, stop, by)
+        if hi <= lo:
+            return pd.DataFrame()
+        first = keys[lo] if start is None else start
+        last = keys[hi - 1] if stop is None else stop
+        edges = first + window * np.arange(int((last - first) // window) + 2)
+        bounds = np.searchsorted(keys[lo:hi], edges, side="left") + lo
+        wide = (hi - lo) / (len(bounds) - 1) >= self.summary.block_size
+        result = {}
+        for field in fields:
+            if wide:
+                windows = [self._range_stats(field, a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+                low, high, total, count = (np.array(v, dtype=float) for v in zip(*windows))
+            else:
+                low, high, total, count = self._window_stats(field, bounds)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                values = {"min": low, "max": high, "mean": total / count, "count": count}
+            for stat in stats:
+                result[(field, stat)] = values[stat]
+        frame = pd.DataFrame(result, index=pd.Index(edges[:-1], name=by))
+        frame.columns = pd.MultiIndex.from_tuples(frame.columns)
+        return frame
+
+    def _window_stats(self, field, bounds):
+        """Raw per-window stats with ufunc.reduceat, for windows narrower than a block."""
+        lo, hi = bounds[0], bounds[-1]
+        values = self.store.column(field)[lo:hi]
+        finite = np.isfinite(values)
+        starts = np.minimum(bounds[:-1] - lo, max(len(values) - 1, 0))
+        empty = bounds[1:] == bounds[:-1]
+        if len(values) == 0:
+            nan = np.full(len(starts), np.nan)
+            return nan, nan, np.zeros(len(starts)), np.zeros(len(starts))
+        low = np.fmin.reduceat(values, starts)
+        high = np.fmax.reduceat(values, starts)
+        total = np.add.reduceat(np.where(finite, values, 0.0), starts)
+        count = np.add.reduceat(finite.astype(float), starts)
+        low[empty] = high[empty] = np.nan
+        total[empty] = count[empty] = 0
+        return low, high, total, count
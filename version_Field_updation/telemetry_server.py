@@ -0,0 +1,323 @@
+"""Local publish/subscribe fan-out of the parsed telemetry stream.
+
+The process that owns the serial port publishes packets; any number of GUIs
+or scripts subscribe over TCP (host:port) or a Unix socket (unix:/path).
+Packets are batched into binary frames:
+
+    header  "CSAT" | packet count (u32) | payload length (u32)
+    payload float64 block, NUMERIC_FIELDS x count, field-major
+            byte length (u32) of every text value, TEXT_FIELDS x count, field-major
+            the UTF-8 text values back to back, in the same order
+
+Each subscriber has its own bounded queue and drop policy, so one slow
+consumer never stalls the publisher or the other subscribers.
+"""
+import os
+import socket
+import stat
+import struct
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from telemetry_store import FIELDS, NUMERIC_FIELDS, TEXT_FIELDS
+
+DEFAULT_ADDRESS = "127.0.0.1:5760"
+HEADER = struct.Struct("<4sII")
+MAGIC = b"CSAT"
+TEXT_ORDER = [field for field in FIELDS if field in TEXT_FIELDS]
+DROP_POLICIES = ("drop_oldest", "drop_newest", "disconnect")
+
+
+def parse_address(address):
+    """"host:port" -> (AF_INET, (host, port)), "unix:/path" -> (AF_UNIX, path)."""
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def remove_stale_socket(path):
+    """Unlink the Unix socket at `path` if no server is listening on it any more."""
+    try:
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            return
+    except FileNotFoundError:
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)  # left behind by a server that did not stop cleanly
+    finally:
+        probe.close()
+
+
+def encode_frame(columns):
+    """Encode a dict of columns (TelemetryStore.extend input) into one binary frame."""
+    count = len(columns[FIELDS[0]])
+    numeric = np.array([columns[field] for field in NUMERIC_FIELDS], dtype="<f8")
+    # Length-prefixed, so a text value may hold any character
+    text = [("" if value is None else str(value)).encode("utf-8") for field in TEXT_ORDER for value in columns[field]]
+    lengths = np.fromiter(map(len, text), dtype="<u4", count=len(text))
+    payload = numeric.tobytes() + lengths.tobytes() + b"".join(text)
+    return HEADER.pack(MAGIC, count, len(payload)) + payload
+
+
+def decode_frame(count, payload):
+    """Decode a frame payload into a dict of columns (TelemetryStore.extend input)."""
+    numeric_size = 8 * count * len(NUMERIC_FIELDS)
+    numeric = np.frombuffer(payload[:numeric_size], dtype="<f8").reshape(len(NUMERIC_FIELDS), count)
+    columns = dict(zip(NUMERIC_FIELDS, numeric))
+    lengths = np.frombuffer(payload, dtype="<u4", count=count * len(TEXT_ORDER), offset=numeric_size)
+    ends = numeric_size + 4 * len(lengths) + np.cumsum(lengths, dtype=np.int64)
+    text = [payload[start:end].decode("utf-8") for start, end in zip((ends - lengths).tolist(), ends.tolist())]
+    for i, field in enumerate(TEXT_ORDER):
+        columns[field] = np.array(text[i * count:(i + 1) * count], dtype=object)
+    return columns
+
+
+class Subscriber:
+    """One connected client with a bounded frame queue and its sender thread."""
+
+    def __init__(self, conn, server, max_frames, policy):
+        self.conn = conn
+        self.server = server
+        self.max_frames = max_frames
+        self.policy = policy
+        self.queue = deque()
+        self.cond = threading.Condition()
+        self.dropped = 0
+        self.sent = 0
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def enqueue(self, frame):
+        with self.cond:
+            if self.closed:
+                return
+            if len(self.queue) >= self.max_frames:
+                self.dropped += 1
+                if self.policy == "drop_newest":
+                    return
+                if self.policy == "disconnect":
+                    self.closed = True
+                    self.cond.notify()
+                    self._shutdown()  # unblocks a sender stuck in sendall()
+                    return
+                self.queue.popleft()
+            self.queue.append(frame)
+            self.cond.notify()
+
+    def run(self):
+        try:
+            while True:
+                with self.cond:
+                    while not self.queue and not self.closed:
+                        self.cond.wait()
+                    if self.closed:
+                        break
+                    frame = self.queue.popleft()
+                self.conn.sendall(frame)
+                self.sent += 1
+        except OSError:
+            pass
+        self.close()
+
+    def _shutdown(self):
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify()
+        self._shutdown()
+        self.conn.close()
+        self.server.remove(self)
+
+
+class TelemetryServer:
+    """Fans published packets out to every connected subscriber."""
+
+    def __init__(self, address=DEFAULT_ADDRESS, max_frames=256, policy="drop_oldest",
+                 batch_interval=0.05, max_batch=1024):
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {policy}")
+        self.address = address
+        self.max_frames = max_frames
+        self.policy = policy
+        self.batch_interval = batch_interval
+        self.max_batch = max_batch
+        self.subscribers = []
+        self.pending = []  # batches (dicts of columns) not sent yet
+        self.pending_count = 0
+        self.lock = threading.Lock()
+        self.running = False
+        self.sock = None
+
+    def start(self):
+        family, bind_address = parse_address(self.address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        else:
+            remove_stale_socket(bind_address)
+        try:
+            self.sock.bind(bind_address)
+        except OSError:
+            self.sock.close()
+            raise
+        self.sock.listen()
+        if family == socket.AF_INET:
+            # Report the real port when bound to port 0
+            self.address = "%s:%d" % self.sock.getsockname()[:2]
+        self.running = True
+        threading.Thread(target=self.accept_loop, daemon=True).start()
+        threading.Thread(target=self.flush_loop, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.running = False
+        self.flush()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)  # wakes accept_loop
+        except OSError:
+            pass
+        self.sock.close()
+        family, bind_address = parse_address(self.address)
+        if family == socket.AF_UNIX:
+            try:
+                os.unlink(bind_address)
+            except OSError:
+                pass
+        for subscriber in list(self.subscribers):
+            subscriber.close()
+
+    def accept_loop(self):
+        while self.running:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                break
+            if conn.family == socket.AF_INET:
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            subscriber = Subscriber(conn, self, self.max_frames, self.policy)
+            with self.lock:
+                self.subscribers.append(subscriber)
+            subscriber.start()  # only once listed, so a client that hangs up at once is removed
+
+    def remove(self, subscriber):
+        with self.lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+
+    def publish(self, columns):
+        """Queue a batch of parsed packets (dict of columns) for the next frame."""
+        with self.lock:
+            self.pending.append(columns)
+            self.pending_count += len(columns[FIELDS[0]])
+            full = self.pending_count >= self.max_batch
+        if full:
+            self.flush()
+
+    def flush(self):
+        with self.lock:
+            batches, self.pending, self.pending_count = self.pending, [], 0
+            subscribers = list(self.subscribers)
+        if not batches or not subscribers:
+            return
+        if len(batches) > 1:
+            columns = {field: np.concatenate([batch[field] for batch in batches]) for field in FIELDS}
+        else:
+            columns = batches[0]
+        frame = encode_frame(columns)  # encoded once, shared by all subscribers
+        for subscriber in subscribers:
+            subscriber.enqueue(frame)
+
+    def flush_loop(self):
+        while self.running:
+            time.sleep(self.batch_interval)
+            self.flush()
+
+    def stats(self):
+        with self.lock:
+            return [{"sent": s.sent, "dropped": s.dropped, "queued": len(s.queue)}
+                    for s in self.subscribers]
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class TelemetryClient:
+    """Blocking subscriber: yields one dict of columns per received frame."""
+
+    def __init__(self, address=DEFAULT_ADDRESS):
+        family, connect_address = parse_address(address)
+        self.sock = socket.socket(family, socket.SOCK_STREAM)
+        self.sock.connect(connect_address)
+
+    def read_batch(self):
+        header = _recv_exact(self.sock, HEADER.size)
+        if header is None:
+            return None
+        magic, count, length = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("Bad frame header from telemetry server")
+        payload = _recv_exact(self.sock, length)
+        if payload is None:
+            return None
+        return decode_frame(count, payload)
+
+    def __iter__(self):
+        while True:
+            batch = self.read_batch()
+            if batch is None:
+                return
+            yield batch
+
+    def close(self):
+        self.sock.close()
+
+
+def subscription_worker(address, parent=None):
+    """QThread emitting `batch(dict)` for every frame received from a server."""
+    from PyQt5.QtCore import QThread, pyqtSignal
+
+    class SubscriptionWorker(QThread):
+        batch = pyqtSignal(object)
+        failed = pyqtSignal(str)
+
+        def run(self):
+            try:
+                client = TelemetryClient(address)
+                for columns in client:
+                    self.batch.emit(columns)
+            except OSError as e:
+                self.failed.emit(str(e))
+
+    return SubscriptionWorker(parent)
+
+
+if __name__ == '__main__':
+    # Minimal console subscriber: python telemetry_server.py [host:port | unix:/path]
+    client = TelemetryClient(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_ADDRESS)
+    for columns in client:
+        print(f"{len(columns['PACKET_COUNT'])} packets, last PACKET_COUNT="
+              f"{columns['PACKET_COUNT'][-1]:.0f}")
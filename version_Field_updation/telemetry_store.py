@@ -0,0 +1,169 @@
+import numpy as np
+
+from mission_time import MissionClock
+
+# Column order of the competition telemetry packet (same as cansat_Data.csv)
+FIELDS = [
+    "TEAM_ID", "MISSION_TIME", "PACKET_COUNT", "MODE", "STATE", "ALTITUDE",
+    "AIR_SPEED", "HS_DEPLOYED", "PC_DEPLOYED", "TEMPERATURE", "VOLTAGE",
+    "PRESSURE", "GPS_TIME", "GPS_ALTITUDE", "GPS_LATITUDE", "GPS_LONGITUDE",
+    "GPS_SATS", "TILT_X", "TILT_Y", "ROT_Z", "CMD_ECHO", "GYRO_P", "GYRO_Y",
+    "ACCEL_R", "ACCEL_P", "ACCEL_Y", "POINTING_ERROR", "WIRE_FIN", "WIRE_HS",
+    "WIRE_PC"
+]
+
+# Fields kept as text, everything else is stored as float64
+TEXT_FIELDS = {
+    "MISSION_TIME", "MODE", "STATE", "HS_DEPLOYED", "PC_DEPLOYED", "GPS_TIME",
+    "CMD_ECHO", "WIRE_FIN", "WIRE_HS", "WIRE_PC"
+}
+
+NUMERIC_FIELDS = [field for field in FIELDS if field not in TEXT_FIELDS]
+
+# Numeric columns computed by the store itself on ingest
+DERIVED_FIELDS = ["MISSION_SECONDS"]
+
+# Plot title and unit of every numeric field
+FIELD_LABELS = {
+    "TEAM_ID": ("Team ID", ""),
+    "PACKET_COUNT": ("Packet count", ""),
+    "ALTITUDE": ("Altitude", "m"),
+    "AIR_SPEED": ("Air speed", "m/s"),
+    "TEMPERATURE": ("Temperature", "°C"),
+    "VOLTAGE": ("Voltage", "V"),
+    "PRESSURE": ("Pressure", "kPa"),
+    "GPS_ALTITUDE": ("GPS altitude", "m"),
+    "GPS_LATITUDE": ("GPS latitude", "deg"),
+    "GPS_LONGITUDE": ("GPS longitude", "deg"),
+    "GPS_SATS": ("GPS sats", ""),
+    "TILT_X": ("Tilt X", "deg"),
+    "TILT_Y": ("Tilt Y", "deg"),
+    "ROT_Z": ("Rotation Z", "deg/s"),
+    "GYRO_P": ("Gyro P", "deg/s"),
+    "GYRO_Y": ("Gyro Y", "deg/s"),
+    "ACCEL_R": ("Accel R", "m/s²"),
+    "ACCEL_P": ("Accel P", "m/s²"),
+    "ACCEL_Y": ("Accel Y", "m/s²"),
+    "POINTING_ERROR": ("Pointing error", "deg"),
+    "MISSION_SECONDS": ("Mission time", "s"),
+}
+
+# Numeric fields written back out without a decimal part
+INTEGER_FIELDS = ["TEAM_ID", "PACKET_COUNT", "GPS_SATS"]
+
+
+def to_float(value):
+    """Convert a raw telemetry value to float, NaN if it is not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def packet_columns(packets):
+    """Dict of columns of a list of packet dicts, numeric fields as float arrays."""
+    return {field: np.array([to_float(packet.get(field)) for packet in packets]) if field in NUMERIC_FIELDS
+            else np.array([packet.get(field) for packet in packets], dtype=object)
+            for field in FIELDS}
+
+
+def format_value(field, value):
+    """Display text for a stored value (integers without a decimal part)."""
+    if field in TEXT_FIELDS:
+        return "" if value is None else str(value)
+    if np.isnan(value):
+        return "-"
+    if field in INTEGER_FIELDS:
+        return str(int(value))
+    return f"{value:g}"
+
+
+class TelemetryStore:
+    """Append-only columnar store holding one numpy array per telemetry field."""
+
+    def __init__(self, capacity=4096):
+        self.length = 0
+        self.capacity = capacity
+        self.columns = {}
+        for field in FIELDS + DERIVED_FIELDS:
+            self.columns[field] = self._new_column(field, capacity)
+        # MISSION_TIME is parsed once on ingest into continuous MISSION_SECONDS
+        self.clock = MissionClock()
+        self.generation = 0  # bumped by clear(), so caches over the store can tell it started over
+
+    def _new_column(self, field, size):
+        if field in TEXT_FIELDS:
+            return np.empty(size, dtype=object)
+        return np.full(size, np.nan)
+
+    def _reserve(self, count):
+        """Grow every column (by doubling) so `count` more rows fit."""
+        needed = self.length + count
+        if needed <= self.capacity:
+            return
+        capacity = self.capacity
+        while capacity < needed:
+            capacity *= 2
+        for field, old in self.columns.items():
+            column = self._new_column(field, capacity)
+            column[:self.length] = old[:self.length]
+            self.columns[field] = column
+        self.capacity = capacity
+
+    def append(self, packet):
+        """Append one packet given as a dict or a sequence in FIELDS order."""
+        if not isinstance(packet, dict):
+            packet = dict(zip(FIELDS, packet))
+        self._reserve(1)
+        i = self.length
+        for field in FIELDS:
+            value = packet.get(field)
+            if field in TEXT_FIELDS:
+                self.columns[field][i] = None if value is None else str(value)
+            else:
+                self.columns[field][i] = to_float(value)
+        self.columns["MISSION_SECONDS"][i] = self.clock.push(self.columns["MISSION_TIME"][i])
+        self.length += 1
+
+    def extend(self, frame):
+        """Append a block of packets from a DataFrame or dict of columns."""
+        present = [field for field in FIELDS if field in frame]
+        count = len(frame[present[0]]) if present else 0
+        if count == 0:
+            return
+        self._reserve(count)
+        start, stop = self.length, self.length + count
+        for field in FIELDS:
+            column = self.columns[field]
+            if field not in frame:
+                column[start:stop] = None if field in TEXT_FIELDS else np.nan
+                continue
+            values = np.asarray(frame[field])
+            if field in TEXT_FIELDS:
+                column[start:stop] = values if values.dtype == object else values.astype(str)
+            else:
+                column[start:stop] = self._coerce(values)
+        self.columns["MISSION_SECONDS"][start:stop] = self.clock.extend(self.columns["MISSION_TIME"][start:stop])
+        self.length = stop
+
+    @staticmethod
+    def _coerce(values):
+        if values.dtype.kind in "fiub":
+            return values.astype(np.float64)
+        return np.array([to_float(v) for v in values])
+
+    def column(self, field):
+        """Return the filled part of a column as a view (no copy)."""
+        return self.columns[field][:self.length]
+
+    def row(self, index):
+        """Return packet `index` as a dict."""
+        return {field: column[index] for field, column in self.columns.items()}
+
+    def clear(self):
+        self.length = 0
+        self.generation += 1
+        self.clock.reset()
+
+    def __len__(self):
+        return self.length
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import exporter
+from telemetry_store import FIELDS, TelemetryStore
+
+
+@pytest.fixture
+def store():
+    store = TelemetryStore()
+    store.extend({
+        "TEAM_ID": np.array([2044.0, 2044.0, np.nan]),
+        "MISSION_TIME": np.array(["12:00:00", None, "12:00:02"], dtype=object),
+        "PACKET_COUNT": np.array([1.0, 2.0, 3.0]),
+        "STATE": np.array(["ASCENT", "", None], dtype=object),
+        "ALTITUDE": np.array([101.0, np.nan, 1.25e-5]),
+        "PRESSURE": np.array([101.325, 3.0, 1e20]),
+    })
+    return store
+
+
+def export_both(store, tmp_path, monkeypatch):
+    arrow, fallback = tmp_path / "arrow.csv", tmp_path / "pandas.csv"
+    exporter.export_csv(store, arrow, block_size=2)
+    monkeypatch.setattr(exporter, "pa", None)
+    exporter.export_csv(store, fallback, block_size=2)
+    return arrow, fallback
+
+
+@pytest.mark.skipif(exporter.pa is None, reason="needs pyarrow")
+def test_csv_backends_write_the_same_fields(store, tmp_path, monkeypatch):
+    arrow, fallback = export_both(store, tmp_path, monkeypatch)
+    text = [pd.read_csv(path, dtype=str, keep_default_na=False) for path in (arrow, fallback)]
+    assert list(text[0].columns) == FIELDS
+    # Missing values are empty fields with either backend, never "nan"
+    pd.testing.assert_frame_equal(text[0] == "", text[1] == "")
+    assert not (text[0] == "nan").any().any()
+    pd.testing.assert_frame_equal(pd.read_csv(arrow), pd.read_csv(fallback))
+
+
+@pytest.mark.parametrize("backend", ["arrow", "pandas"])
+def test_text_with_commas_quotes_and_newlines_round_trips(store, tmp_path, monkeypatch, backend):
+    echoes = ["CX,ON", 'SIM "ENABLE"', "ST\nGPS"]
+    store.columns["CMD_ECHO"][:3] = echoes
+    if backend == "pandas":
+        monkeypatch.setattr(exporter, "pa", None)
+    elif exporter.pa is None:
+        pytest.skip("needs pyarrow")
+    path = tmp_path / "export.csv"
+    exporter.export_csv(store, path, block_size=2)
+    data = pd.read_csv(path, dtype=str, keep_default_na=False)
+    assert list(data.columns) == FIELDS
+    assert list(data["CMD_ECHO"]) == echoes
+    assert list(data["STATE"]) == ["ASCENT", "", ""]
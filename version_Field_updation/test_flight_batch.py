@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from flight_batch import read_flight, summarize_flight
+from telemetry_store import FIELDS
+
+HEADER = ",".join(FIELDS)
+PACKET = "2044,12:00:{:02d},{},F,ASCENT,{},0,N,N,22,3.3,101,12:00:00,0,55,23,8,0,0,0,NO_CMD,0,0,0,0,0,0,OK,OK,OK"
+
+
+@pytest.fixture
+def flight(tmp_path):
+    path = tmp_path / "flight.csv"
+    lines = [HEADER] + [PACKET.format(i, i + 1, 10.0 * i) for i in range(5)]
+    lines[2] = lines[2].replace(",10.0,", ",10.0.0,")  # altitude not a number
+    lines[3] = lines[3][:20]                           # cut short
+    lines.insert(4, "")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_malformed_rows_are_skipped_and_counted(flight):
+    data, bad_rows = read_flight(flight)
+    assert bad_rows == 2
+    assert list(data.columns) == FIELDS
+    assert list(data["PACKET_COUNT"]) == [1.0, 4.0, 5.0]
+    assert np.isclose(summarize_flight(flight)["apogee_m"], 40.0)
+
+
+def test_columns_are_taken_from_the_header(tmp_path):
+    path = tmp_path / "partial.csv"
+    path.write_text("MISSION_TIME,ALTITUDE,NOTE\n12:00:00,1,a\n12:00:01,2,b\n12:00:02,1e9,c\n")
+    data, bad_rows = read_flight(path)
+    assert list(data.columns) == ["MISSION_TIME", "ALTITUDE"]
+    assert list(data["ALTITUDE"]) == [1.0, 2.0]
+    assert bad_rows == 1  # out of range
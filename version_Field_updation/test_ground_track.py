@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5.QtGui import QImage  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+import ground_track  # noqa: E402
+from ground_track import TileCache  # noqa: E402
+
+
+@pytest.fixture
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def seed(cache, z, x, y):
+    path = cache.path(z, x, y)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image = QImage(8, 8, QImage.Format_RGB32)
+    image.fill(0)
+    assert image.save(path)
+
+
+def test_missing_tile_is_retried_after_expiry(app, tmp_path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(ground_track.time, "monotonic", lambda: now[0])
+    cache = TileCache(str(tmp_path), miss_expiry=30.0)
+    assert cache.get(3, 1, 2) is None
+
+    seed(cache, 3, 1, 2)
+    now[0] += 10.0
+    assert cache.get(3, 1, 2) is None  # the miss is still remembered
+
+    now[0] += 25.0
+    pixmap = cache.get(3, 1, 2)
+    assert pixmap is not None and pixmap.width() == 8
+    assert cache.get(3, 1, 2) is pixmap
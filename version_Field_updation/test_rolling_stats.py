@@ -0,0 +1,35 @@
+import numpy as np
+
+from rolling_stats import RollingStats
+from telemetry_store import TelemetryStore
+
+
+def clock(seconds):
+    return np.array([f"12:00:{s:02d}" for s in seconds], dtype=object)
+
+
+def test_row_matches_the_last_window():
+    store = TelemetryStore()
+    altitude = np.array([3.0, np.nan, 1.0, 4.0, 1.0, 5.0, np.inf, 2.0, 6.0, 5.0, 3.0, 5.0])
+    store.extend({"MISSION_TIME": clock(range(len(altitude))), "ALTITUDE": altitude})
+    rolling = RollingStats(store, ["ALTITUDE"], window=4)
+    low, high, mean, std, rate = rolling.row(7)["ALTITUDE"]
+    window = np.array([1.0, 5.0, 2.0])  # packets 4..7, without the inf
+    assert (low, high) == (1.0, 5.0)
+    assert np.isclose(mean, window.mean()) and np.isclose(std, window.std(ddof=1))
+    assert rate == (2.0 - 5.0) / 2  # from 12:00:05 to 12:00:07, skipping the inf
+
+
+def test_rate_uses_first_value_at_each_stamp_within_the_window():
+    store = TelemetryStore()
+    store.extend({"MISSION_TIME": clock([0, 0, 1, 1, 1, 2, 2]),
+                  "ALTITUDE": np.array([0.0, 5.0, 10.0, 15.0, 20.0, 30.0, 35.0])})
+    rolling = RollingStats(store, ["ALTITUDE"], window=4)
+    rates = rolling.series("ALTITUDE:RATE")
+    assert np.isnan(rates[:2]).all()
+    assert (rates[2:4] == 10.0).all()
+    assert rates[4] == 5.0  # the first value at 12:00:00 is out of the window, the second is the first left
+    assert list(rates[5:]) == [20.0, 15.0]
+    # Nothing before the window is looked at, however long the store
+    store.extend({"MISSION_TIME": clock([3, 4]), "ALTITUDE": np.array([40.0, 42.0])})
+    assert rolling.row(8)["ALTITUDE"][4] == 2.0
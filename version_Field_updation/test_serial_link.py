@@ -0,0 +1,53 @@
+import os
+import time
+
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from serial_link import SerialLink
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "openpty"), reason="needs pseudo-terminals")
+
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def pty():
+    """(writer fd, device path) of a pseudo-terminal standing in for a serial port."""
+    master, slave = os.openpty()
+    return master, os.ttyname(slave)
+
+
+def wait_for(app, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def connected(link, port):
+    connection = link.connection
+    return connection is not None and connection.port == port
+
+
+def test_open_moves_a_connected_link_to_the_new_port(app):
+    (first, first_port), (second, second_port) = pty(), pty()
+    link = SerialLink()
+    received = []
+    link.lines.connect(received.extend)
+    try:
+        link.open(first_port)
+        assert wait_for(app, lambda: connected(link, first_port))  # opening the port flushes its input
+        os.write(first, b"from first\n")
+        assert wait_for(app, lambda: "from first" in received)
+
+        link.open(second_port)
+        assert wait_for(app, lambda: connected(link, second_port))
+        os.write(second, b"from second\n")
+        assert wait_for(app, lambda: "from second" in received)
+        assert link.port == second_port
+    finally:
+        link.close()
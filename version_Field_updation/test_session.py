@@ -0,0 +1,25 @@
+import os
+
+import numpy as np
+
+from session import Session
+
+
+def test_second_session_does_not_take_over_a_running_one(tmp_path):
+    directory = str(tmp_path / "session")
+    first = Session(directory)
+    store = first.store("2044")
+    store.extend({"ALTITUDE": np.array([1.0, 2.0])})
+    first.checkpoint({})  # not clean: looks like a crash to anyone who may take it over
+
+    second = Session(directory)
+    assert second.directory == directory + "-1"
+    assert second.resumed is None
+    assert os.path.exists(first.path)  # neither resumed nor deleted
+    second.close({})
+
+    first.lock.close()  # as if the first console crashed
+    third = Session(directory)
+    assert third.directory == directory
+    assert third.resumed["stores"]["2044"]["length"] == 2
+    third.close({})
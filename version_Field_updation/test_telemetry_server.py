@@ -0,0 +1,19 @@
+import numpy as np
+
+from telemetry_server import HEADER, MAGIC, decode_frame, encode_frame
+from telemetry_store import FIELDS, NUMERIC_FIELDS, TEXT_FIELDS
+
+
+def test_text_values_survive_any_character():
+    echoes = ["CX\x1fON", "", "ÉCHO,\n\x00", None]
+    columns = {field: np.array([f"{field}{i}" for i in range(4)], dtype=object) if field in TEXT_FIELDS
+               else np.arange(4, dtype=float) for field in FIELDS}
+    columns["CMD_ECHO"] = np.array(echoes, dtype=object)
+    frame = encode_frame(columns)
+    magic, count, size = HEADER.unpack_from(frame)
+    assert (magic, count, size) == (MAGIC, 4, len(frame) - HEADER.size)
+    decoded = decode_frame(count, frame[HEADER.size:])
+    assert list(decoded["CMD_ECHO"]) == ["CX\x1fON", "", "ÉCHO,\n\x00", ""]
+    assert list(decoded["STATE"]) == ["STATE0", "STATE1", "STATE2", "STATE3"]
+    for field in NUMERIC_FIELDS:
+        assert np.array_equal(decoded[field], columns[field])
@@ -0,0 +1,99 @@
+import numpy as np
+
+from heading import Heading
+from rolling_stats import RollingStats
+from telemetry_query import TelemetryQuery
+from telemetry_store import TelemetryStore, to_float
+
+
+def team_key(value):
+    """Canonical TEAM_ID text ("2044" for 2044, 2044.0 or " 2044"), None if missing."""
+    number = to_float(value)
+    if np.isnan(number):
+        return None
+    return str(int(number)) if number == int(number) else str(value).strip()
+
+
+class Vehicle:
+    """Everything recorded for one TEAM_ID. Views are attached by the GUI."""
+
+    def __init__(self, team_id, store=None):
+        self.team_id = team_id
+        self.store = store if store is not None else TelemetryStore()
+        self.query = TelemetryQuery(self.store)
+        self.rolling = RollingStats(self.store)
+        self.heading = Heading(self.store)
+        self.views = {}
+
+    def clear(self):
+        self.store.clear()
+
+
+class VehicleRouter:
+    """Routes packets to a per-vehicle store by TEAM_ID.
+
+    Raw TEAM_ID values are looked up in a dict of everything seen so far,
+    so dispatching a packet is a single hash lookup; only a value never
+    seen before is parsed. Packets without a TEAM_ID go to `default`.
+    `on_new(vehicle)` is called when a new TEAM_ID first shows up, and
+    `store_factory(team_id)`, if given, supplies the new vehicle's store.
+    """
+
+    def __init__(self, default, on_new=None, store_factory=None):
+        self.vehicles = {}
+        self.aliases = {}
+        self.on_new = on_new
+        self.store_factory = store_factory
+        self.default = self.vehicle(default)
+
+    def vehicle(self, team_id):
+        key = team_key(team_id)
+        vehicle = self.vehicles.get(key)
+        if vehicle is None:
+            store = self.store_factory(key) if self.store_factory is not None else None
+            vehicle = self.vehicles[key] = Vehicle(key, store)
+            if self.on_new is not None:
+                self.on_new(vehicle)
+        return vehicle
+
+    def route(self, team_id):
+        """Vehicle for a raw TEAM_ID value."""
+        try:
+            return self.aliases[team_id]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable value
+            return self.default
+        if team_key(team_id) is None:
+            return self.default  # not cached: NaNs never compare equal
+        vehicle = self.aliases[team_id] = self.vehicle(team_id)
+        return vehicle
+
+    def extend(self, frame):
+        """Split a block of packets (dict of columns) by TEAM_ID; returns the vehicles hit."""
+        if "TEAM_ID" not in frame:
+            self.default.store.extend(frame)
+            return [self.default]
+        teams = np.asarray(frame["TEAM_ID"])
+        values, inverse = np.unique(teams.astype(str), return_inverse=True)
+        if len(values) == 1:
+            vehicle = self.route(teams[0])
+            vehicle.store.extend(frame)
+            return [vehicle]
+        hit = []
+        for i, value in enumerate(values):
+            rows = inverse == i
+            vehicle = self.route(teams[np.argmax(rows)])
+            vehicle.store.extend({field: np.asarray(column)[rows] for field, column in frame.items()})
+            hit.append(vehicle)
+        return hit
+
+    def clear(self):
+        for vehicle in self.vehicles.values():
+            vehicle.clear()
+
+    def __iter__(self):
+        return iter(self.vehicles.values())
+
+    def __len__(self):
+        return len(self.vehicles)
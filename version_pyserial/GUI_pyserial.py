@@ -1,14 +1,34 @@
+import os
 import sys
-import pandas as pd
-import pyqtgraph as pg
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from startup import StartupTimer, cached_logo
+startup = StartupTimer("GUI_pyserial")
+
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
     QGroupBox, QHBoxLayout, QLabel, QPushButton, QComboBox, QLineEdit, 
     QGridLayout, QFrame)
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QFont, QPixmap
-import os
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
 from datetime import datetime
-import serial
+from collections import deque
+startup.mark("imports")
+
+MAX_BUFFERED_ROWS = 10000  # Rows kept for the graphs; older ones are dropped
+# Column order of the competition telemetry packet, and the fields that are not numbers
+PACKET_FIELDS = [
+    "TEAM_ID", "MISSION_TIME", "PACKET_COUNT", "MODE", "STATE", "ALTITUDE",
+    "AIR_SPEED", "HS_DEPLOYED", "PC_DEPLOYED", "TEMPERATURE", "VOLTAGE",
+    "PRESSURE", "GPS_TIME", "GPS_ALTITUDE", "GPS_LATITUDE", "GPS_LONGITUDE",
+    "GPS_SATS", "TILT_X", "TILT_Y", "ROT_Z", "CMD_ECHO", "GYRO_P", "GYRO_Y",
+    "ACCEL_R", "ACCEL_P", "ACCEL_Y", "POINTING_ERROR", "WIRE_FIN", "WIRE_HS",
+    "WIRE_PC"
+]
+TEXT_FIELDS = {
+    "MISSION_TIME", "MODE", "STATE", "HS_DEPLOYED", "PC_DEPLOYED", "GPS_TIME",
+    "CMD_ECHO", "WIRE_FIN", "WIRE_HS", "WIRE_PC"
+}
+# Packet field behind each of the six graphs, in graph order
+PLOTTED_FIELDS = ["PRESSURE", "ALTITUDE", "TILT_X", "TEMPERATURE", "AIR_SPEED", "TILT_Y"]
 
 class CanSatGroundControl(QMainWindow):
     def __init__(self):
@@ -16,9 +36,10 @@ class CanSatGroundControl(QMainWindow):
         
         # Initialize serial connection
         self.serial_connection = None
-        self.serial_data_buffer = []
-        self.connect_to_serial()
+        self.serial_data_buffer = deque(maxlen=MAX_BUFFERED_ROWS)
+        self.validator = None  # PacketValidator, created with the plots after the first paint
         
+        # Serial port and plots are set up after the window is first painted
         self.initUI()
         
         # Update timer
@@ -27,6 +48,7 @@ class CanSatGroundControl(QMainWindow):
         self.timer.start(1000)  # Update every second
 
     def connect_to_serial(self):
+        import serial
         try:
             # Replace 'COM3' with the appropriate port for your system
             self.serial_connection = serial.Serial(port='COM3', baudrate=9600, timeout=1)
@@ -50,9 +72,9 @@ class CanSatGroundControl(QMainWindow):
         # Logo with empty image path
         logo_label = QLabel()
         logo_path = "logo.png"  # Just replace this path with your logo path
-        if os.path.exists(logo_path):
-            logo_pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(logo_pixmap.scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        logo_pixmap = cached_logo(logo_path, 50)
+        if logo_pixmap is not None:
+            logo_label.setPixmap(logo_pixmap)
         logo_label.setFixedSize(50, 50)
         logo_label.setStyleSheet("border: 1px solid #ccc;")  # Light border to show logo area when empty
         
@@ -127,33 +149,9 @@ class CanSatGroundControl(QMainWindow):
         # Right panel - Graphs
         graphs_layout = QGridLayout()
         
-        # Create graphs with titles
-        graphs = [
-            ("Pressure", "Pa"),
-            ("Altitude", "m"),
-            ("Tilt X", "deg"),
-            ("Temperature", "°C"),
-            ("Air speed", "m/s"),
-            ("Tilt Y", "deg")
-        ]
+        # Graphs are built by build_graphs() once the window is on screen
+        self.graphs_layout = graphs_layout
         
-        for i, (title, unit) in enumerate(graphs):
-            plot = pg.PlotWidget(title=f"{title} ({unit}) vs Time")  # Add title here
-            plot.setBackground('w')
-            plot.showGrid(x=True, y=True)
-            plot.setLabel('left', f'{title} ({unit})')
-            plot.setLabel('bottom', 'Time (s)')  # Changed from 'Packet' to 'Time (s)'
-            
-            # Customize title style
-            plot.setTitle(f"{title} ({unit})", size="12pt")
-            
-            # Store plot reference
-            setattr(self, f'{title.lower().replace(" ", "_")}_plot', plot)
-            setattr(self, f'{title.lower().replace(" ", "_")}_curve', 
-                   plot.plot(pen=pg.mkPen(color='b', width=2)))
-            
-            graphs_layout.addWidget(plot, i//3, i%3)
-            
         content_layout.addLayout(graphs_layout)
         
         # Set content layout stretch
@@ -172,6 +170,8 @@ class CanSatGroundControl(QMainWindow):
         
         bottom_layout.addWidget(cmd_input)
         bottom_layout.addWidget(send_btn)
+        self.quarantine_label = QLabel("0 packets accepted, 0 quarantined")
+        bottom_layout.addWidget(self.quarantine_label)
         bottom_layout.addStretch()
         bottom_layout.addWidget(QLabel("Log level:"))
         bottom_layout.addWidget(log_level)
@@ -180,6 +180,47 @@ class CanSatGroundControl(QMainWindow):
         
         self.setCentralWidget(central_widget)
 
+    def finish_startup(self):
+        """Heavy setup deferred until after the first paint."""
+        self.build_graphs()
+        from validation import PacketValidator
+        self.validator = PacketValidator(PACKET_FIELDS, TEXT_FIELDS)  # Malformed lines go to the quarantine log, not the graphs
+        startup.mark("plots ready")
+        self.connect_to_serial()
+        startup.mark("serial ready")
+        startup.report()
+
+    def build_graphs(self):
+        import pyqtgraph as pg
+        graphs_layout = self.graphs_layout
+        
+        # Create graphs with titles
+        graphs = [
+            ("Pressure", "Pa"),
+            ("Altitude", "m"),
+            ("Tilt X", "deg"),
+            ("Temperature", "°C"),
+            ("Air speed", "m/s"),
+            ("Tilt Y", "deg")
+        ]
+        
+        for i, (title, unit) in enumerate(graphs):
+            plot = pg.PlotWidget(title=f"{title} ({unit}) vs Time")  # Add title here
+            plot.setBackground('w')
+            plot.showGrid(x=True, y=True)
+            plot.setLabel('left', f'{title} ({unit})')
+            plot.setLabel('bottom', 'Time (s)')  # Changed from 'Packet' to 'Time (s)'
+            
+            # Customize title style
+            plot.setTitle(f"{title} ({unit})", size="12pt")
+            
+            # Store plot reference
+            setattr(self, f'{title.lower().replace(" ", "_")}_plot', plot)
+            setattr(self, f'{title.lower().replace(" ", "_")}_curve', 
+                   plot.plot(pen=pg.mkPen(color='b', width=2)))
+            
+            graphs_layout.addWidget(plot, i//3, i%3)
+
     def update_data(self):
         # Update mission time
         current_time = datetime.now().strftime("%H:%M:%S")
@@ -190,35 +231,39 @@ class CanSatGroundControl(QMainWindow):
             try:
                 line = self.serial_connection.readline().decode('utf-8').strip()
                 if line:
-                    data = line.split(',')  # Assuming data is comma-separated
-                    self.serial_data_buffer.append(data)
-                    self.update_graphs(data)
+                    packets = self.validator.validate([line])
+                    if len(packets["TEAM_ID"]):
+                        data = [packets[field][0] for field in PLOTTED_FIELDS]
+                        self.serial_data_buffer.append(data)
+                        self.update_graphs(data)
+                    self.update_quarantine_label()
             except Exception as e:
                 print(f"Error reading serial data: {e}")
 
+    def update_quarantine_label(self):
+        self.quarantine_label.setText(self.validator.summary())
+        self.quarantine_label.setToolTip(self.validator.details())
+
     def update_graphs(self, data):
-        # Map data to graphs dynamically
-        try:
-            for i, (title, _) in enumerate([
-                ("Pressure", "Pa"),
-                ("Altitude", "m"),
-                ("Tilt X", "deg"),
-                ("Temperature", "°C"),
-                ("Air speed", "m/s"),
-                ("Tilt Y", "deg")
-            ]):
-                plot_name = f'{title.lower().replace(" ", "_")}_curve'
-                if hasattr(self, plot_name):
-                    curve = getattr(self, plot_name)
-                    y_data = [float(row[i]) for row in self.serial_data_buffer if len(row) > i]
-                    x_data = range(len(y_data))
-                    curve.setData(x_data, y_data)
-        except Exception as e:
-            print(f"Error updating graphs: {e}")
+        # Map data to graphs dynamically; the buffer only holds validated rows
+        for i, (title, _) in enumerate([
+            ("Pressure", "Pa"),
+            ("Altitude", "m"),
+            ("Tilt X", "deg"),
+            ("Temperature", "°C"),
+            ("Air speed", "m/s"),
+            ("Tilt Y", "deg")
+        ]):
+            plot_name = f'{title.lower().replace(" ", "_")}_curve'
+            if hasattr(self, plot_name):
+                curve = getattr(self, plot_name)
+                y_data = [row[i] for row in self.serial_data_buffer]
+                x_data = range(len(y_data))
+                curve.setData(x_data, y_data)
 
     def refresh(self):
         # Clear buffer and reset graphs
-        self.serial_data_buffer = []
+        self.serial_data_buffer.clear()
         for title, _ in [
             ("Pressure", "Pa"),
             ("Altitude", "m"),
@@ -244,5 +289,7 @@ if __name__ == '__main__':
     app.setStyle('Fusion')
     
     main_window = CanSatGroundControl()
+    startup.mark("window built")
+    startup.watch_first_paint(main_window, main_window.finish_startup)
     main_window.show()
     sys.exit(app.exec_())